@@ -0,0 +1,6 @@
+"""# benchmarks
+
+Performance benchmark suite for GEL.
+
+Run locally with `python -m benchmarks`; see `python -m benchmarks --help` for options.
+"""
@@ -0,0 +1,114 @@
+"""# benchmarks.main
+
+Benchmark suite runner.
+
+## Usage:
+    python -m benchmarks [--quick] [--output results.json] [--compare previous.json]
+"""
+
+from argparse           import ArgumentParser, Namespace
+from json               import dump, load
+from platform           import platform, python_version
+from sys                import exit
+from typing             import Any, Dict, List
+
+from benchmarks         import concurrency, divergence, imports, registry, startup
+from benchmarks.harness import Case, compare, run
+
+def main() -> int:
+    """# Run Benchmarks.
+
+    ## Returns:
+        * int:  Exit code (1 if regressions were detected, 0 otherwise).
+    """
+    # Define arguments.
+    parser:     ArgumentParser =    ArgumentParser(
+                                        prog =          "benchmarks",
+                                        description =   """GEL performance benchmarks."""
+                                    )
+
+    parser.add_argument(
+        "--quick",
+        action =    "store_true",
+        help =      """Skip the largest sizes."""
+    )
+
+    parser.add_argument(
+        "--filter",
+        type =      str,
+        default =   "",
+        help =      """Only run cases whose name contains this string."""
+    )
+
+    parser.add_argument(
+        "--repeat",
+        type =      int,
+        default =   5,
+        help =      """Timing repetitions per case. Defaults to 5."""
+    )
+
+    parser.add_argument(
+        "--output",
+        type =      str,
+        default =   None,
+        help =      """Path at which JSON results will be written."""
+    )
+
+    parser.add_argument(
+        "--compare",
+        type =      str,
+        default =   None,
+        help =      """Path of previous JSON results against which regressions are detected."""
+    )
+
+    parser.add_argument(
+        "--threshold",
+        type =      float,
+        default =   1.10,
+        help =      """Slowdown ratio considered a regression. Defaults to 1.10."""
+    )
+
+    # Parse arguments.
+    arguments:  Namespace =             parser.parse_args()
+
+    # Collect cases.
+    cases:      List[Case] =            [
+                                            case
+                                            for suite in (
+                                                concurrency, divergence, imports, registry, startup
+                                            )
+                                            for case in suite.cases(quick = arguments.quick)
+                                            if arguments.filter in case.name
+                                        ]
+
+    # Run cases.
+    records:    List[Dict[str, Any]] =  run(cases = cases, repeat = arguments.repeat)
+
+    # Write results if requested.
+    if arguments.output is not None:
+
+        with open(arguments.output, "w") as f:
+
+            dump({
+                "environment":  {"platform": platform(), "python": python_version()},
+                "results":      records
+            }, f, indent = 2)
+
+    # If no comparison is requested, exit.
+    if arguments.compare is None: return 0
+
+    # Load previous results.
+    with open(arguments.compare) as f: previous: List[Dict[str, Any]] = load(f)["results"]
+
+    # Detect regressions.
+    regressions:    List[Dict[str, Any]] =  compare(records, previous, arguments.threshold)
+
+    # Report regressions.
+    for record in regressions:
+        print(f"REGRESSION {record['name']}: x{record['slowdown']:.2f} slower")
+
+    # Exit with failure if any regression was detected.
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__": exit(main())
@@ -0,0 +1,280 @@
+"""# benchmarks.concurrency
+
+Registry stress cases under many threads. Each case checks the registry's invariants after every
+run, raising if any of them is violated:
+    * Loading: concurrent first accesses load the registry exactly once.
+    * Registration: concurrent registrations (including of one contested ID) neither lose entries
+      nor register any twice.
+    * Mixed: lock-free readers (lookups, listings, & iteration) never fail nor observe partially
+      registered entries while writers register.
+
+Threads are switched as often as the interpreter allows while cases run, to provoke interleaving.
+"""
+
+__all__ = ["cases"]
+
+from sys                    import getswitchinterval, setswitchinterval
+from threading              import Barrier, Thread
+from time                   import sleep
+from typing                 import Any, Callable, List, Tuple
+
+from benchmarks.harness     import Case
+from gel.registration.core  import DuplicateEntryError, Entry, Registry
+
+# Numbers of threads benchmarked.
+THREADS:    Tuple[int, ...] =   (8, 64)
+
+# Entries registered by each writing thread.
+ENTRIES:    int =               50
+
+
+def cases(
+    quick:  bool =  False
+) -> List[Case]:
+    """# Enumerate Concurrency Stress Cases.
+
+    ## Args:
+        * quick (bool): Restrict to 8 threads (for fast local runs). Defaults to False.
+
+    ## Returns:
+        * List[Case]:   Per number of threads, loading, registration, & mixed read/write cases.
+    """
+    # Initialize cases.
+    cases:  List[Case] =    []
+
+    # For each number of threads...
+    for threads in THREADS:
+
+        # Skip large numbers of threads in quick mode.
+        if quick and threads > 8: continue
+
+        # Register cases.
+        for name, scenario, elements in (
+            ("load",        _load_,     threads),
+            ("register",    _register_, threads * ENTRIES),
+            ("mixed",       _mixed_,    threads * ENTRIES),
+        ):
+            cases.append(Case(
+                name =      f"concurrency/{name}/threads={threads}",
+                setup =     _stress_(scenario, threads),
+                elements =  elements,
+                params =    {"threads": threads, "entries": ENTRIES}
+            ))
+
+    # Provide cases.
+    return cases
+
+
+# HELPERS ==========================================================================================
+
+class _Registry_(Registry):
+    """# Synthetic Registry (counting its loads)."""
+
+    def __init__(self):
+        """# Instantiate Synthetic Registry."""
+        super(_Registry_, self).__init__(id = "stress")
+        self.loads: int =   0
+
+    def _create_entry_(self, **kwargs) -> Entry:
+        """# Create Plain Entry."""
+        return Entry(**kwargs)
+
+    def _load_(self, workers: int = 1) -> None:
+        """# Load Single Entry (slowly, so that concurrent accesses overlap)."""
+        self.loads += 1
+        sleep(0.01)
+        self.register(id = "loaded", tags = ["loaded"])
+
+
+def _check_(
+    condition:  bool,
+    message:    str
+) -> None:
+    """# Check Invariant.
+
+    ## Args:
+        * condition (bool): Invariant.
+        * message   (str):  Description of violation.
+
+    ## Raises:
+        * AssertionError:   If invariant is violated.
+    """
+    if not condition: raise AssertionError(message)
+
+
+def _load_(
+    registry:   _Registry_,
+    threads:    int
+) -> Tuple[Callable[[int], Any], Callable[[], None]]:
+    """# Loading Scenario.
+
+    ## Args:
+        * registry  (_Registry_):   Fresh registry.
+        * threads   (int):          Number of threads.
+
+    ## Returns:
+        * Tuple[Callable, Callable]:    Worker (given its thread's index) & final check.
+    """
+    def worker(index: int) -> Any:
+        """# Access Registry (loading it on first access)."""
+        _check_(registry.get_entry("loaded").id == "loaded", "Loaded entry not found")
+
+    def check() -> None:
+        """# Check that Registry was Loaded Once."""
+        _check_(registry.loads == 1, f"Registry loaded {registry.loads} times")
+
+    # Provide scenario.
+    return worker, check
+
+
+def _mixed_(
+    registry:   _Registry_,
+    threads:    int
+) -> Tuple[Callable[[int], Any], Callable[[], None]]:
+    """# Mixed Read/Write Scenario.
+
+    ## Args:
+        * registry  (_Registry_):   Fresh (loaded) registry.
+        * threads   (int):          Number of threads (even ones write, odd ones read).
+
+    ## Returns:
+        * Tuple[Callable, Callable]:    Worker (given its thread's index) & final check.
+    """
+    # Load registry beforehand.
+    registry.load_all()
+
+    def worker(index: int) -> Any:
+        """# Register (Even Threads), or Read Concurrently (Odd Threads)."""
+        # Writers register entries, tagged by parity.
+        if index % 2 == 0:
+            for entry in range(ENTRIES):
+                registry.register(
+                    id =    f"entry-{index:03d}-{entry:04d}",
+                    tags =  ["written", "even" if entry % 2 == 0 else "odd"]
+                )
+            return
+
+        # Readers list, look up, & iterate entries while they are registered.
+        for _ in range(ENTRIES):
+
+            # Listings hold registered entries only, in order of registration.
+            listing:    List[str] = registry.list(filter_by = ["written"], none_of = ["odd"])
+            _check_(all(id in registry for id in listing), "Listed entry not registered")
+            _check_(
+                listing == sorted(listing, key = registry._positions_.__getitem__),
+                "Listing out of registration order"
+            )
+
+            # Iterated entries bear the tags of their listing.
+            for id, entry in registry.entries.items():
+                _check_(id == "loaded" or "written" in entry.tags, f"{id} misses its tags")
+
+    def check() -> None:
+        """# Check that Every Written Entry was Registered."""
+        written:    int =   len(range(0, threads, 2)) * ENTRIES
+        _check_(len(registry.list(filter_by = ["written"])) == written, "Written entries lost")
+
+    # Provide scenario.
+    return worker, check
+
+
+def _register_(
+    registry:   _Registry_,
+    threads:    int
+) -> Tuple[Callable[[int], Any], Callable[[], None]]:
+    """# Registration Scenario.
+
+    ## Args:
+        * registry  (_Registry_):   Fresh (loaded) registry.
+        * threads   (int):          Number of threads.
+
+    ## Returns:
+        * Tuple[Callable, Callable]:    Worker (given its thread's index) & final check.
+    """
+    # Load registry beforehand.
+    registry.load_all()
+
+    # Record threads which registered contested ID.
+    winners:    List[int] = []
+
+    def worker(index: int) -> Any:
+        """# Register Unique Entries & Contest a Shared One."""
+        # Register entries unique to thread.
+        for entry in range(ENTRIES):
+            registry.register(id = f"entry-{index:03d}-{entry:04d}", tags = [f"thread-{index}"])
+
+        # Contest shared ID (which only one thread may register).
+        try:                            registry.register(id = "contested", tags = ["contested"])
+        except DuplicateEntryError:     return
+        winners.append(index)
+
+    def check() -> None:
+        """# Check that No Entry was Lost or Registered Twice."""
+        _check_(len(winners) == 1, f"Contested entry registered {len(winners)} times")
+        _check_(len(registry) == threads * ENTRIES + 2, f"{len(registry)} entries registered")
+        _check_(
+            sorted(registry._positions_.values()) == list(range(len(registry))),
+            "Registration order inconsistent"
+        )
+        for index in range(threads):
+            _check_(
+                len(registry.list(filter_by = [f"thread-{index}"])) == ENTRIES,
+                f"Entries of thread {index} lost"
+            )
+
+    # Provide scenario.
+    return worker, check
+
+
+def _stress_(
+    scenario:   Callable[[_Registry_, int], Tuple[Callable[[int], Any], Callable[[], None]]],
+    threads:    int
+) -> Callable[[], Callable[[], Any]]:
+    """# Stress Case Factory.
+
+    ## Args:
+        * scenario  (Callable): Builds a scenario's worker & check, given a fresh registry.
+        * threads   (int):      Number of threads running worker concurrently.
+
+    ## Returns:
+        * Callable: Setup function returning the timed callable.
+    """
+    def setup() -> Callable[[], Any]:
+        """# Define Stress Run."""
+
+        def stress() -> None:
+            """# Run Scenario on Fresh Registry, then Check its Invariants."""
+            # Build scenario.
+            worker, check =                     scenario(_Registry_(), threads)
+
+            # Initialize barrier (releasing every thread at once) & failures of threads.
+            barrier:    Barrier =               Barrier(threads)
+            failures:   List[BaseException] =   []
+
+            def run(index: int) -> None:
+                """# Run Worker once Every Thread is Ready (recording failures)."""
+                barrier.wait()
+                try:                            worker(index)
+                except BaseException as e:      failures.append(e)
+
+            # Run threads, switching between them as often as possible.
+            interval:   float =                 getswitchinterval()
+            setswitchinterval(1e-6)
+            try:
+                pool:   List[Thread] =          [
+                                                    Thread(target = run, args = (index,))
+                                                    for index in range(threads)
+                                                ]
+                for thread in pool: thread.start()
+                for thread in pool: thread.join()
+            finally: setswitchinterval(interval)
+
+            # Report first failure, then check invariants.
+            if failures: raise failures[0]
+            check()
+
+        # Provide timed callable.
+        return stress
+
+    # Expose setup.
+    return setup
@@ -0,0 +1,145 @@
+"""# benchmarks.divergence
+
+Throughput benchmarks of `gel.statistics.D_KL` against a plain SciPy baseline.
+"""
+
+__all__ = ["cases"]
+
+from typing         import Any, Callable, List, Tuple
+
+from numpy          import float32, float64
+from numpy.random   import default_rng
+
+from benchmarks.harness import Case
+
+# Vocabulary sizes benchmarked (K = 10 ... 10^7).
+SIZES:      Tuple[int, ...] =   (10, 1_000, 100_000, 10_000_000)
+
+# Batch sizes benchmarked (capped so that batch x size stays within 10^7 elements).
+BATCHES:    Tuple[int, ...] =   (1, 1_000)
+
+# Element types benchmarked.
+DTYPES:     Tuple[type, ...] =  (float32, float64)
+
+# Density of sparse cases.
+DENSITY:    float =             1e-3
+
+
+def cases(
+    quick:  bool =  False
+) -> List[Case]:
+    """# Enumerate D_KL Benchmark Cases.
+
+    ## Args:
+        * quick (bool): Restrict to sizes up to 10^5 (for fast local runs). Defaults to False.
+
+    ## Returns:
+        * List[Case]:   Dense (batched & single) & sparse cases, per size & dtype.
+    """
+    # Initialize cases.
+    cases:  List[Case] =    []
+
+    # For each combination of size, batch, & dtype...
+    for size in SIZES:
+
+        # Skip large sizes in quick mode.
+        if quick and size > 100_000: continue
+
+        for batch in BATCHES:
+
+            # Skip combinations exceeding 10^7 elements.
+            if batch * size > 10_000_000: continue
+
+            for dtype in DTYPES:
+
+                # Register dense case.
+                cases.append(Case(
+                    name =      f"D_KL/dense/K={size}/N={batch}/{dtype.__name__}",
+                    setup =     _dense_(size, batch, dtype, baseline = False),
+                    baseline =  _dense_(size, batch, dtype, baseline = True),
+                    elements =  batch * size,
+                    params =    {"K": size, "N": batch, "dtype": dtype.__name__, "layout": "dense"}
+                ))
+
+        # Register sparse case (single distribution pair, sparse inputs only pay off when large).
+        if size >= 100_000: cases.append(Case(
+                                name =      f"D_KL/sparse/K={size}/N=1/float64",
+                                setup =     _sparse_(size),
+                                elements =  size,
+                                params =    {
+                                                "K":        size,
+                                                "N":        1,
+                                                "dtype":    "float64",
+                                                "layout":   "sparse",
+                                                "density":  DENSITY
+                                            }
+                            ))
+
+    # Provide cases.
+    return cases
+
+
+# HELPERS ==========================================================================================
+
+def _dense_(
+    size:       int,
+    batch:      int,
+    dtype:      type,
+    baseline:   bool
+) -> Callable[[], Callable[[], Any]]:
+    """# Dense Case Factory.
+
+    ## Args:
+        * size      (int):  Vocabulary size (K).
+        * batch     (int):  Number of distributions (N).
+        * dtype     (type): Element type (of inputs, & of D_KL's element-wise work).
+        * baseline  (bool): Time plain SciPy `rel_entr(P, Q).sum(axis = -1)` instead of D_KL.
+
+    ## Returns:
+        * Callable: Setup function returning the timed callable.
+    """
+    def setup() -> Callable[[], Any]:
+        """# Build Dense Inputs."""
+        from gel.statistics import D_KL
+        from scipy.special  import rel_entr
+
+        # Draw normalized distributions.
+        shape:  Tuple[int, ...] =   (size,) if batch == 1 else (batch, size)
+        P =                         default_rng(0).random(shape).astype(dtype)
+        Q =                         default_rng(1).random(shape).astype(dtype)
+        P /=                        P.sum(axis = -1, keepdims = True)
+        Q /=                        Q.sum(axis = -1, keepdims = True)
+
+        # Provide timed callable (working in the inputs' precision, accumulating in float64).
+        if baseline: return lambda: rel_entr(P, Q).sum(axis = -1)
+        return lambda: D_KL(P, Q, dtype = dtype)
+
+    # Expose setup.
+    return setup
+
+
+def _sparse_(
+    size:   int
+) -> Callable[[], Callable[[], Any]]:
+    """# Sparse Case Factory.
+
+    ## Args:
+        * size  (int):  Vocabulary size (K).
+
+    ## Returns:
+        * Callable: Setup function returning the timed callable.
+    """
+    def setup() -> Callable[[], Any]:
+        """# Build Sparse Inputs."""
+        from gel.statistics import D_KL
+        from scipy.sparse   import random_array
+
+        # Draw sparse distributions (Q's support covers P's, keeping the divergence finite).
+        P = random_array((1, size), density = DENSITY, format = "csr", rng = default_rng(0))
+        Q = (P + random_array((1, size), density = DENSITY, format = "csr", rng = default_rng(1)))
+
+        # Provide timed callable.
+        return lambda: D_KL(P, Q, normalize = True)
+
+    # Expose setup.
+    return setup
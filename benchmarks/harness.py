@@ -0,0 +1,189 @@
+"""# benchmarks.harness
+
+Minimal benchmark harness: timing, result records, & regression comparison.
+"""
+
+__all__ =   [
+                "Case",
+                "compare",
+                "run",
+            ]
+
+from statistics     import median
+from timeit         import Timer
+from tracemalloc    import get_traced_memory, start, stop
+from typing         import Any, Callable, Dict, List, Optional
+
+class Case:
+    """# Benchmark Case."""
+
+    def __init__(self,
+        name:       str,
+        setup:      Callable[[], Callable[[], Any]],
+        elements:   int,
+        baseline:   Optional[Callable[[], Callable[[], Any]]] = None,
+        params:     Optional[Dict[str, Any]] =                  None,
+        memory:     bool =                                      False
+    ):
+        """# Define Benchmark Case.
+
+        ## Args:
+            * name      (str):              Unique case identifier (stable across runs).
+            * setup     (Callable):         Builds inputs & returns the callable being timed.
+            * elements  (int):              Number of elements processed per call (throughput).
+            * baseline  (Callable | None):  Builds inputs & returns a reference implementation.
+            * params    (Dict | None):      Case parameters, recorded alongside results.
+            * memory    (bool):             Also measure memory retained by what a single call
+                                            returns (per element). Defaults to False.
+        """
+        self.name:      str =                           name
+        self.setup:     Callable[[], Callable[[], Any]] = setup
+        self.elements:  int =                           elements
+        self.baseline:  Optional[Callable] =            baseline
+        self.params:    Dict[str, Any] =                params or {}
+        self.memory:    bool =                          memory
+
+
+def compare(
+    current:    List[Dict[str, Any]],
+    previous:   List[Dict[str, Any]],
+    threshold:  float =                 1.10
+) -> List[Dict[str, Any]]:
+    """# Compare Results.
+
+    ## Args:
+        * current   (List[Dict]):   Records of the current run.
+        * previous  (List[Dict]):   Records of a previous run.
+        * threshold (float):        Slowdown ratio (current / previous) above which a case is
+                                    considered a regression. Defaults to 1.10.
+
+    ## Returns:
+        * List[Dict]:   Records of regressed cases, annotated with their slowdown ratio.
+    """
+    # Index previous records by case name.
+    index:  Dict[str, Dict[str, Any]] = {record["name"]: record for record in previous}
+
+    # Report cases whose median time grew beyond the threshold.
+    return  [
+                {**record, "slowdown": record["median"] / index[record["name"]]["median"]}
+                for record in current
+                if  record["name"] in index
+                and record["median"] / index[record["name"]]["median"] > threshold
+            ]
+
+
+def run(
+    cases:      List[Case],
+    repeat:     int =       5,
+    log:        Callable =  print
+) -> List[Dict[str, Any]]:
+    """# Run Benchmark Cases.
+
+    ## Args:
+        * cases     (List[Case]):   Cases being run.
+        * repeat    (int):          Timing repetitions per case (median is reported). Defaults to 5.
+        * log       (Callable):     Progress reporter. Defaults to print.
+
+    ## Returns:
+        * List[Dict]:   One machine-readable record per case.
+    """
+    # Initialize records.
+    records:    List[Dict[str, Any]] =  []
+
+    # For each case...
+    for case in cases:
+
+        # Build case & baseline (if one is defined).
+        function:           Callable[[], Any] =     case.setup()
+        reference:          Optional[Callable] =    case.baseline() if case.baseline else None
+
+        # Measure retained memory if requested (before timing, so that nothing is cached yet).
+        memory:             Optional[int] =         _retained_(function) if case.memory else None
+        baseline_memory:    Optional[int] =         (
+                                                        _retained_(reference)
+                                                        if case.memory and reference else None
+                                                    )
+
+        # Time case.
+        seconds:            float =                 _time_(function, repeat)
+
+        # Time baseline, if one is defined.
+        baseline:           Optional[float] =       _time_(reference, repeat) if reference else None
+
+        # Record results.
+        records.append({
+            "name":         case.name,
+            "params":       case.params,
+            "median":       seconds,
+            "throughput":   case.elements / seconds,
+            "baseline":     baseline,
+            "speedup":      baseline / seconds if baseline else None,
+            "memory":           memory,
+            "baseline_memory":  baseline_memory,
+        })
+
+        # Report progress.
+        log(
+            f"{case.name:<60} {seconds * 1e3:>10.3f} ms"
+            + (f"   x{baseline / seconds:>6.2f} vs baseline" if baseline else "")
+            + (f"   {memory / case.elements:>8.0f} B/element" if memory is not None else "")
+            + (
+                f" (baseline {baseline_memory / case.elements:.0f})"
+                if baseline_memory is not None else ""
+            )
+        )
+
+    # Provide records.
+    return records
+
+
+# HELPERS ==========================================================================================
+
+def _retained_(
+    function:   Callable[[], Any]
+) -> int:
+    """# Measure Retained Memory.
+
+    ## Args:
+        * function  (Callable): Callable whose result is measured.
+
+    ## Returns:
+        * int:  Bytes allocated by a single call & still held while its result is alive.
+    """
+    # Trace allocations.
+    start()
+    try:
+        # Call function, measuring traced memory while its result is held.
+        before: int =   get_traced_memory()[0]
+        result: Any =   function()
+        after:  int =   get_traced_memory()[0]
+
+        # Release result only once measured.
+        del result
+
+    # Stop tracing.
+    finally: stop()
+
+    # Provide retained bytes.
+    return after - before
+
+
+def _time_(
+    function:   Callable[[], Any],
+    repeat:     int
+) -> float:
+    """# Time Callable.
+
+    ## Args:
+        * function  (Callable): Callable being timed.
+        * repeat    (int):      Timing repetitions.
+
+    ## Returns:
+        * float:    Median seconds per call.
+    """
+    # Calibrate number of calls per repetition (~0.2 seconds each).
+    timer:      Timer = Timer(function)
+    number, _ =         timer.autorange()
+
+    # Provide median seconds per call.
+    return median(timer.repeat(repeat = repeat, number = number)) / number
@@ -0,0 +1,89 @@
+"""# benchmarks.imports
+
+Import-time benchmarks, each measured in a fresh interpreter (so that nothing is already cached in
+`sys.modules`). Package imports are compared against eagerly importing every submodule.
+"""
+
+__all__ = ["cases"]
+
+from subprocess         import run
+from sys                import executable
+from typing             import Any, Callable, List, Tuple
+
+from benchmarks.harness import Case
+
+# Statements timed (name, statement, compare against eager baseline).
+STATEMENTS: Tuple[Tuple[str, str, bool], ...] = (
+                                                    ("python",              "pass",         False),
+                                                    ("gel",                 "import gel",   False),
+                                                    (
+                                                        "gel.registration",
+                                                        "import gel.registration",
+                                                        False
+                                                    ),
+                                                    (
+                                                        "gel.statistics",
+                                                        "import gel.statistics",
+                                                        True
+                                                    ),
+                                                    (
+                                                        "gel.statistics:D_KL",
+                                                        "from gel.statistics import D_KL",
+                                                        True
+                                                    ),
+                                                )
+
+# Submodules imported by the eager baseline (as the package did before importing lazily).
+SUBMODULES: Tuple[str, ...] =   (
+                                    "binning", "cache", "continuous", "divergence", "drift",
+                                    "exceptions", "pairwise", "resampling", "sparse", "streaming",
+                                    "validation",
+                                )
+
+
+def cases(
+    quick:  bool =  False
+) -> List[Case]:
+    """# Enumerate Import-Time Benchmark Cases.
+
+    ## Args:
+        * quick (bool): Unused (import cases are always fast). Defaults to False.
+
+    ## Returns:
+        * List[Case]:   One case per statement, timing a fresh interpreter executing it.
+    """
+    # Define eager baseline statement.
+    eager:  str =   "; ".join(f"import gel.statistics.{module}" for module in SUBMODULES)
+
+    # Provide cases.
+    return  [
+                Case(
+                    name =      f"import/{name}",
+                    setup =     _interpreter_(statement),
+                    baseline =  _interpreter_(eager) if baseline else None,
+                    elements =  1,
+                    params =    {"statement": statement}
+                )
+                for name, statement, baseline in STATEMENTS
+            ]
+
+
+# HELPERS ==========================================================================================
+
+def _interpreter_(
+    statement:  str
+) -> Callable[[], Callable[[], Any]]:
+    """# Fresh Interpreter Case Factory.
+
+    ## Args:
+        * statement (str):  Python statement executed by the interpreter.
+
+    ## Returns:
+        * Callable: Setup function returning the timed callable.
+    """
+    def setup() -> Callable[[], Any]:
+        """# Build Interpreter Command."""
+        return lambda: run([executable, "-c", statement], check = True)
+
+    # Expose setup.
+    return setup
@@ -0,0 +1,299 @@
+"""# benchmarks.registry
+
+Registry benchmarks over synthetic, tagged registries:
+    * Tag-filtered listings (answered from the registry's tag index) are compared against scanning
+      the tags of every entry.
+    * Registration time & per-entry memory footprint of slotted entries (logging through their
+      registry's logger) are compared against dictionary-backed entries holding a logger each.
+    * Package walks importing packages through a pool of threads are compared against importing
+      them serially, over synthetic packages (laid out as commands are, one sub-package each) whose
+      modules each block (as I/O does) on import.
+"""
+
+__all__ = ["cases"]
+
+from logging                import Logger
+from pathlib                import Path
+from sys                    import modules as loaded_modules
+from tempfile               import TemporaryDirectory
+from typing                 import Any, Callable, List, Optional, Sequence, Tuple
+
+import gel
+
+from benchmarks.harness     import Case
+from gel.registration.core  import Entry, Registry
+from gel.utilities          import get_logger
+
+# Numbers of synthetic entries benchmarked.
+SIZES:      Tuple[int, ...] =                               (1_000, 10_000, 100_000)
+
+# Queries timed (name, all of, any of, none of).
+QUERIES:    Tuple[Tuple[str, List[str], List[str], List[str]], ...] =   (
+                ("and",     ["common", "half", "rare"], [],                 []),
+                ("or",      [],                         ["rare", "tenth"],  []),
+                ("not",     ["half"],                   [],                 ["tenth"]),
+            )
+
+# Numbers of synthetic modules walked, & time (in seconds) each blocks on import.
+MODULES:    Tuple[int, ...] =                               (16, 64)
+DELAY:      float =                                         0.005
+
+# Number of threads importing modules in parallel walks.
+WORKERS:    int =                                           16
+
+
+def cases(
+    quick:  bool =  False
+) -> List[Case]:
+    """# Enumerate Registry Benchmark Cases.
+
+    ## Args:
+        * quick (bool): Restrict to sizes up to 10^4 (for fast local runs). Defaults to False.
+
+    ## Returns:
+        * List[Case]:   Per size, a case measuring registration (time & memory per entry), & per
+                        query, cases timing `Registry.list` against a linear scan, then per number
+                        of modules, a case timing parallel walks against serial walks.
+    """
+    # Initialize cases.
+    cases:  List[Case] =    []
+
+    # For each number of modules...
+    for modules in MODULES:
+
+        # Register walk case.
+        cases.append(Case(
+            name =      f"registry/walk/modules={modules}",
+            setup =     _walk_(modules, workers = WORKERS),
+            baseline =  _walk_(modules, workers = 1),
+            elements =  modules,
+            params =    {"modules": modules, "delay": DELAY, "workers": WORKERS}
+        ))
+
+    # For each size & query...
+    for size in SIZES:
+
+        # Skip large sizes in quick mode.
+        if quick and size > 10_000: continue
+
+        # Register registration case.
+        cases.append(Case(
+            name =      f"registry/register/entries={size}",
+            setup =     _register_(size, baseline = False),
+            baseline =  _register_(size, baseline = True),
+            elements =  size,
+            params =    {"entries": size},
+            memory =    True
+        ))
+
+        for name, all_of, any_of, none_of in QUERIES:
+
+            # Register case.
+            cases.append(Case(
+                name =      f"registry/list/{name}/entries={size}",
+                setup =     _list_(size, all_of, any_of, none_of, baseline = False),
+                baseline =  _list_(size, all_of, any_of, none_of, baseline = True),
+                elements =  size,
+                params =    {"entries": size, "all": all_of, "any": any_of, "none": none_of}
+            ))
+
+    # Provide cases.
+    return cases
+
+
+# HELPERS ==========================================================================================
+
+class _LegacyEntry_:
+    """# Dictionary-Backed Entry (holding a logger of its own, as entries once did)."""
+
+    def __init__(self,
+        id:     str,
+        config: Any =               None,
+        tags:   Sequence[str] =     (),
+        logger: Optional[Logger] =  None
+    ):
+        """# Instantiate Legacy Entry (ignoring registry's logger)."""
+        self.__logger__:    Logger =    get_logger(f"{id}-registration-entry")
+        self._id_:          str =       id
+        self._tags_:        List[str] = list(tags)
+        self._config_:      Any =       config
+
+    @property
+    def id(self) -> str:
+        """# Entry ID"""
+        return self._id_
+
+    @property
+    def tags(self) -> List[str]:
+        """# Entry Taxonomy Tags"""
+        return self._tags_
+
+
+class _Registry_(Registry):
+    """# Synthetic Registry (holding plain, or legacy, entries)."""
+
+    def __init__(self,
+        legacy: bool =  False,
+        id:     str =   "benchmark"
+    ):
+        """# Instantiate Synthetic Registry.
+
+        ## Args:
+            * legacy    (bool): Hold legacy entries. Defaults to False.
+            * id        (str):  Registry ID (naming the package it walks). Defaults to "benchmark".
+        """
+        super(_Registry_, self).__init__(id = id)
+        self._legacy_:  bool =  legacy
+
+    def _create_entry_(self, **kwargs) -> Entry:
+        """# Create Plain (or Legacy) Entry."""
+        return _LegacyEntry_(**kwargs) if self._legacy_ else Entry(**kwargs)
+
+
+class _WalkRegistry_(_Registry_):
+    """# Synthetic Registry (always walking its package)."""
+
+    def _cache_manifest_(self) -> None:
+        """# Cache Nothing."""
+
+    def _load_manifest_(self) -> bool:
+        """# Load No Manifest."""
+        return False
+
+
+def _build_(
+    size:   int,
+    prefix: str =   "entry",
+    legacy: bool =  False
+) -> _Registry_:
+    """# Build Synthetic Registry.
+
+    Every entry is tagged "common", every other "half", every tenth "tenth", & every hundredth
+    "rare".
+
+    ## Args:
+        * size      (int):  Number of synthetic entries.
+        * prefix    (str):  Prefix of entry IDs. Defaults to "entry".
+        * legacy    (bool): Hold legacy entries. Defaults to False.
+
+    ## Returns:
+        * _Registry_:   Loaded registry.
+    """
+    # Register entries.
+    registry:   _Registry_ =    _Registry_(legacy = legacy)
+    for index in range(size):
+        registry.register(id = f"{prefix}-{index:06d}", tags = [
+            tag
+            for tag, period in (("common", 1), ("half", 2), ("tenth", 10), ("rare", 100))
+            if index % period == 0
+        ])
+
+    # Mark registry as loaded (it has no package to walk).
+    registry._loaded_ = True
+
+    # Provide registry.
+    return registry
+
+
+def _list_(
+    size:       int,
+    all_of:     List[str],
+    any_of:     List[str],
+    none_of:    List[str],
+    baseline:   bool
+) -> Callable[[], Callable[[], Any]]:
+    """# Listing Case Factory.
+
+    ## Args:
+        * size      (int):          Number of synthetic entries.
+        * all_of    (List[str]):    Tags which listed entries must all bear.
+        * any_of    (List[str]):    Tags of which listed entries must bear at least one.
+        * none_of   (List[str]):    Tags which listed entries must not bear.
+        * baseline  (bool):         Scan every entry's tags, rather than querying the tag index.
+
+    ## Returns:
+        * Callable: Setup function returning the timed callable.
+    """
+    def setup() -> Callable[[], Any]:
+        """# Build Synthetic Registry."""
+        registry:   _Registry_ =    _build_(size)
+
+        # Query tag index.
+        if not baseline: return lambda: registry.list(all_of, any_of, none_of)
+
+        # Otherwise, scan every entry.
+        return  lambda: [
+                            id
+                            for id, entry in registry.entries.items()
+                            if  all(tag in entry.tags for tag in all_of)
+                            and (not any_of or any(tag in entry.tags for tag in any_of))
+                            and not any(tag in entry.tags for tag in none_of)
+                        ]
+
+    # Expose setup.
+    return setup
+
+
+def _register_(
+    size:       int,
+    baseline:   bool
+) -> Callable[[], Callable[[], Any]]:
+    """# Registration Case Factory.
+
+    ## Args:
+        * size      (int):  Number of synthetic entries.
+        * baseline  (bool): Register legacy entries, rather than slotted entries.
+
+    ## Returns:
+        * Callable: Setup function returning the timed callable.
+    """
+    def setup() -> Callable[[], Any]:
+        """# Define Registration (of IDs unique to case, so that no logger is cached yet)."""
+        prefix: str =   f"{'legacy' if baseline else 'entry'}-{size}"
+        return lambda: _build_(size, prefix = prefix, legacy = baseline)
+
+    # Expose setup.
+    return setup
+
+
+def _walk_(
+    modules:    int,
+    workers:    int
+) -> Callable[[], Callable[[], Any]]:
+    """# Walk Case Factory.
+
+    ## Args:
+        * modules   (int):  Number of synthetic modules.
+        * workers   (int):  Number of threads importing modules.
+
+    ## Returns:
+        * Callable: Setup function returning the timed callable.
+    """
+    def setup() -> Callable[[], Any]:
+        """# Build Synthetic Package."""
+        # Write package of blocking modules (each in a sub-package of its own) into a temporary
+        # directory (removed with the case), grafted onto gel's search path.
+        directory:  TemporaryDirectory =    TemporaryDirectory(prefix = "gel-walk-")
+        package:    Path =                  Path(directory.name) / f"walk_{modules}_{workers}"
+        package.mkdir()
+        (package / "__init__.py").write_text("")
+        for index in range(modules):
+            (package / f"package_{index:03d}").mkdir()
+            (package / f"package_{index:03d}" / "__init__.py").write_text("")
+            (package / f"package_{index:03d}" / "module.py").write_text(
+                f"from time import sleep\nsleep({DELAY})\n"
+            )
+        gel.__path__.append(directory.name)
+
+        def walk() -> Any:
+            """# Walk Package from Scratch (forgetting modules imported by previous walks)."""
+            for name in [name for name in loaded_modules if name.startswith(f"gel.{package.name}")]:
+                del loaded_modules[name]
+            _WalkRegistry_(id = package.name).load_all(workers = workers)
+            return directory
+
+        # Provide timed callable (keeping directory alive for as long as it is timed).
+        return walk
+
+    # Expose setup.
+    return setup
@@ -0,0 +1,178 @@
+"""# benchmarks.startup
+
+CLI startup benchmarks over synthetic command trees, each measured in a fresh interpreter.
+
+Every synthetic command is a package under `gel.commands` (grafted onto its search path from a
+temporary directory) whose configuration defines a handful of typed arguments. Startup with a
+current cached manifest is compared against walking & importing every command module.
+
+Plugin cases instead install every synthetic command as its own distribution, advertising it
+through the "gel.commands" entry-point group.
+"""
+
+__all__ = ["cases"]
+
+from os                 import environ
+from pathlib            import Path
+from subprocess         import DEVNULL, run
+from sys                import executable
+from tempfile           import TemporaryDirectory
+from typing             import Any, Callable, Dict, List, Tuple
+
+from benchmarks.harness import Case
+
+# Numbers of synthetic commands benchmarked.
+SIZES:          Tuple[int, ...] =                   (10, 100, 500)
+
+# Command lines parsed (name, arguments).
+COMMAND_LINES:  Tuple[Tuple[str, List[str]], ...] = (
+                                                        ("command", ["bench-0000", "input.txt"]),
+                                                        ("help",    ["--help"]),
+                                                    )
+
+# Source of each synthetic command module.
+TEMPLATE:       str =                               '''
+from argparse           import ArgumentParser
+
+from gel.configuration  import CommandConfig
+from gel.registration   import register_command
+
+class Config(CommandConfig):
+
+    def __init__(self):
+        super(Config, self).__init__(name = "{name}", help = "Synthetic command {name}.")
+
+    def _define_arguments_(self, parser: ArgumentParser) -> None:
+        parser.add_argument("input", type = str, help = "Input path.")
+        parser.add_argument("--alpha", type = float, default = 0.5, help = "Alpha.")
+        parser.add_argument("--count", type = int, default = 10, help = "Count.")
+        parser.add_argument("--mode", choices = ["fast", "slow"], default = "fast", help = "Mode.")
+        parser.add_argument("--verbose", action = "store_true", help = "Verbosity.")
+
+@register_command(id = "{name}", config = Config)
+def entry_point(*args, **kwargs) -> None:
+    pass
+'''
+
+
+def cases(
+    quick:  bool =  False
+) -> List[Case]:
+    """# Enumerate Startup Benchmark Cases.
+
+    ## Args:
+        * quick (bool): Restrict to 100 commands (for fast local runs). Defaults to False.
+
+    ## Returns:
+        * List[Case]:   Per number of commands, cases timing `gel <command> <input>` & the help
+                        listing (`gel --help`), with a cached manifest against walking every
+                        command module, & with every command installed as a plugin.
+    """
+    # Initialize cases.
+    cases:  List[Case] =    []
+
+    # For each number of commands & command line...
+    for size in SIZES:
+
+        # Skip large sizes in quick mode.
+        if quick and size > 100: continue
+
+        for name, arguments in COMMAND_LINES:
+
+            # Register package case.
+            cases.append(Case(
+                name =      f"startup/{name}/commands={size}",
+                setup =     _startup_(size, arguments, cached = True),
+                baseline =  _startup_(size, arguments, cached = False),
+                elements =  size,
+                params =    {"commands": size, "arguments": arguments, "layout": "package"}
+            ))
+
+            # Register plugin case.
+            cases.append(Case(
+                name =      f"startup/plugin/{name}/commands={size}",
+                setup =     _startup_(size, arguments, cached = True, plugins = True),
+                elements =  size,
+                params =    {"commands": size, "arguments": arguments, "layout": "plugin"}
+            ))
+
+    # Provide cases.
+    return cases
+
+
+# HELPERS ==========================================================================================
+
+def _startup_(
+    size:       int,
+    arguments:  List[str],
+    cached:     bool,
+    plugins:    bool =      False
+) -> Callable[[], Callable[[], Any]]:
+    """# Startup Case Factory.
+
+    ## Args:
+        * size      (int):          Number of synthetic commands.
+        * arguments (List[str]):    Command line being parsed.
+        * cached    (bool):         Load commands from a cached manifest (warmed during setup),
+                                    rather than walking every command module (caching disabled).
+        * plugins   (bool):         Install commands as plugin distributions, rather than as
+                                    packages of `gel.commands`. Defaults to False.
+
+    ## Returns:
+        * Callable: Setup function returning the timed callable.
+    """
+    def setup() -> Callable[[], Any]:
+        """# Build Synthetic Command Tree."""
+        # Write synthetic commands into a temporary directory (removed with the case).
+        directory:  TemporaryDirectory =    TemporaryDirectory(prefix = "gel-startup-")
+        root:       Path =                  Path(directory.name) / "commands"
+        for index in range(size):
+
+            # Write command package.
+            package:    Path =  root / f"bench_{index:04d}"
+            package.mkdir(parents = True)
+            (package / "__init__.py").write_text("")
+            (package / "__main__.py").write_text(TEMPLATE.format(name = f"bench-{index:04d}"))
+
+            # Advertise plugins through the metadata of their own distribution.
+            if plugins:
+                metadata:   Path =  root / f"bench_{index:04d}-0.0.0.dist-info"
+                metadata.mkdir()
+                (metadata / "METADATA").write_text(
+                    f"Metadata-Version: 2.1\nName: bench-{index:04d}\nVersion: 0.0.0\n"
+                    f"Summary: Synthetic command bench-{index:04d}.\n"
+                )
+                (metadata / "entry_points.txt").write_text(
+                    f"[gel.commands]\nbench-{index:04d} = bench_{index:04d}.__main__:entry_point\n"
+                )
+
+        # Install plugins on the import path, or graft commands onto gel.commands, then parse a
+        # command line.
+        statement:  str =                   (
+                                                f"import sys; sys.path.insert(0, {str(root)!r}); "
+                                                if plugins else
+                                                "import gel.commands; "
+                                                f"gel.commands.__path__.append({str(root)!r}); "
+                                            ) + (
+                                                "from gel.__args__ import parse_gel_arguments; "
+                                                f"parse_gel_arguments({arguments!r})"
+                                            )
+
+        # Cache manifests within the case's directory (or disable caching for the baseline).
+        cache:      str =                   str(Path(directory.name) / "cache") if cached else ""
+        env:        Dict[str, str] =        {**environ, "GEL_CACHE_DIR": cache}
+
+        def parse() -> Any:
+            """# Parse Command Line in Fresh Interpreter (discarding help output)."""
+            return run(
+                [executable, "-c", statement], check = True, env = env, stdout = DEVNULL
+            ) and directory
+
+        # Warm cache.
+        if cached: parse()
+
+        # Provide timed callable (keeping directory alive for as long as it is timed).
+        return parse
+
+    # Expose setup.
+    return setup
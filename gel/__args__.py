@@ -5,16 +5,32 @@ Argument definitions & parsing for GEL application.
 
 __all__ = ["parse_gel_arguments"]
 
-from argparse           import _ArgumentGroup, ArgumentParser, Namespace, _SubParsersAction
+from argparse           import (
+                            Action, _ArgumentGroup, ArgumentParser, Namespace, _SubParsersAction
+                        )
+from sys                import argv
+from typing             import Iterator, List, Optional, Sequence
 
 from gel.registration   import COMMAND_REGISTRY
 
-def parse_gel_arguments() -> Namespace:
+def parse_gel_arguments(
+    args:   Optional[Sequence[str]] =   None
+) -> Namespace:
     """# Parse GEL Arguments.
 
+    Arguments are parsed in two phases: the command being executed is first located among the
+    arguments, so that only its parser is built. If no registered command is selected (e.g., when
+    listing help), every command is listed by name & description instead.
+
+    ## Args:
+        * args  (Sequence[str] | None): Arguments being parsed. Defaults to system arguments.
+
     ## Returns:
         * Namespace:    Mapping of arguments and their values.
     """
+    # Default to system arguments.
+    args:       Sequence[str] =     argv[1:] if args is None else args
+
     # Initialize parser.
     parser:     ArgumentParser =    ArgumentParser(
                                         prog =          "gel",
@@ -61,8 +77,60 @@ def parse_gel_arguments() -> Namespace:
     # | END ARGUMENTS                                                                              |
     # +============================================================================================+
 
-    # Register GEL commands.
-    COMMAND_REGISTRY.register_parsers(subparser = subparser, namespace = "gel")
+    # Locate command being executed.
+    command:    Optional[str] =     _peek_command_(parser = parser, args = args)
+
+    # If a GEL command is selected, only register its parser.
+    if command in COMMAND_REGISTRY and COMMAND_REGISTRY[command].namespace == "gel":
+        COMMAND_REGISTRY.register_parser(subparser = subparser, command_id = command)
+
+    # Otherwise, list GEL commands (for help & error messages).
+    else: COMMAND_REGISTRY.register_parsers(
+        subparser = subparser,
+        namespace = "gel",
+        arguments = False
+    )
 
     # Parse arguments.
-    return parser.parse_args()
\ No newline at end of file
+    return parser.parse_args(args = args)
+
+
+# HELPERS ==========================================================================================
+
+def _peek_command_(
+    parser: ArgumentParser,
+    args:   Sequence[str]
+) -> Optional[str]:
+    """# Locate Command Being Executed.
+
+    ## Args:
+        * parser    (ArgumentParser):   Top-level parser, whose options precede the command.
+        * args      (Sequence[str]):    Arguments being parsed.
+
+    ## Returns:
+        * str | None:   First positional argument (the command), if any.
+    """
+    # For each argument...
+    tokens: Iterator[str] = iter(args)
+    for token in tokens:
+
+        # The first positional argument is the command.
+        if not token.startswith("-"): return token
+
+        # Resolve option (which may be abbreviated to an unambiguous prefix).
+        options:    List[str] =         [
+                                            option for option in parser._option_string_actions
+                                            if option == token or option.startswith(token)
+                                        ]
+        action:     Optional[Action] =  (
+                                            parser._option_string_actions[token]
+                                            if token in options else
+                                            parser._option_string_actions[options[0]]
+                                            if len(options) == 1 else None
+                                        )
+
+        # Options expecting a value (not provided inline) consume the following argument.
+        if action is not None and action.nargs != 0: next(tokens, None)
+
+    # No command was provided.
+    return None
\ No newline at end of file
@@ -8,7 +8,12 @@ __all__ =   [   # Protocol
 
                 # Concrete
                 "CommandConfig",
+
+                # Specification
+                "describe_parser",
+                "rebuild_parser",
             ]
 
 from gel.configuration.command_config   import CommandConfig
-from gel.configuration.protocol         import Config
\ No newline at end of file
+from gel.configuration.protocol         import Config
+from gel.configuration.specification    import describe_parser, rebuild_parser
\ No newline at end of file
@@ -0,0 +1,287 @@
+"""# gel.configuration.specification
+
+Serializable argument parser specifications.
+
+A specification is a compact, JSON-compatible description of an `ArgumentParser` (its argument
+groups, arguments, & nested sub-parsers), from which an equivalent parser can be rebuilt without
+importing (or instantiating) the configuration which originally defined it.
+"""
+
+__all__ =   [
+                "describe_parser",
+                "rebuild_parser",
+            ]
+
+from argparse   import (
+                    _AppendAction, _AppendConstAction, ArgumentParser, _CountAction, _HelpAction,
+                    _StoreAction, _StoreConstAction, _StoreFalseAction, _StoreTrueAction,
+                    _SubParsersAction, _VersionAction, SUPPRESS
+                )
+from json       import dumps
+from typing     import Any, Dict, List, Optional
+
+# Action names of serializable action classes.
+_ACTIONS_:  Dict[type, str] =   {
+                                    _AppendAction:          "append",
+                                    _AppendConstAction:     "append_const",
+                                    _CountAction:           "count",
+                                    _StoreAction:           "store",
+                                    _StoreConstAction:      "store_const",
+                                    _StoreFalseAction:      "store_false",
+                                    _StoreTrueAction:       "store_true",
+                                    _VersionAction:         "version",
+                                }
+
+# Argument types which can be serialized by name.
+_TYPES_:    Dict[str, type] =   {
+                                    "float":    float,
+                                    "int":      int,
+                                    "str":      str,
+                                }
+
+# Keyword arguments accepted by each action (beyond dest, default, help, & required).
+_KEYWORDS_: Dict[str, List[str]] =  {
+                                        "append":       [
+                                                            "nargs", "const", "type", "choices",
+                                                            "metavar"
+                                                        ],
+                                        "append_const": ["const"],
+                                        "count":        [],
+                                        "store":        [
+                                                            "nargs", "const", "type", "choices",
+                                                            "metavar"
+                                                        ],
+                                        "store_const":  ["const"],
+                                        "store_false":  [],
+                                        "store_true":   [],
+                                        "version":      ["version"],
+                                    }
+
+
+def describe_parser(
+    parser: ArgumentParser
+) -> Optional[Dict[str, Any]]:
+    """# Describe Argument Parser.
+
+    ## Args:
+        * parser    (ArgumentParser):   Parser being described.
+
+    ## Returns:
+        * Dict[str, Any] | None:    JSON-compatible specification, or None if parser uses features
+                                    which cannot be serialized (custom actions or types, mutually
+                                    exclusive groups, or non-JSON defaults).
+    """
+    # Mutually exclusive groups are not serialized.
+    if parser._mutually_exclusive_groups: return None
+
+    # Initialize specification.
+    specification:  Dict[str, Any] =    {
+                                            "description":  parser.description,
+                                            "defaults":     dict(parser._defaults),
+                                            "groups":       [],
+                                            "subparsers":   None
+                                        }
+
+    # For each argument group (the first two being the default positional & optional groups)...
+    for index, group in enumerate(parser._action_groups):
+
+        # Initialize group specification.
+        arguments:  List[Dict[str, Any]] =  []
+
+        # For each argument of group...
+        for action in group._group_actions:
+
+            # Help actions are added by parsers themselves.
+            if isinstance(action, _HelpAction): continue
+
+            # Describe sub-parsers separately.
+            if isinstance(action, _SubParsersAction):
+
+                # Describe sub-parsers (failing if any of them cannot be described).
+                subparsers: Optional[Dict[str, Any]] =  _describe_subparsers_(action, group)
+                if subparsers is None: return None
+
+                # Record sub-parsers.
+                specification["subparsers"] = subparsers
+                continue
+
+            # Describe argument (failing if it cannot be described).
+            argument:   Optional[Dict[str, Any]] =  _describe_argument_(action)
+            if argument is None: return None
+
+            # Record argument.
+            arguments.append(argument)
+
+        # Record group (default groups are identified by index, custom groups are re-created, except
+        # for those which only hold sub-parsers, as `add_subparsers` re-creates them).
+        if arguments or (index > 1 and not group._group_actions): specification["groups"].append({
+                                        "index":        min(index, 2),
+                                        "title":        group.title,
+                                        "description":  group.description,
+                                        "arguments":    arguments
+                                    })
+
+    # Provide specification (only if it is JSON-compatible).
+    try:                return dumps(specification) and specification
+    except TypeError:   return None
+
+
+def rebuild_parser(
+    specification:  Dict[str, Any],
+    parser:         ArgumentParser
+) -> ArgumentParser:
+    """# Rebuild Argument Parser.
+
+    ## Args:
+        * specification (Dict[str, Any]):   Specification produced by `describe_parser`.
+        * parser        (ArgumentParser):   Empty parser into which arguments are rebuilt.
+
+    ## Returns:
+        * ArgumentParser:   Populated parser.
+    """
+    # Restore parser-level defaults.
+    parser.set_defaults(**specification["defaults"])
+
+    # For each argument group...
+    for group in specification["groups"]:
+
+        # Default groups already exist, custom groups are created.
+        target: Any =   (
+                            parser._action_groups[group["index"]]
+                            if group["index"] < 2 else
+                            parser.add_argument_group(
+                                title =         group["title"],
+                                description =   group["description"]
+                            )
+                        )
+
+        # Rebuild arguments.
+        for argument in group["arguments"]: _rebuild_argument_(argument, target)
+
+    # Rebuild sub-parsers if defined.
+    if specification["subparsers"] is not None:
+
+        # Create sub-parser group.
+        subparsers: Dict[str, Any] =    specification["subparsers"]
+        action:     _SubParsersAction = parser.add_subparsers(
+                                            title =         subparsers["title"],
+                                            description =   subparsers["description"],
+                                            dest =          subparsers["dest"],
+                                            help =          subparsers["help"],
+                                            required =      subparsers["required"]
+                                        )
+
+        # Rebuild each sub-parser.
+        for choice in subparsers["choices"]:
+            rebuild_parser(choice["parser"], action.add_parser(
+                name =          choice["name"],
+                help =          choice["help"],
+                description =   choice["parser"]["description"]
+            ))
+
+    # Provide parser.
+    return parser
+
+
+# HELPERS ==========================================================================================
+
+def _describe_argument_(
+    action: Any
+) -> Optional[Dict[str, Any]]:
+    """# Describe Argument.
+
+    ## Args:
+        * action    (Action):   Argument's action.
+
+    ## Returns:
+        * Dict[str, Any] | None:    Argument specification, or None if it cannot be serialized.
+    """
+    # Custom actions cannot be serialized.
+    if type(action) not in _ACTIONS_: return None
+
+    # Determine action name.
+    name:       str =               _ACTIONS_[type(action)]
+
+    # Custom types cannot be serialized.
+    if  action.type is not None and \
+        _TYPES_.get(getattr(action.type, "__name__", None)) is not action.type: return None
+
+    # Collect keyword arguments accepted by action.
+    keywords:   Dict[str, Any] =    {
+                                        "action":   name,
+                                        "default":  action.default,
+                                        "help":     action.help,
+                                        **{
+                                            keyword: getattr(action, keyword)
+                                            for keyword in _KEYWORDS_[name]
+                                            if getattr(action, keyword, None) is not None
+                                        }
+                                    }
+
+    # Name types, & list choices & metavars (which may be tuples).
+    if "type" in keywords:      keywords["type"] =      keywords["type"].__name__
+    if "choices" in keywords:   keywords["choices"] =   list(keywords["choices"])
+    if isinstance(keywords.get("metavar"), tuple):  keywords["metavar"] = list(keywords["metavar"])
+
+    # Positional arguments are named by their destination, optional arguments by their flags.
+    if action.option_strings:
+        keywords["dest"] =      action.dest
+        keywords["required"] =  action.required
+
+    # Provide specification.
+    return {"flags": list(action.option_strings) or [action.dest], "keywords": keywords}
+
+
+def _describe_subparsers_(
+    action: _SubParsersAction,
+    group:  Any
+) -> Optional[Dict[str, Any]]:
+    """# Describe Sub-Parsers.
+
+    ## Args:
+        * action    (_SubParsersAction):    Sub-parsers action.
+        * group     (_ArgumentGroup):       Group holding action.
+
+    ## Returns:
+        * Dict[str, Any] | None:    Sub-parsers specification, or None if any of them cannot be
+                                    serialized.
+    """
+    # Describe each choice.
+    choices:    List[Dict[str, Any]] =  []
+    for choice in action._choices_actions:
+
+        # Describe choice's parser (failing if it cannot be described).
+        parser: Optional[Dict[str, Any]] =  describe_parser(action.choices[choice.dest])
+        if parser is None: return None
+
+        # Record choice.
+        choices.append({"name": choice.dest, "help": choice.help, "parser": parser})
+
+    # Provide specification.
+    return  {
+                "title":        None if group.title == "positional arguments" else group.title,
+                "description":  group.description,
+                "dest":         action.dest if action.dest != SUPPRESS else None,
+                "help":         action.help,
+                "required":     action.required,
+                "choices":      choices
+            }
+
+
+def _rebuild_argument_(
+    argument:   Dict[str, Any],
+    group:      Any
+) -> None:
+    """# Rebuild Argument.
+
+    ## Args:
+        * argument  (Dict[str, Any]):   Argument specification.
+        * group     (_ArgumentGroup):   Group (or parser) to which argument is added.
+    """
+    # Resolve named types.
+    keywords:   Dict[str, Any] =    dict(argument["keywords"])
+    if "type" in keywords:      keywords["type"] =      _TYPES_[keywords["type"]]
+    if isinstance(keywords.get("metavar"), list):   keywords["metavar"] = tuple(keywords["metavar"])
+
+    # Add argument.
+    group.add_argument(*argument["flags"], **keywords)
@@ -8,33 +8,45 @@ __all__ = ["Entry"]
 from abc                                import ABC
 from argparse                           import _SubParsersAction
 from logging                            import Logger
-from typing                             import List, Optional
+from typing                             import Any, Dict, FrozenSet, Iterable, Optional
 
 from gel.configuration                  import Config
 from gel.registration.core.exceptions   import ParserNotConfiguredError
 from gel.utilities                      import get_logger
 
+# Logger shared by entries created outside of a registry.
+_LOGGER_:   Logger =    get_logger("registration-entry")
+
 class Entry(ABC):
-    """# Abstract Registration Entry."""
+    """# Abstract Registration Entry.
+
+    Entries are slotted (registries may hold tens of thousands of them), & log through the logger
+    of their registry rather than through a logger of their own.
+    """
+
+    __slots__ = ("__logger__", "_config_", "_id_", "_tags_")
 
     def __init__(self,
         id:     str,
         config: Optional[Config] =  None,
-        tags:   List[str] =         []
+        tags:   Iterable[str] =     (),
+        logger: Optional[Logger] =  None
     ):
         """# Instantiate Registration Entry.
 
         ## Args:
             * id        (str):              Entry ID.
             * config    (Config | None):    Argument parser handler. Defaults to None.
-            * tags      (List[str]):        Tags that describe entry's taxonomy. Defaults to [].
+            * tags      (Iterable[str]):    Tags that describe entry's taxonomy. Defaults to ().
+            * logger    (Logger | None):    Logger of entry's registry. Defaults to the logger
+                                            shared by entries created outside of a registry.
         """
         # Initialize logger.
-        self.__logger__:    Logger =            get_logger(f"{id}-registration-entry")
+        self.__logger__:    Logger =            logger or _LOGGER_
 
         # Define properties.
         self._id_:          str =               id
-        self._tags_:        List[str] =         tags
+        self._tags_:        FrozenSet[str] =    frozenset(tags)
         self._config_:      Optional[Config] =  config
 
         # Debug registration.
@@ -46,6 +58,15 @@ class Entry(ABC):
     def id(self) -> str:
         """# Entry ID"""
         return self._id_
+
+    @property
+    def metadata(self) -> Dict[str, Any]:
+        """# Entry Metadata
+
+        Keyword arguments (JSON-compatible) from which the registry re-creates this entry when
+        loading it from a manifest.
+        """
+        return {"tags": sorted(self._tags_)}
     
     @property
     def config(self) -> Optional[Config]:
@@ -53,7 +74,7 @@ class Entry(ABC):
         return self._config_
     
     @property
-    def tags(self) -> List[str]:
+    def tags(self) -> FrozenSet[str]:
         """# Entry Taxonomy Tags"""
         return self._tags_
     
@@ -85,16 +106,16 @@ class Entry(ABC):
             * subparser (_SubParsersAction):    Parent's sub-parser.
         """
         # If entry was not registered with parser handler, report error.
-        if self._config_ is None: raise ParserNotConfiguredError(entry_id = self._id_)
+        if self.config is None: raise ParserNotConfiguredError(entry_id = self._id_)
 
         # Debug action.
         self.__logger__.debug(f"Registering {self} parser under {subparser.dest}")
 
         # Register parser.
-        self._config_.register_parser(cls = self._config_, subparser = subparser)
+        self.config.register_parser(cls = self.config, subparser = subparser)
 
     # DUNDERS ======================================================================================
 
     def __repr__(self) -> str:
         """# Entry Object Representation"""
-        return f"""<{self._id_.capitalize()}Entry(tags = {",".join(self._tags_)})>"""
\ No newline at end of file
+        return f"""<{self._id_.capitalize()}Entry(tags = {",".join(sorted(self._tags_))})>"""
\ No newline at end of file
@@ -0,0 +1,423 @@
+"""# gel.registration.core.manifest
+
+Registry manifests, describing every entry of a registry (the module which registers it, & the
+metadata needed to expose it on the command line) so that registries can be loaded without
+importing the modules of their entries.
+
+Manifests come from one of two places:
+    * Packaged manifests are generated at build time by walking (& importing) a registry's package
+      once (`python -m gel.registration.core.manifest`), & are trusted while they match the
+      installed package version & module layout.
+    * Cached manifests are written to the user's cache directory (`$GEL_CACHE_DIR`, or
+      `$XDG_CACHE_HOME/gel`, or `~/.cache/gel`) whenever a registry had to walk its package, & are
+      trusted while they match the installed package version & the modification time of every
+      module.
+
+Otherwise, registries fall back to walking their package.
+
+Plugins advertised through entry points are indexed separately (see `read_plugins`), as they are
+not part of any registry's package.
+"""
+
+__all__ =   [
+                "build_manifest",
+                "cache_path",
+                "list_modules",
+                "manifest_path",
+                "read_manifest",
+                "read_plugins",
+                "write_manifest",
+            ]
+
+from importlib.machinery            import BYTECODE_SUFFIXES, EXTENSION_SUFFIXES, SOURCE_SUFFIXES
+from importlib.util                 import find_spec
+from json                           import dump, load
+from os                             import (
+                                        DirEntry, environ, getpid, replace, scandir, stat,
+                                        stat_result
+                                    )
+from os.path                        import isdir, join
+from pathlib                        import Path
+from pkgutil                        import get_importer, iter_modules
+from typing                         import Any, Dict, List, Optional, Tuple, TYPE_CHECKING
+
+from gel.__meta__                   import __version__
+
+if TYPE_CHECKING: from gel.registration.core.registry import Registry
+
+# Name of manifest file, stored at the root of each registry's package.
+MANIFEST_FILE:  str =   "manifest.json"
+
+# Suffixes of module files, in the import system's order of preference.
+_SUFFIXES_:     Tuple[str, ...] =   (*EXTENSION_SUFFIXES, *SOURCE_SUFFIXES, *BYTECODE_SUFFIXES)
+
+
+def build_manifest(
+    registry:   "Registry"
+) -> Dict[str, Any]:
+    """# Build Registry Manifest.
+
+    ## Args:
+        * registry  (Registry): Registry being described (whose modules have all been imported).
+
+    ## Returns:
+        * Dict[str, Any]:   JSON-compatible manifest.
+    """
+    return  {
+                "version":  __version__,
+                "registry": registry.id,
+                "modules":  list_modules(registry.id),
+                "entries":  {id: entry.metadata for id, entry in registry.entries.items()}
+            }
+
+
+def cache_path(
+    registry_id:    str
+) -> Optional[Path]:
+    """# Locate Cached Registry Manifest.
+
+    ## Args:
+        * registry_id   (str):  Registry (or index) whose cached manifest is being located.
+
+    ## Returns:
+        * Path | None:  Path of cached manifest, or None if caching is disabled (`GEL_CACHE_DIR`
+                        set to an empty string).
+    """
+    # Determine cache directory.
+    directory:  Optional[str] = environ.get("GEL_CACHE_DIR")
+    if directory is None:
+        directory = join(environ.get("XDG_CACHE_HOME") or join(Path.home(), ".cache"), "gel")
+
+    # Provide path within cache directory.
+    return Path(directory) / "manifests" / f"{registry_id}.json" if directory else None
+
+
+def list_modules(
+    registry_id:    str
+) -> Dict[str, int]:
+    """# List Modules of Registry Package.
+
+    Unlike `pkgutil.walk_packages`, sub-packages are listed without being imported. Modules are
+    recognized by every suffix known to the import system (sources, bytecode, & extensions).
+    Locations which are not directories (e.g., zip archives) are listed by their importer instead,
+    their modules being dated by their archive.
+
+    ## Args:
+        * registry_id   (str):  Registry whose package (`gel.<registry_id>`) is listed.
+
+    ## Returns:
+        * Dict[str, int]:   Mapping of every module under package (sorted by name) to the
+                            modification time (in nanoseconds) of its file.
+    """
+    # Initialize listing, starting from registry's package.
+    prefix:     str =                           f"gel.{registry_id}."
+    modules:    Dict[str, int] =                {}
+    ranks:      Dict[str, int] =                {}
+    pending:    List[Tuple[List[str], str]] =   [(_package_paths_(registry_id), prefix)]
+
+    # For each (sub-)package remaining...
+    while pending:
+
+        # Scan each of its directories (a single pass of `scandir` per directory, as opposed to
+        # the several listings & stats per module of `pkgutil.iter_modules`).
+        paths, prefix = pending.pop()
+        for path in paths:
+
+            # Locations which are not directories (e.g., zip archives) are listed by their importer.
+            if not isdir(path):
+                _list_archive_(path = path, prefix = prefix, modules = modules, pending = pending)
+                continue
+
+            try:                entries:    List[DirEntry] =    list(scandir(path))
+            except OSError:     continue
+
+            for entry in entries:
+
+                # Determine module's name & rank (directories name packages, files modules).
+                name, rank =    (entry.name, -1) if entry.is_dir() else _split_module_(entry.name)
+
+                # Skip non-modules, initializers, & modules already listed by a preferred file.
+                if  name is None or not name.isidentifier() or name == "__init__" or \
+                    ranks.get(f"{prefix}{name}", len(_SUFFIXES_)) <= rank: continue
+
+                try:# Record module's modification time (packages are dated by their directory's
+                    # initializer, & directories lacking one are not packages).
+                    modules[f"{prefix}{name}"] =    (
+                                                        _initializer_(entry.path)
+                                                        if rank < 0 else entry.stat()
+                                                    ).st_mtime_ns
+                    ranks[f"{prefix}{name}"] =      rank
+
+                # Skip modules whose file cannot be found.
+                except OSError: continue
+
+                # Queue sub-packages.
+                if rank < 0: pending.append(([entry.path], f"{prefix}{name}."))
+
+    # Provide listing sorted by name.
+    return dict(sorted(modules.items()))
+
+
+def manifest_path(
+    registry_id:    str
+) -> Optional[Path]:
+    """# Locate Packaged Registry Manifest.
+
+    ## Args:
+        * registry_id   (str):  Registry whose manifest is being located.
+
+    ## Returns:
+        * Path | None:  Path of manifest, or None if registry's package cannot be found.
+    """
+    # Locate package (without importing it).
+    paths:  List[str] = _package_paths_(registry_id)
+
+    # Provide path within package.
+    return Path(paths[0]) / MANIFEST_FILE if paths else None
+
+
+def read_manifest(
+    registry_id:    str
+) -> Optional[Dict[str, Any]]:
+    """# Read Registry Manifest.
+
+    ## Args:
+        * registry_id   (str):  Registry whose manifest is being read.
+
+    ## Returns:
+        * Dict[str, Any] | None:    Packaged manifest, or cached manifest, or None if neither is
+                                    current.
+    """
+    # List installed modules.
+    modules:    Dict[str, int] =            list_modules(registry_id)
+
+    # Packaged manifests must match the installed version & module layout.
+    manifest:   Optional[Dict[str, Any]] =  _read_(manifest_path(registry_id))
+    if  manifest is not None and \
+        manifest.get("version") == __version__ and \
+        sorted(manifest.get("modules", ())) == list(modules): return manifest
+
+    # Cached manifests must also match every module's modification time.
+    manifest:   Optional[Dict[str, Any]] =  _read_(cache_path(registry_id))
+    if  manifest is not None and \
+        manifest.get("version") == __version__ and \
+        manifest.get("modules") == modules: return manifest
+
+    # Otherwise, no manifest is current.
+    return None
+
+
+def read_plugins(
+    group:  str
+) -> List[Dict[str, Optional[str]]]:
+    """# Read Plugin Index.
+
+    Scanning entry points reads the metadata of every installed distribution, so the plugins of a
+    group are indexed in the user's cache directory, & only re-scanned once a directory of the
+    import path is modified (as installing, upgrading, or removing distributions does).
+
+    ## Args:
+        * group (str):  Entry-point group through which plugins are advertised.
+
+    ## Returns:
+        * List[Dict[str, str | None]]:  Name, module, & description (distribution summary) of each
+                                        plugin.
+    """
+    from sys    import path as import_path
+
+    # Record modification time of each directory of the import path (zero if missing).
+    paths:      Dict[str, int] =                    {}
+    for directory in import_path:
+        try:                paths[directory] =  stat(directory or ".").st_mtime_ns
+        except OSError:     paths[directory] =  0
+
+    # Provide indexed plugins if index is current.
+    cache:      Optional[Path] =                    cache_path(f"{group}.plugins")
+    index:      Optional[Dict[str, Any]] =          _read_(cache)
+    if  index is not None and \
+        index.get("version") == __version__ and \
+        index.get("paths") == paths: return index["plugins"]
+
+    # Otherwise, scan entry points (reading distributions' summaries only now).
+    from importlib.metadata import entry_points
+    plugins:    List[Dict[str, Optional[str]]] =    []
+    for plugin in entry_points(group = group):
+        plugins.append({
+            "name":     plugin.name,
+            "module":   plugin.module,
+            "value":    plugin.value,
+            "help":     None if plugin.dist is None else plugin.dist.metadata["Summary"]
+        })
+
+    # Index plugins (best-effort, e.g., cache directory may be read-only).
+    if cache is not None:
+        try:                write_manifest(
+                                manifest =  {
+                                                "version":  __version__,
+                                                "paths":    paths,
+                                                "plugins":  plugins
+                                            },
+                                path =      cache
+                            )
+        except OSError:     pass
+
+    # Provide plugins.
+    return plugins
+
+
+def write_manifest(
+    manifest:   Dict[str, Any],
+    path:       Optional[Path] =    None
+) -> Path:
+    """# Write Registry Manifest.
+
+    ## Args:
+        * manifest  (Dict[str, Any]):   Manifest produced by `build_manifest`.
+        * path      (Path | None):      Path at which manifest is written. Defaults to the packaged
+                                        manifest's path.
+
+    ## Returns:
+        * Path: Path at which manifest was written.
+    """
+    # Locate manifest.
+    path:       Path =  path or manifest_path(manifest["registry"])
+
+    # Ensure that its directory exists.
+    path.parent.mkdir(parents = True, exist_ok = True)
+
+    # Write to temporary file (unique to this process), then move it into place (so that readers
+    # never see partial files, even while several processes cache the same manifest).
+    temporary:  Path =  path.with_suffix(f".{getpid()}.tmp")
+    with open(temporary, "w", encoding = "utf-8") as file:
+        dump(manifest, file, separators = (",", ":"), sort_keys = True)
+    replace(temporary, path)
+
+    # Provide path.
+    return path
+
+
+# HELPERS ==========================================================================================
+
+def _initializer_(
+    path:   str
+) -> stat_result:
+    """# Stat Package Initializer.
+
+    ## Args:
+        * path  (str):  Directory of package.
+
+    ## Raises:
+        * FileNotFoundError:    If directory has no initializer (it is not a package).
+
+    ## Returns:
+        * stat_result:  Status of initializer (as preferred by the import system).
+    """
+    # Stat first initializer found.
+    for suffix in _SUFFIXES_:
+        try:                        return stat(join(path, f"__init__{suffix}"))
+        except FileNotFoundError:   continue
+
+    # Otherwise, directory is not a package.
+    raise FileNotFoundError(f"No initializer in {path}")
+
+
+def _list_archive_(
+    path:       str,
+    prefix:     str,
+    modules:    Dict[str, int],
+    pending:    List[Tuple[List[str], str]]
+) -> None:
+    """# List Modules of Non-Directory Location (e.g., Zip Archive).
+
+    ## Args:
+        * path      (str):                              Location of package.
+        * prefix    (str):                              Prefix of modules' names.
+        * modules   (Dict[str, int]):                   Listing, updated with location's modules.
+        * pending   (List[Tuple[List[str], str]]):      Queue, extended with location's packages.
+    """
+    # Resolve location's importer, dating its modules by its archive (or location itself).
+    importer:   Any =   get_importer(path)
+    try:                mtime:  int =   stat(getattr(importer, "archive", path)).st_mtime_ns
+    except OSError:     return
+
+    # Record each module, & queue sub-packages.
+    for module in iter_modules([path], prefix):
+        if module.name in modules: continue
+        modules[module.name] =  mtime
+        if module.ispkg:        pending.append((
+                                    [join(path, module.name.rpartition(".")[2])], f"{module.name}."
+                                ))
+
+
+def _split_module_(
+    filename:   str
+) -> Tuple[Optional[str], int]:
+    """# Split Module File Name.
+
+    ## Args:
+        * filename  (str):  Name of file.
+
+    ## Returns:
+        * str | None:   Name of module, or None if file is not a module.
+        * int:          Rank of file's suffix (lower ranks being preferred by the import system).
+    """
+    # Match first suffix known to the import system.
+    for rank, suffix in enumerate(_SUFFIXES_):
+        if filename.endswith(suffix): return filename[:-len(suffix)], rank
+
+    # Otherwise, file is not a module.
+    return None, len(_SUFFIXES_)
+
+
+def _package_paths_(
+    registry_id:    str
+) -> List[str]:
+    """# Locate Registry Package.
+
+    ## Args:
+        * registry_id   (str):  Registry whose package (`gel.<registry_id>`) is located.
+
+    ## Returns:
+        * List[str]:    Search locations of package (empty if it cannot be found).
+    """
+    try:# Find package specification (without executing package).
+        spec:   Any =   find_spec(f"gel.{registry_id}")
+
+    # If package cannot be found, it has no locations.
+    except (ImportError, ValueError): return []
+
+    # Provide locations.
+    return list(spec.submodule_search_locations or []) if spec is not None else []
+
+
+def _read_(
+    path:   Optional[Path]
+) -> Optional[Dict[str, Any]]:
+    """# Read Manifest File.
+
+    ## Args:
+        * path  (Path | None):  Path of manifest.
+
+    ## Returns:
+        * Dict[str, Any] | None:    Manifest, or None if it is missing or unreadable.
+    """
+    # If manifest does not exist, it cannot be read.
+    if path is None or not path.is_file(): return None
+
+    # Read manifest.
+    try:
+        with open(path, encoding = "utf-8") as file: return load(file)
+
+    # Unreadable manifests are ignored.
+    except (OSError, ValueError): return None
+
+
+if __name__ == "__main__":
+
+    from gel.registration   import COMMAND_REGISTRY
+
+    # Import every command module, registering all commands.
+    COMMAND_REGISTRY._import_all_modules_()
+
+    # Build & write command manifest.
+    print(f"Wrote {write_manifest(build_manifest(COMMAND_REGISTRY))}")
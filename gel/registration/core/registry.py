@@ -8,7 +8,13 @@ __all__ = ["Registry"]
 from abc                                import ABC, abstractmethod
 from argparse                           import ArgumentParser, _SubParsersAction
 from logging                            import Logger
-from typing                             import Dict, List
+from pathlib                            import Path
+from threading                          import get_ident, RLock
+from types                              import MappingProxyType
+from typing                             import (
+                                            Any, Dict, Iterable, List, Mapping, Optional, Sequence,
+                                            Set, Tuple
+                                        )
 
 from gel.configuration                  import Config
 from gel.registration.core.entry        import Entry
@@ -16,8 +22,19 @@ from gel.registration.core.exceptions   import DuplicateEntryError, EntryNotFoun
 from gel.registration.core.types        import EntryType
 from gel.utilities                      import get_logger
 
+# Registry state (entries, tag index, & registration order).
+_State_ =   Tuple[Dict[str, Entry], Dict[str, Set[str]], Dict[str, int]]
+
 class Registry(ABC):
-    """# Abstract Registry"""
+    """# Abstract Registry
+
+    Registries are safe for concurrent use: loading happens once (under a lock), & registration is
+    copy-on-write (under another lock). Registrations are staged in copies of the entries, tag
+    index, & registration order (copied on the first registration after a publication only, so
+    that registering entries one at a time costs constant amortized time), which readers publish
+    in place of the old. Lookups, listings, & iteration thus never observe partially registered
+    entries, & only lock to publish staged registrations.
+    """
 
     def __init__(self,
         id: str
@@ -31,16 +48,38 @@ class Registry(ABC):
         self.__logger__:    Logger =            get_logger(f"{id}-registry")
 
         # Define properties.
-        self._id_:          str =               id
-        self._entries_:     Dict[str, Entry] =  {}
-        self._loaded_:      bool =              False
+        self._id_:          str =                   id
+        self._entries_:     Dict[str, Entry] =      {}
+        self._loaded_:      bool =                  False
+
+        # Initialize tag index (tag -> IDs of entries bearing it) & registration order of entries.
+        self._index_:       Dict[str, Set[str]] =   {}
+        self._positions_:   Dict[str, int] =        {}
+
+        # Define read-only view of entries (re-created whenever entries are published).
+        self._view_:        Mapping[str, Entry] =   MappingProxyType(self._entries_)
+
+        # Initialize staged entries, tag index, & registration order (None once published), & tags
+        # whose postings were copied since.
+        self._staged_:      Optional[_State_] =     None
+        self._copied_:      Set[str] =              set()
+
+        # Initialize locks (re-entrant, as loading imports modules which register entries, & as
+        # registering may resolve entries whose modules register further entries).
+        self._load_lock_:   RLock =                 RLock()
+        self._write_lock_:  RLock =                 RLock()
+
+        # Initialize threads taking part in loading registry, & import time of each module walked.
+        self._loaders_:     Set[int] =              set()
+        self._timings_:     Dict[str, float] =      {}
 
     # PROPERTIES ===================================================================================
 
     @property
-    def entries(self) -> Dict[str, Entry]:
-        """# Registry Entries"""
-        return self._entries_.copy()
+    def entries(self) -> Mapping[str, Entry]:
+        """# Registry Entries (read-only view; see `snapshot` for a copy)"""
+        self._publish_()
+        return self._view_
     
     @property
     def id(self) -> str:
@@ -51,6 +90,11 @@ class Registry(ABC):
     def is_loaded(self) -> bool:
         """# Registry has been Loaded?"""
         return self._loaded_
+
+    @property
+    def timings(self) -> Mapping[str, float]:
+        """# Import Time (in seconds) of Each Module Walked while Loading Registry"""
+        return MappingProxyType(self._timings_)
     
     # METHODS ======================================================================================
 
@@ -84,50 +128,100 @@ class Registry(ABC):
         return self._entries_[key]
     
     def list(self,
-        filter_by:  List[str] = []
+        filter_by:  Sequence[str] = (),
+        any_of:     Sequence[str] = (),
+        none_of:    Sequence[str] = ()
     ) -> List[str]:
         """# List Entries.
 
+        Filters are answered from the tag index: tags required by `filter_by` are intersected
+        starting from the rarest tag, so queries cost (at most) the size of the smallest set of
+        entries involved, rather than a scan of every entry.
+
         ## Args:
-            * filter_by (List[str]):    Tags by which entries will be filtered. Defaults to [].
+            * filter_by (Sequence[str]):    Tags which entries must all bear (AND). Defaults to ().
+            * any_of    (Sequence[str]):    Tags of which entries must bear at least one (OR).
+                                            Defaults to ().
+            * none_of   (Sequence[str]):    Tags which entries must not bear (NOT). Defaults to ().
 
         ## Returns:
-            * List[str]:    List of [filtered] entries.
+            * List[str]:    List of [filtered] entries, in order of registration.
         """
         # Ensure that registry is loaded.
         self._ensure_loaded_()
 
         # Debug action.
-        self.__logger__.debug(f"Listing {self._id_} entries filtered by {filter_by}")
+        self.__logger__.debug(
+            f"Listing {self._id_} entries filtered by {filter_by} (any of {any_of}, none of "
+            f"{none_of})"
+        )
 
         # If no filter is provided, return all entries.
-        if len(filter_by) == 0: return list(self._entries_.keys())
-
-        # Otherwise, return filtered entries.
-        return  [
-                    id 
-                    for id, entry
-                    in self._entries_.items()
-                    if  all(
-                            tag in entry.tags
-                            for tag
-                            in filter_by
-                        )
-                ]
+        if not (filter_by or any_of or none_of): return list(self._entries_.keys())
+
+        # Initialize candidates (None standing for every entry).
+        candidates: Optional[Set[str]] =   None
+
+        # Intersect entries bearing every required tag, from the rarest tag on.
+        if filter_by:
+
+            # Order postings by size (a tag absent from the index matches no entry).
+            postings:   List[Set[str]] =    sorted(
+                                                (self._index_.get(tag, set()) for tag in filter_by),
+                                                key = len
+                                            )
+
+            # Intersect postings (stopping early once no candidate remains).
+            candidates: Set[str] =          set(postings[0])
+            for posting in postings[1:]:
+                if not candidates: break
+                candidates &= posting
+
+        # Restrict to entries bearing any of the optional tags.
+        if any_of:
+            union:  Set[str] =  set().union(*(self._index_.get(tag, ()) for tag in any_of))
+            candidates =        union if candidates is None else candidates & union
+
+        # Exclude entries bearing any of the excluded tags.
+        if none_of:
+            candidates =        (set(self._entries_) if candidates is None else candidates) - \
+                                set().union(*(self._index_.get(tag, ()) for tag in none_of))
+
+        # Provide filtered entries in order of registration.
+        return sorted(candidates, key = self._positions_.__getitem__)
     
-    def load_all(self) -> None:
-        """# Load All Registered Modules."""
-        # If registry is already loaded, no-op.
-        if self.is_loaded: return
+    def load_all(self,
+        workers:    int =   1
+    ) -> None:
+        """# Load All Registered Modules.
 
-        # Otherwise, import all modules.
-        self._import_all_modules_()
+        Concurrent callers wait for (rather than repeat) the first caller's load, except for
+        threads taking part in it (e.g., modules querying the registry while being imported).
 
-        # Debug action.
-        self.__logger__.debug(f"{self._id_} registry has been loaded")
+        ## Args:
+            * workers   (int):  Number of threads importing modules, if registry's package must be
+                                walked. Defaults to 1 (serially).
+        """
+        # If registry is already loaded, or is being loaded by this thread, no-op.
+        if self._loaded_ or get_ident() in self._loaders_: return
+
+        # Otherwise, load registry once.
+        with self._load_lock_:
+
+            # If registry was loaded while waiting for lock, no-op.
+            if self._loaded_: return
+
+            # Load entries (as a loading thread), then publish them at once.
+            self._loaders_.add(get_ident())
+            try:        self._load_(workers = workers)
+            finally:    self._loaders_.discard(get_ident())
+            self._publish_()
 
-        # Update status.
-        self._loaded_:  bool =  True
+            # Debug action.
+            self.__logger__.debug(f"{self._id_} registry has been loaded")
+
+            # Update status.
+            self._loaded_:  bool =  True
 
     def register(self,
         id: str,
@@ -141,17 +235,22 @@ class Registry(ABC):
         ## Raises:
             * DuplicateEntryError:  If entry is already registered.
         """
-        # If entry is already registered...
-        if id in self._entries_:
+        # Register entries one at a time.
+        with self._write_lock_:
 
-            # Report error.
-            raise DuplicateEntryError(entry_id = id, registry_id = self._id_)
-        
-        # Debug action.
-        self.__logger__.debug(f"Registering {id} with arguments: {kwargs}")
+            # If entry is already registered (or staged)...
+            if id in self._latest_():
+
+                # Report error.
+                raise DuplicateEntryError(entry_id = id, registry_id = self._id_)
 
-        # Create & register entry.
-        self._entries_[id] = self._create_entry_(id = id, **kwargs)
+            # Debug action.
+            self.__logger__.debug(f"Registering {id} with arguments: {kwargs}")
+
+            # Create & register entry.
+            self._add_entries_(
+                entries = [self._create_entry_(id = id, logger = self.__logger__, **kwargs)]
+            )
 
     def register_parsers(self,
         subparser:  _SubParsersAction
@@ -191,8 +290,55 @@ class Registry(ABC):
                 parser._subparsers =                config.parser._subparsers
                 parser._option_string_actions =     config.parser._option_string_actions
 
+    def snapshot(self) -> Dict[str, Entry]:
+        """# Copy Registry Entries.
+
+        ## Returns:
+            * Dict[str, Entry]: Copy of entries, unaffected by later registrations.
+        """
+        self._publish_()
+        return self._entries_.copy()
+
     # HELPERS ======================================================================================
 
+    def _add_entries_(self,
+        entries:    Iterable[Entry]
+    ) -> None:
+        """# Add Entries (& Index their Tags).
+
+        Entries are staged, rather than published (see `_publish_`). Registry state is copied on
+        the first addition since it was last published only (copy-on-write), later additions
+        extending the staged copy in place. Callers must hold the write lock.
+
+        ## Args:
+            * entries   (Iterable[Entry]):  Entries being added.
+        """
+        # Stage copy of published state, unless one is already staged (tag postings being copied
+        # only once modified).
+        if self._staged_ is None:
+            self._staged_:  Optional[_State_] =     (
+                                                        dict(self._entries_),
+                                                        dict(self._index_),
+                                                        dict(self._positions_)
+                                                    )
+            self._copied_:  Set[str] =              set()
+
+        # Extend staged state.
+        registered, index, positions =              self._staged_
+
+        # For each entry...
+        for entry in entries:
+
+            # Record entry & its registration order.
+            positions[entry.id] =   len(positions)
+            registered[entry.id] =  entry
+
+            # Index entry under each of its tags.
+            for tag in entry.tags:
+                if tag not in self._copied_:
+                    index[tag] = set(index.get(tag, ())); self._copied_.add(tag)
+                index[tag].add(entry.id)
+
     @abstractmethod
     def _create_entry_(self, **kwargs) -> EntryType:
         """# Create Entry.
@@ -204,52 +350,238 @@ class Registry(ABC):
         """
         pass
 
+    def _cache_manifest_(self) -> None:
+        """# Cache Manifest of Registered Entries."""
+        from gel.registration.core.manifest import build_manifest, cache_path, write_manifest
+
+        # Locate cached manifest.
+        path:   Optional[Path] =    cache_path(registry_id = self._id_)
+
+        # If caching is disabled, no-op.
+        if path is None: return
+
+        try:# Write manifest.
+            write_manifest(manifest = build_manifest(registry = self), path = path)
+
+            # Debug action.
+            self.__logger__.debug(f"Cached {self._id_} manifest at {path}")
+
+        # Caching is best-effort (e.g., cache directory may be read-only).
+        except (OSError, TypeError, ValueError) as e:
+
+            # Debug failure.
+            self.__logger__.debug(f"Could not cache {self._id_} manifest: {e}")
+
     def _ensure_loaded_(self) -> None:
-        """# Ensure Registry is Loaded."""
-        if not self.is_loaded: self.load_all()
-
-    def _import_all_modules_(self) -> None:
-        """# Import All Modules."""
-        from importlib  import import_module
-        from pkgutil    import walk_packages
-        from types      import ModuleType
-        
-        try:# Import the main package to get its path.
-            package:    ModuleType =    import_module(f"gel.{self._id_}")
-        
+        """# Ensure Registry is Loaded (& its Entries Published)."""
+        if not self._loaded_: self.load_all()
+        self._publish_()
+
+    def _latest_(self) -> Dict[str, Entry]:
+        """# Latest Entries (Staged if Any, Published Otherwise).
+
+        Callers must hold the write lock.
+
+        ## Returns:
+            * Dict[str, Entry]: Entries, including those not yet published.
+        """
+        return self._entries_ if self._staged_ is None else self._staged_[0]
+
+    def _load_(self,
+        workers:    int =   1
+    ) -> None:
+        """# Load Entries.
+
+        Called once, under the load lock.
+
+        ## Args:
+            * workers   (int):  Number of threads importing modules. Defaults to 1 (serially).
+        """
+        # Load entries from manifest if it is current, or import all modules (caching a manifest of
+        # them, provided every module could be imported).
+        if  not self._load_manifest_() and \
+            self._import_all_modules_(workers = workers): self._cache_manifest_()
+
+    def _load_manifest_(self) -> bool:
+        """# Load Entries from Manifest.
+
+        Entries are re-created from their manifest metadata, without importing their modules.
+
+        ## Returns:
+            * bool: True if a current manifest was found & loaded.
+        """
+        from gel.registration.core.manifest import read_manifest
+
+        # Read manifest (missing & stale manifests are not loaded).
+        manifest:   Optional[Dict[str, Any]] =  read_manifest(registry_id = self._id_)
+        if manifest is None: return False
+
+        # Debug action.
+        self.__logger__.debug(f"Loading {len(manifest['entries'])} entries from manifest")
+
+        # Re-create each entry not already registered (all at once).
+        with self._write_lock_:
+            registered: Dict[str, Entry] =  self._latest_()
+            self._add_entries_(entries = [
+                self._create_entry_(id = id, logger = self.__logger__, **metadata)
+                for id, metadata in manifest["entries"].items()
+                if id not in registered
+            ])
+
+        # Indicate that manifest was loaded.
+        return True
+
+    def _import_all_modules_(self,
+        workers:    int =   1
+    ) -> bool:
+        """# Import All Modules.
+
+        Modules are listed without being imported (see `list_modules`). Packages are imported
+        first (serially, parents before children), then the remaining modules of each package are
+        imported (serially, so that sibling modules importing each other cannot deadlock), packages
+        being walked by a pool of threads if requested, so that walks are bounded by their slowest
+        package rather than by the sum of all modules. Packages whose modules import each other
+        circularly may deadlock when walked by different threads; such modules are reported as
+        failures.
+
+        Every module's import time is recorded (see `timings`), & failures are reported together.
+
+        ## Args:
+            * workers   (int):  Number of threads importing modules. Defaults to 1 (serially).
+
+        ## Returns:
+            * bool: True if every module was imported.
+        """
+        from concurrent.futures             import ThreadPoolExecutor
+        from importlib                      import import_module
+        from itertools                      import chain
+        from time                           import perf_counter
+
+        from gel.registration.core.manifest import list_modules
+
+        try:# Import the main package.
+            import_module(f"gel.{self._id_}")
+
         # If import error occurs...
         except ImportError as e:
-            
+
             # Warn of complications.
             self.__logger__.warning(f"Could not import package gel.{self._id_}: {e}")
-            return
-        
-        # Debug action.
-        self.__logger__.debug(f"Walking package: {package}")
-        
-        try:# For each module within package...
-            for _, module, _ in walk_packages(
-                path =      package.__path__,
-                prefix =    f"gel.{self._id_}.",
-                onerror =   lambda x: None
-            ):
-                try:# Attempt import of module.
-                    import_module(name = module)
-                    
-                    # Debug action.
-                    self.__logger__.debug(f"Walk of {module} complete")
-                    
-                # If import error occurs.
-                except ImportError as e:
-                    
-                    # Warn of complications.
-                    self.__logger__.warning(f"Error importing {module} module: {e}")
-                    
-        # If a package cannot be imported...
-        except ImportError as e:
-            
-            # Warn of error.
-            self.__logger__.warning(f"Error importing {package} package: {e}")
+            return False
+
+        # List modules, distinguishing packages (modules of which others are children).
+        modules:    List[str] =             list(list_modules(registry_id = self._id_))
+        packages:   Set[str] =              {module.rpartition(".")[0] for module in modules}
+
+        # Initialize import times & failures.
+        timings:    Dict[str, float] =      {}
+        failures:   Dict[str, Exception] =  {}
+
+        def load(module: str) -> Optional[Exception]:
+            """# Import Module (as part of this registry's load), Timing it.
+
+            ## Returns:
+                * Exception | None: Import error (or deadlock) raised by module, or None if it was
+                                    imported.
+            """
+            # Mark thread as loading registry (so that module's own queries of registry do not
+            # wait for the load they are part of), unless it already is (as the thread loading
+            # registry is for the rest of its load).
+            joined: bool =      get_ident() not in self._loaders_
+            if joined: self._loaders_.add(get_ident())
+            start:  float =     perf_counter()
+
+            try:# Attempt import of module.
+                import_module(name = module)
+
+            # Provide import errors.
+            except ImportError as e: return e
+
+            # Provide deadlocks too (raised by the import system, as a private RuntimeError, when
+            # modules of packages walked by different threads import each other circularly).
+            except RuntimeError as e:
+                if type(e).__name__ != "_DeadlockError": raise
+                return e
+
+            # Record import time.
+            finally:
+                timings[module] =   perf_counter() - start
+                if joined: self._loaders_.discard(get_ident())
+
+            # Debug action.
+            self.__logger__.debug(f"Imported {module} in {timings[module] * 1e3:.1f} ms")
+
+        def walk(group: List[str]) -> List[Tuple[str, Optional[Exception]]]:
+            """# Import Modules of Package Serially.
+
+            ## Returns:
+                * List[Tuple[str, Exception | None]]:   Each module & its import error (if any).
+            """
+            return [(module, load(module)) for module in group]
+
+        # Import packages first (their children being skipped if they cannot be imported).
+        for module in (module for module in modules if module in packages):
+            if any(module.startswith(f"{failed}.") for failed in failures): continue
+            if (error := load(module)) is not None: failures[module] = error
+
+        # Group remaining modules by package (skipping children of packages which failed).
+        groups:     Dict[str, List[str]] =  {}
+        for module in modules:
+            if module in packages or any(module.startswith(f"{failed}.") for failed in failures):
+                continue
+            groups.setdefault(module.rpartition(".")[0], []).append(module)
+
+        # Import groups (in parallel if requested).
+        results:    List[List[Tuple[str, Optional[Exception]]]] =   []
+        if workers > 1 and len(groups) > 1:
+            with ThreadPoolExecutor(
+                max_workers =           workers,
+                thread_name_prefix =    f"{self._id_}-registry"
+            ) as pool: results = list(pool.map(walk, groups.values()))
+        else: results = [walk(group) for group in groups.values()]
+
+        # Record failures.
+        for module, error in chain.from_iterable(results):
+            if error is not None: failures[module] = error
+
+        # Record import times.
+        self._timings_: Dict[str, float] =  timings
+
+        # Debug walk.
+        self.__logger__.debug(
+            f"Imported {len(timings)} {self._id_} modules in {sum(timings.values()):.3f} s "
+            f"({workers} worker(s))"
+        )
+
+        # Report failures together.
+        if failures: self.__logger__.warning(
+            f"Error importing {len(failures)} {self._id_} module(s):\n" + "\n".join(
+                f"  * {module}: {error}" for module, error in failures.items()
+            )
+        )
+
+        # Indicate whether walk was complete.
+        return not failures
+
+    def _publish_(self) -> None:
+        """# Publish Staged Entries.
+
+        Staged state is published in place of the old, registration order first & entries last
+        (so that readers always find the position of IDs found in the index, & the tags of entries
+        found in entries). Published state is never modified, the next addition staging a copy.
+        """
+        # If nothing is staged, no-op (without locking).
+        if self._staged_ is None: return
+
+        # Otherwise, publish staged state (unless another thread did meanwhile).
+        with self._write_lock_:
+            if self._staged_ is None: return
+            registered, index, positions =                  self._staged_
+            self._positions_:   Dict[str, int] =            positions
+            self._index_:       Dict[str, Set[str]] =       index
+            self._entries_:     Dict[str, Entry] =          registered
+            self._view_:        Mapping[str, Entry] =       MappingProxyType(registered)
+            self._staged_:      Optional[_State_] =         None
 
     # DUNDERS ======================================================================================
 
@@ -260,6 +592,10 @@ class Registry(ABC):
 
         True if entry key is registered.
         """
+        # Ensure that registry is loaded.
+        self._ensure_loaded_()
+
+        # Query entry.
         return key in self._entries_
     
     def __getitem__(self,
@@ -280,8 +616,10 @@ class Registry(ABC):
     
     def __len__(self) -> int:
         """# Number of Registered Entries"""
+        self._publish_()
         return len(self._entries_)
     
     def __repr__(self) -> str:
         """# Registry Object Representation"""
+        self._publish_()
         return f"""<{self._id_.capitalize()}Registry({len(self._entries_)} entries)>"""
\ No newline at end of file
@@ -5,43 +5,150 @@ Defines structure & utility of command registration entry.
 
 __all__ = ["CommandEntry"]
 
-from typing                 import Callable
+from importlib              import import_module
+from logging                import Logger
+from typing                 import Any, Callable, Dict, Iterable, Optional, override
 
-from gel.configuration      import CommandConfig
+from gel.configuration      import CommandConfig, describe_parser
 from gel.registration.core  import Entry
 
 class CommandEntry(Entry):
-    """# Command Registration Entry"""
+    """# Command Registration Entry
+
+    Commands loaded from a registry manifest are placeholders, holding only the metadata needed to
+    expose them on the command line. Their module is imported (& registers the command's entry
+    point & configuration) the first time either is accessed.
+    """
+
+    __slots__ = ("_entry_point_", "_help_", "_module_", "_name_", "_namespace_", "_specification_")
 
     def __init__(self,
         id:             str,
-        entry_point:    Callable,
-        config:         CommandConfig,
-        namespace:      str
+        entry_point:    Optional[Callable] =        None,
+        config:         Optional[CommandConfig] =   None,
+        namespace:      str =                       "gel",
+        module:         Optional[str] =             None,
+        name:           Optional[str] =             None,
+        help:           Optional[str] =             None,
+        specification:  Optional[Dict[str, Any]] =  None,
+        tags:           Iterable[str] =             (),
+        logger:         Optional[Logger] =          None
     ):
         """# Instantiate Comand Registration Entry.
-        
+
         ## Args:
             * id            (str):              Name of command.
-            * entry_point   (Callable):         Command's main process entry point.
+            * entry_point   (Callable | None):  Command's main process entry point.
             * config        (CommandConfig):    Command's argument configuration.
             * namespace     (str):              Module whose entities command will be registered to.
+            * module        (str | None):       Module registering command, imported on demand if
+                                                entry point is not provided.
+            * name          (str | None):       Command's parser name.
+            * help          (str | None):       Command's description.
+            * specification (Dict | None):      Command's parser specification (see
+                                                `describe_parser`).
+            * tags          (Iterable[str]):    Tags that describe command's taxonomy.
+            * logger        (Logger | None):    Logger of command registry.
         """
         # Initialize entry.
-        super(CommandEntry, self).__init__(id = id, config = config, tags = [])
+        super(CommandEntry, self).__init__(id = id, config = config, tags = tags, logger = logger)
 
         # Define properties.
-        self._entry_point_: Callable =  entry_point
-        self._namespace_:   str =       namespace
+        self._entry_point_:     Optional[Callable] =        entry_point
+        self._namespace_:       str =                       namespace
+        self._module_:          Optional[str] =             module
+        self._name_:            Optional[str] =             name
+        self._help_:            Optional[str] =             help
+        self._specification_:   Optional[Dict[str, Any]] =  specification
 
     # PROPERTIES ===================================================================================
 
+    @override
+    @property
+    def config(self) -> Optional[CommandConfig]:
+        """# Command's Argument Configuration"""
+        self._resolve_()
+        return self._config_
+
     @property
-    def entry_point(self) -> Callable:
+    def entry_point(self) -> Optional[Callable]:
         """# Main Process Entry Point"""
+        self._resolve_()
         return self._entry_point_
-    
+
+    @property
+    def help(self) -> Optional[str]:
+        """# Command's Description (if known without importing command)"""
+        return self._help_
+
+    @property
+    def is_resolved(self) -> bool:
+        """# Command's Entry Point has been Registered?"""
+        return self._entry_point_ is not None or self._module_ is None
+
+    @override
+    @property
+    def metadata(self) -> Dict[str, Any]:
+        """# Command Metadata"""
+        # Instantiate configuration (building its parser).
+        config: Optional[CommandConfig] =   None if self.config is None else self.config()
+
+        # Describe command (alongside its tags).
+        return  {
+                    **super(CommandEntry, self).metadata,
+                    "namespace":        self._namespace_,
+                    "module":           self.entry_point.__module__,
+                    "name":             None if config is None else config.parser_id,
+                    "help":             None if config is None else config.parser_help,
+                    "specification":    None if config is None else describe_parser(config.parser)
+                }
+
+    @property
+    def name(self) -> Optional[str]:
+        """# Command's Parser Name (if known without importing command)"""
+        return self._name_
+
     @property
     def namespace(self) -> str:
         """# Command's Namespace"""
-        return self._namespace_
\ No newline at end of file
+        return self._namespace_
+
+    @property
+    def specification(self) -> Optional[Dict[str, Any]]:
+        """# Command's Parser Specification (if known without importing command)"""
+        return self._specification_
+
+    # METHODS ======================================================================================
+
+    def resolve(self,
+        entry_point:    Callable,
+        config:         CommandConfig,
+        **kwargs
+    ) -> None:
+        """# Resolve Command.
+
+        Binds the entry point & configuration registered by the command's module.
+
+        ## Args:
+            * entry_point   (Callable):         Command's main process entry point.
+            * config        (CommandConfig):    Command's argument configuration.
+        """
+        # Debug action.
+        self.__logger__.debug(f"Resolved {self} from {entry_point.__module__}")
+
+        # Bind command.
+        self._entry_point_: Callable =      entry_point
+        self._config_:      CommandConfig = config
+
+    # HELPERS ======================================================================================
+
+    def _resolve_(self) -> None:
+        """# Import Command Module (if command has not been resolved)."""
+        # If command is already resolved, no-op.
+        if self.is_resolved: return
+
+        # Debug action.
+        self.__logger__.debug(f"Importing {self._module_} to resolve {self}")
+
+        # Import module (whose registration resolves command).
+        import_module(self._module_)
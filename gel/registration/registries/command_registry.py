@@ -6,14 +6,28 @@ Command registry system implementation.
 __all__ = ["CommandRegistry"]
 
 from argparse                   import ArgumentParser, _SubParsersAction
-from typing                     import Any, Dict, Optional, override
+from typing                     import Any, Dict, Mapping, Optional, override
 
-from gel.configuration          import CommandConfig
+from gel.configuration          import CommandConfig, rebuild_parser
 from gel.registration.core      import EntryPointNotConfiguredError, Registry
 from gel.registration.entries   import CommandEntry
 
+# Entry-point group through which installed distributions register (plugin) commands.
+PLUGIN_GROUP:   str =   "gel.commands"
+
 class CommandRegistry(Registry):
-    """# Command Registry System"""
+    """# Command Registry System
+
+    Besides the commands of the `gel.commands` package, commands are registered by installed
+    distributions through the "gel.commands" entry-point group, e.g.:
+
+        [project.entry-points."gel.commands"]
+        hello = "gel_hello.__main__:hello_entry_point"
+
+    where the referenced module registers the command (under the entry point's name) with
+    `register_command`. Plugins are listed from distribution metadata alone (described by their
+    distribution's summary), & their module is only imported when their command is selected.
+    """
 
     def __init__(self):
         """# Instantiate Command Registry."""
@@ -23,9 +37,10 @@ class CommandRegistry(Registry):
 
     @override
     @property
-    def entries(self) -> Dict[str, CommandEntry]:
-        """# Registered Command Entries"""
-        return self._entries_.copy()
+    def entries(self) -> Mapping[str, CommandEntry]:
+        """# Registered Command Entries (read-only view; see `snapshot` for a copy)"""
+        self._publish_()
+        return self._view_
     
     # METHODS ======================================================================================
 
@@ -59,11 +74,55 @@ class CommandRegistry(Registry):
 
         # Dispatch to command entry point.
         return entry.entry_point(*args, **kwargs)
+
+    @override
+    def register(self,
+        id: str,
+        **kwargs
+    ) -> None:
+        """# Register Command.
+
+        If command was loaded from a manifest, its placeholder entry is resolved instead.
+
+        ## Args:
+            * id    (str):  Name of command.
+
+        ## Raises:
+            * DuplicateEntryError:  If command is already registered (& resolved).
+        """
+        # Register (or resolve) commands one at a time.
+        with self._write_lock_:
+
+            # If command is awaiting resolution by its module, resolve it.
+            entries:    Dict[str, CommandEntry] =   self._latest_()
+            if id in entries and not entries[id].is_resolved: return entries[id].resolve(**kwargs)
+
+            # Otherwise, register command.
+            super(CommandRegistry, self).register(id = id, **kwargs)
     
+    def register_parser(self,
+        subparser:  _SubParsersAction,
+        command_id: str
+    ) -> Optional[ArgumentParser]:
+        """# Register Single Command's Argument Parser.
+
+        ## Args:
+            * subparser     (_SubParsersAction):    Command sub-parser of parent parser.
+            * command_id    (str):                  Command whose parser is registered.
+
+        ## Raises:
+            * EntryNotFoundError:   If command is not registered.
+
+        ## Returns:
+            * ArgumentParser | None:    Command's parser, or None if command has no parser handler.
+        """
+        return self._add_parser_(subparser = subparser, entry = self.get_entry(key = command_id))
+
     @override
     def register_parsers(self,
         subparser:  _SubParsersAction,
-        namespace:  Optional[str] =     None
+        namespace:  Optional[str] =     None,
+        arguments:  bool =              True
     ) -> None:
         """# Register Argument Parsers.
 
@@ -71,42 +130,157 @@ class CommandRegistry(Registry):
             * subparser (_SubParsersAction):    Command sub-parser of parent parser.
             * namespace (str | None):           If provided, only register parsers attributed to 
                                                 this module namespace.
+            * arguments (bool):                 Define each command's arguments. If False, commands
+                                                are only listed (by name & description), which
+                                                suffices for help listings. Defaults to True.
         """
         # Ensure that registry is loaded.
         self._ensure_loaded_()
 
-        # For each registered command...
-        for entry in self.entries.values():
+        # For each registered command (commands registered meanwhile, e.g., by the modules of
+        # commands being imported, are published in a new mapping, leaving this one intact)...
+        for entry in self._entries_.values():
 
             # If namespace is specified and entry is not attributed to it, skip it.
             if namespace is not None and entry.namespace != namespace: continue
 
-            # If entry was registered with a parser handler...
-            if entry.config is not None:
+            # Register command's parser.
+            self._add_parser_(subparser = subparser, entry = entry, arguments = arguments)
 
-                # Debug action.
-                self.__logger__.debug(f"Registering arguments for {entry.id}")
-        
-                # Create config instance (builds its full parser with all arguments).
-                config: CommandConfig =             entry.config()
-                
-                # Create a new parser.
-                parser: ArgumentParser =            subparser.add_parser(
-                                                        name =          config.parser_id,
-                                                        help =          config.parser_help,
-                                                        description =   config.parser_help
-                                                    )
-                
-                # Copy ALL the internals from the pre-built parser
-                parser._actions =                   config.parser._actions
-                parser._action_groups =             config.parser._action_groups
-                parser._mutually_exclusive_groups = config.parser._mutually_exclusive_groups
-                parser._defaults =                  config.parser._defaults
-                parser._subparsers =                config.parser._subparsers
-                parser._option_string_actions =     config.parser._option_string_actions
+    @override
+    def snapshot(self) -> Dict[str, CommandEntry]:
+        """# Copy Registered Command Entries.
+
+        ## Returns:
+            * Dict[str, CommandEntry]:  Copy of command entries, unaffected by later registrations.
+        """
+        self._publish_()
+        return self._entries_.copy()
 
     # HELPERS ======================================================================================
 
+    def _add_parser_(self,
+        subparser:  _SubParsersAction,
+        entry:      CommandEntry,
+        arguments:  bool =              True
+    ) -> Optional[ArgumentParser]:
+        """# Add Command Parser.
+
+        ## Args:
+            * subparser (_SubParsersAction):    Command sub-parser of parent parser.
+            * entry     (CommandEntry):         Command whose parser is added.
+            * arguments (bool):                 Define command's arguments. Defaults to True.
+
+        ## Returns:
+            * ArgumentParser | None:    Command's parser, or None if command has no parser handler.
+        """
+        # If command is described by metadata, expose it without importing it.
+        if entry.name is not None and (entry.specification is not None or not arguments):
+
+            # Debug action.
+            self.__logger__.debug(f"Rebuilding arguments for {entry.id} from metadata")
+
+            # Create parser.
+            parser: ArgumentParser =            subparser.add_parser(
+                                                    name =          entry.name,
+                                                    help =          entry.help,
+                                                    description =   entry.help
+                                                )
+
+            # Rebuild its arguments if requested.
+            if arguments: rebuild_parser(specification = entry.specification, parser = parser)
+
+            # Provide parser.
+            return parser
+
+        # Placeholders without a name were registered without a parser handler, as are others
+        # whose configuration is undefined.
+        if (entry.name is None and not entry.is_resolved) or entry.config is None: return None
+
+        # Debug action.
+        self.__logger__.debug(f"Registering arguments for {entry.id}")
+
+        # Create config instance (builds its full parser with all arguments).
+        config: CommandConfig =             entry.config()
+
+        # Create a new parser.
+        parser: ArgumentParser =            subparser.add_parser(
+                                                name =          config.parser_id,
+                                                help =          config.parser_help,
+                                                description =   config.parser_help
+                                            )
+
+        # If only listing command, its arguments are not needed.
+        if not arguments: return parser
+
+        # Copy ALL the internals from the pre-built parser
+        parser._actions =                   config.parser._actions
+        parser._action_groups =             config.parser._action_groups
+        parser._mutually_exclusive_groups = config.parser._mutually_exclusive_groups
+        parser._defaults =                  config.parser._defaults
+        parser._subparsers =                config.parser._subparsers
+        parser._option_string_actions =     config.parser._option_string_actions
+
+        # Provide parser.
+        return parser
+
+    @override
+    def _load_(self,
+        workers:    int =   1
+    ) -> None:
+        """# Load Commands of Package & Plugins.
+
+        ## Args:
+            * workers   (int):  Number of threads importing modules. Defaults to 1 (serially).
+        """
+        # Load commands of package.
+        super(CommandRegistry, self)._load_(workers = workers)
+
+        # Load plugin commands (after manifests are cached, as plugins are not part of package).
+        self._load_plugins_()
+
+    def _load_plugins_(self) -> None:
+        """# Load Plugin Commands.
+
+        Plugin commands are registered as placeholders, from (indexed) entry-point metadata only.
+        """
+        from gel.registration.core.manifest import read_plugins
+
+        # Register plugins as one (under write lock, so that no command is registered meanwhile).
+        with self._write_lock_:
+
+            # Initialize placeholders.
+            placeholders:   Dict[str, CommandEntry] =   {}
+
+            # For each command advertised by an installed distribution...
+            for plugin in read_plugins(group = PLUGIN_GROUP):
+
+                # Commands of package (& plugins listed earlier) take precedence over plugins.
+                if plugin["name"] in self._latest_() or plugin["name"] in placeholders:
+
+                    # Warn of conflict.
+                    self.__logger__.warning(
+                        f"Plugin command {plugin['name']} ({plugin['value']}) is already "
+                        "registered, skipping"
+                    )
+                    continue
+
+                # Debug action.
+                self.__logger__.debug(f"Registering plugin command {plugin['name']}")
+
+                # Create placeholder, described by its distribution's summary.
+                placeholders[plugin["name"]] =  self._create_entry_(
+                                                    id =        plugin["name"],
+                                                    namespace = "gel",
+                                                    module =    plugin["module"],
+                                                    name =      plugin["name"],
+                                                    help =      plugin["help"],
+                                                    logger =    self.__logger__
+                                                )
+
+            # Register placeholders (all at once).
+            self._add_entries_(entries = placeholders.values())
+
     @override
     def _create_entry_(self, **kwargs) -> CommandEntry:
         """# Create Command Entry.
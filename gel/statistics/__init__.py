@@ -4,8 +4,123 @@ Implementations of statistics-related utilities/components.
 """
 
 __all__ =   [
+                # Binning
+                "bin_edges",
+                "binned_divergences",
+                "histograms",
+
+                # Cache
+                "DivergenceCache",
+
+                # Continuous
+                "ContinuousDivergence",
+                "KDEDivergence",
+                "KNNDivergence",
+
                 # Divergence
+                "cross_entropy",
+                "D_B",
+                "D_H",
+                "D_JS",
                 "D_KL",
+                "D_PSI",
+                "D_R",
+                "D_TV",
+                "divergences",
+
+                # Drift
+                "DriftMonitor",
+
+                # Exceptions
+                "DistributionError",
+                "NegativeProbabilityError",
+                "NonFiniteProbabilityError",
+                "ShapeMismatchError",
+                "ZeroMassError",
+
+                # Pairwise
+                "pairwise_divergence",
+
+                # Resampling
+                "bootstrap_divergence",
+                "ConfidenceInterval",
+                "permutation_test",
+                "PermutationTest",
+
+                # Sparse
+                "sparse_divergences",
+
+                # Streaming
+                "StreamingDivergence",
+
+                # Validation
+                "validate_distributions",
             ]
 
-from gel.statistics.divergence  import *
\ No newline at end of file
+from importlib  import import_module
+from typing     import Any, Dict, List
+
+# Submodule defining each public name. Submodules (& NumPy/SciPy with them) are only imported once
+# one of their names is first accessed, so that importing the package itself costs next to nothing.
+_EXPORTS_:  Dict[str, str] =    {
+                                    "bin_edges":                    "binning",
+                                    "binned_divergences":           "binning",
+                                    "histograms":                   "binning",
+                                    "DivergenceCache":              "cache",
+                                    "ContinuousDivergence":         "continuous",
+                                    "KDEDivergence":                "continuous",
+                                    "KNNDivergence":                "continuous",
+                                    "cross_entropy":                "divergence",
+                                    "D_B":                          "divergence",
+                                    "D_H":                          "divergence",
+                                    "D_JS":                         "divergence",
+                                    "D_KL":                         "divergence",
+                                    "D_PSI":                        "divergence",
+                                    "D_R":                          "divergence",
+                                    "D_TV":                         "divergence",
+                                    "divergences":                  "divergence",
+                                    "DriftMonitor":                 "drift",
+                                    "DistributionError":            "exceptions",
+                                    "NegativeProbabilityError":     "exceptions",
+                                    "NonFiniteProbabilityError":    "exceptions",
+                                    "ShapeMismatchError":           "exceptions",
+                                    "ZeroMassError":                "exceptions",
+                                    "pairwise_divergence":          "pairwise",
+                                    "bootstrap_divergence":         "resampling",
+                                    "ConfidenceInterval":           "resampling",
+                                    "permutation_test":             "resampling",
+                                    "PermutationTest":              "resampling",
+                                    "sparse_divergences":           "sparse",
+                                    "StreamingDivergence":          "streaming",
+                                    "validate_distributions":       "validation",
+                                }
+
+
+def __getattr__(
+    name:   str
+) -> Any:
+    """# Import Public Name on First Access.
+
+    ## Args:
+        * name  (str):  Name being accessed.
+
+    ## Raises:
+        * AttributeError:   If name is not exported by the package.
+
+    ## Returns:
+        * Any:  Object bound to name in its submodule.
+    """
+    # If name is not exported, report error.
+    if name not in _EXPORTS_:
+        raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+
+    # Import name from its submodule & cache it, so that later accesses bypass this hook.
+    globals()[name] = value = getattr(import_module(f"{__name__}.{_EXPORTS_[name]}"), name)
+
+    # Provide object.
+    return value
+
+
+def __dir__() -> List[str]:
+    """# List Package Attributes (Including Names Not Yet Imported)."""
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,311 @@
+"""# gel.statistics.binning
+
+Histogram front end, turning raw samples into aligned distributions for the divergence engine.
+
+Samples of P & Q are stacked once, binned against shared edges (or categories) in a single
+vectorized pass, & counted by a single `bincount` over (operand, column, bin) keys, so both
+histograms of every column come out of one pass & are aligned by construction.
+"""
+
+__all__ =   [
+                "bin_edges",
+                "binned_divergences",
+                "histograms",
+            ]
+
+from typing                     import Dict, Literal, Optional, Sequence, Tuple, Union
+from zlib                       import crc32
+
+from numpy                      import (
+                                    arange, array, asarray, bincount, clip, concatenate, empty,
+                                    float64, full, inf, intp, linspace, maximum, minimum, quantile,
+                                    searchsorted, subtract, unique, where
+                                )
+from numpy.typing               import NDArray
+
+from gel.statistics.divergence  import divergences
+
+# Binning strategies.
+Strategy =  Literal["fixed", "quantile", "categorical"]
+
+# Number of values binned per block, chosen to keep temporaries cache-resident.
+_BLOCK_ELEMENTS_:   int =   1 << 16
+
+
+def bin_edges(
+    P:          NDArray,
+    Q:          NDArray,
+    bins:       int =                               10,
+    strategy:   Literal["fixed", "quantile"] =      "fixed",
+    range:      Optional[Tuple[float, float]] =     None
+) -> NDArray:
+    """# Compute Shared Bin Edges.
+
+    ## Args:
+        * P         (NDArray):              (n,) or (n, C) samples of P.
+        * Q         (NDArray):              (m,) or (m, C) samples of Q.
+        * bins      (int):                  Number of bins (B). Defaults to 10.
+        * strategy  (str):                  "fixed" for equal-width bins spanning the joint range
+                                            of both samples (or `range`), or "quantile" for bins
+                                            holding equal shares of Q (the reference). Defaults to
+                                            "fixed".
+        * range     (Tuple[float, float]):  Lower & upper edges of "fixed" bins. Defaults to the
+                                            joint minimum & maximum of each column.
+
+    ## Raises:
+        * ValueError:   If strategy is unknown.
+
+    ## Returns:
+        * NDArray:  (B + 1,) edges, or (C, B + 1) edges of each column.
+    """
+    # View samples as (n, C) columns.
+    p, q, vector =  _columns_(P, Q)
+
+    # Quantile edges split the reference into equal shares.
+    if strategy == "quantile":
+        edges:  NDArray =   quantile(q, linspace(0, 1, bins + 1), axis = 0).T
+
+    # Fixed edges span the joint (or requested) range.
+    elif strategy == "fixed":
+
+        # Determine range of each column.
+        low:    NDArray =   full(p.shape[1], range[0]) if range else minimum(
+                                p.min(axis = 0, initial = inf), q.min(axis = 0, initial = inf)
+                            )
+        high:   NDArray =   full(p.shape[1], range[1]) if range else maximum(
+                                p.max(axis = 0, initial = -inf), q.max(axis = 0, initial = -inf)
+                            )
+
+        # Space edges equally over range.
+        edges:  NDArray =   linspace(low, high, bins + 1, axis = 1)
+
+    # Otherwise, report unknown strategy.
+    else: raise ValueError(
+        f"""Unknown binning strategy "{strategy}", expected "fixed" or "quantile\""""
+    )
+
+    # Provide edges.
+    return edges[0] if vector else edges
+
+
+def binned_divergences(
+    P:          NDArray,
+    Q:          NDArray,
+    measures:   Sequence[str] =                     ("kl",),
+    bins:       Optional[int] =                     10,
+    strategy:   Strategy =                          "fixed",
+    edges:      Optional[NDArray] =                 None,
+    range:      Optional[Tuple[float, float]] =     None,
+    smoothing:  float =                             0.0,
+    **kwargs
+) -> Dict[str, Union[float, NDArray]]:
+    """# Compute Divergences between Binned Samples.
+
+    ## Args:
+        * P         (NDArray):              (n,) or (n, C) samples of P.
+        * Q         (NDArray):              (m,) or (m, C) samples of Q.
+        * measures  (Sequence[str]):        Measures to compute (see `divergences`). Defaults to
+                                            ("kl",).
+        * bins      (int | None):           Number of bins (see `histograms`). Defaults to 10.
+        * strategy  (str):                  Binning strategy (see `histograms`). Defaults to
+                                            "fixed".
+        * edges     (NDArray | None):       Precomputed edges (see `histograms`).
+        * range     (Tuple[float, float]):  Range of "fixed" bins (see `bin_edges`).
+        * smoothing (float):                Pseudo-count added to every bin of both histograms.
+                                            Defaults to 0.
+        * kwargs:                           Additional options forwarded to `divergences`.
+
+    ## Returns:
+        * Dict[str, float | NDArray]:   Mapping of measure names to their values, one per column.
+    """
+    # Build aligned histograms.
+    p, q =  histograms(P, Q, bins = bins, strategy = strategy, edges = edges, range = range)
+
+    # Evaluate measures over normalized histograms.
+    return divergences(
+        p + smoothing, q + smoothing, measures = measures, normalize = True, **kwargs
+    )
+
+
+def histograms(
+    P:          NDArray,
+    Q:          NDArray,
+    bins:       Optional[int] =                     10,
+    strategy:   Strategy =                          "fixed",
+    edges:      Optional[NDArray] =                 None,
+    range:      Optional[Tuple[float, float]] =     None
+) -> Tuple[NDArray, NDArray]:
+    """# Build Aligned Histograms.
+
+    ## Notes:
+        * Columns of (n, C) samples are binned independently (each against its own edges), so many
+          features are histogrammed at once.
+        * Values outside of the edges are counted in the outermost bins, so that no mass is lost
+          (e.g., when P drifts beyond the quantiles of Q).
+        * With the "categorical" strategy, values (of any type) are hashed into `bins` buckets with
+          a stable CRC-32 hash of their string form, or, if `bins` is None, given one bin per
+          distinct value observed in either sample. Only distinct values are ever hashed.
+
+    ## Args:
+        * P         (NDArray):              (n,) or (n, C) samples of P.
+        * Q         (NDArray):              (m,) or (m, C) samples of Q.
+        * bins      (int | None):           Number of bins (B). Defaults to 10.
+        * strategy  (str):                  "fixed", "quantile" (see `bin_edges`), or "categorical".
+                                            Defaults to "fixed".
+        * edges     (NDArray | None):       Precomputed (B + 1,) or (C, B + 1) edges, e.g. those of
+                                            a reference, which override `bins` & `strategy`.
+        * range     (Tuple[float, float]):  Range of "fixed" bins (see `bin_edges`).
+
+    ## Raises:
+        * ValueError:   If strategy is unknown, or samples have different numbers of columns.
+
+    ## Returns:
+        * NDArray:  (B,) or (C, B) bin counts of P.
+        * NDArray:  (B,) or (C, B) bin counts of Q.
+    """
+    # View samples as (n, C) columns.
+    p, q, vector =  _columns_(P, Q)
+
+    # Categorical values are binned by (hashed) identity, over both samples at once.
+    if edges is None and strategy == "categorical":
+        indices, bins = _categories_(concatenate([p, q]), bins)
+
+    # Numeric values are binned against shared edges.
+    else:
+
+        # Only edges computed here are known to be equally spaced.
+        uniform:    bool =      edges is None and strategy == "fixed"
+
+        # Compute edges if they were not provided.
+        if edges is None:   edges = bin_edges(p, q, bins = bins, strategy = strategy, range = range)
+
+        # View edges as (1, B + 1) shared or (C, B + 1) per-column edges.
+        edges:      NDArray =   asarray(edges, dtype = float64)
+        edges:      NDArray =   edges.reshape((-1, edges.shape[-1]))
+        bins:       int =       edges.shape[1] - 1
+
+        # Locate bin of each value, writing both operands into one buffer (P's rows first).
+        indices:    NDArray =   empty((len(p) + len(q), p.shape[1]), dtype = intp)
+        _digitize_(p, edges, uniform, out = indices[:len(p)])
+        _digitize_(q, edges, uniform, out = indices[len(p):])
+
+    # Key each value by operand, column, & bin (P's keys precede Q's).
+    columns:    int =       p.shape[1]
+    indices +=  arange(columns) * bins
+    indices[len(p):] += columns * bins
+
+    # Count both operands' bins in a single pass.
+    counts:     NDArray =   bincount(indices.ravel(), minlength = 2 * columns * bins).reshape(
+                                (2, columns, bins)
+                            )
+
+    # Provide histograms.
+    return (counts[0, 0], counts[1, 0]) if vector else (counts[0], counts[1])
+
+
+# HELPERS ==========================================================================================
+
+def _categories_(
+    samples:    NDArray,
+    bins:       Optional[int]
+) -> Tuple[NDArray, int]:
+    """# Locate Categorical Bins.
+
+    ## Args:
+        * samples   (NDArray):      (n, C) stacked samples of P & Q.
+        * bins      (int | None):   Number of hash buckets, or None for one bin per distinct value.
+
+    ## Returns:
+        * NDArray:  (n, C) bin index of each value.
+        * int:      Number of bins.
+    """
+    # Identify distinct values (sorted, so that exact bins are ordered by value).
+    values, inverse =   unique(samples, return_inverse = True)
+
+    # If exact bins are requested, each distinct value is its own bin.
+    if bins is None:    return inverse.reshape(samples.shape).astype(intp), len(values)
+
+    # Otherwise, hash distinct values into buckets.
+    buckets:    NDArray =   array(
+                                [crc32(str(value).encode()) % bins for value in values.tolist()],
+                                dtype = intp
+                            )
+
+    # Provide bucket of each value.
+    return buckets[inverse.reshape(samples.shape)], bins
+
+
+def _columns_(
+    P:  NDArray,
+    Q:  NDArray
+) -> Tuple[NDArray, NDArray, bool]:
+    """# View Samples as Columns.
+
+    ## Args:
+        * P (NDArray):  (n,) or (n, C) samples of P.
+        * Q (NDArray):  (m,) or (m, C) samples of Q.
+
+    ## Raises:
+        * ValueError:   If samples have different numbers of columns.
+
+    ## Returns:
+        * NDArray:  (n, C) samples of P.
+        * NDArray:  (m, C) samples of Q.
+        * bool:     True if samples were vectors.
+    """
+    # Convert samples to arrays.
+    p:  NDArray =   asarray(P)
+    q:  NDArray =   asarray(Q)
+
+    # If column counts differ, report error.
+    if p.shape[1:] != q.shape[1:]:
+        raise ValueError(f"Expected samples with matching columns, got {p.shape} & {q.shape}")
+
+    # Provide (n, C) views.
+    return  (
+                p.reshape((len(p), -1)),
+                q.reshape((len(q), -1)),
+                p.ndim == 1
+            )
+
+
+def _digitize_(
+    samples:    NDArray,
+    edges:      NDArray,
+    uniform:    bool,
+    out:        NDArray
+) -> None:
+    """# Locate Numeric Bins.
+
+    ## Args:
+        * samples   (NDArray):  (n, C) samples.
+        * edges     (NDArray):  (1, B + 1) shared edges, or (C, B + 1) edges of each column.
+        * uniform   (bool):     Edges are equally spaced, so bins are located arithmetically.
+        * out       (NDArray):  (n, C) buffer receiving the bin index of each value, clipped to
+                                [0, B).
+    """
+    # Determine number of bins.
+    bins:   int =   edges.shape[1] - 1
+
+    # Equal-width bins are located in O(1) per value (constant columns fall into the first bin).
+    if uniform:
+
+        # For each block of rows (sized to keep temporaries cache-resident)...
+        width:  NDArray =   edges[:, -1] - edges[:, 0]
+        scale:  NDArray =   bins / where(width > 0, width, 1)
+        step:   int =       max(1, _BLOCK_ELEMENTS_ // max(samples.shape[1], 1))
+        for start in range(0, len(samples), step):
+
+            # Scale offsets from lower edges (truncation only differs from flooring below zero,
+            # which is clipped regardless).
+            scaled:     NDArray =   subtract(samples[start:start + step], edges[:, 0])
+            scaled *=   scale
+            out[start:start + step] = scaled
+
+    # Otherwise, search each column's edges (the last edge is inclusive, as in `numpy.histogram`).
+    else:
+        for c in range(samples.shape[1]):
+            out[:, c] = searchsorted(edges[c % len(edges)], samples[:, c], side = "right") - 1
+
+    # Clip indices into range.
+    clip(out, 0, bins - 1, out = out)
@@ -0,0 +1,289 @@
+"""# gel.statistics.cache
+
+Opt-in memoization of divergence calls, keyed by the content of their operands.
+
+Operands are identified by a hash of their raw bytes (with dtype & shape), so that repeated
+comparisons of equal distributions cost one hashing pass instead of a full evaluation, even when
+they are held by different array objects. xxHash (XXH3-128) is used if the `xxhash` package is
+installed, otherwise BLAKE2b from the standard library.
+"""
+
+__all__ =   [
+                "DivergenceCache",
+            ]
+
+from collections                import OrderedDict
+from collections.abc            import Iterator
+from os                         import getpid, replace
+from pathlib                    import Path
+from threading                  import get_ident
+from typing                     import Any, Dict, Optional, Sequence, Union
+
+from numpy                      import ascontiguousarray, asarray, load, ndarray, savez
+from numpy.typing               import NDArray
+
+from gel.statistics.divergence  import _is_sparse_, divergences, Distribution
+
+# Prefer xxHash if available.
+try:                from xxhash     import xxh3_128 as _hasher_
+except ImportError: from hashlib    import blake2b  as _hasher_
+
+
+class DivergenceCache:
+    """# Divergence Cache.
+
+    Bounded, least-recently-used (LRU) cache of `divergences` results, optionally backed by an
+    on-disk store which outlives the process (& is shared by caches pointed at the same directory).
+
+    ## Notes:
+        * Streamed (iterator) & sparse operands are never cached, & are evaluated directly.
+        * Cached arrays are returned as read-only views, so that callers cannot corrupt them.
+
+    ## Example:
+    >>> cache = DivergenceCache(maxsize = 256, directory = "~/.cache/gel/divergences")
+    >>> cache.divergences(P, Q, measures = ("kl", "js"))    # Evaluated.
+    >>> cache.divergences(P.copy(), Q, measures = ("kl", "js"))    # Hashed only.
+    """
+
+    def __init__(self,
+        maxsize:    int =                           128,
+        directory:  Optional[Union[str, Path]] =    None
+    ):
+        """# Instantiate Divergence Cache.
+
+        ## Args:
+            * maxsize   (int):          Maximum number of results held in memory. Defaults to 128.
+            * directory (str | Path):   Directory of on-disk store. Defaults to None (memory only).
+        """
+        # Define properties.
+        self._maxsize_:     int =               maxsize
+        self._directory_:   Optional[Path] =    (
+                                                    None if directory is None else
+                                                    Path(directory).expanduser()
+                                                )
+
+        # Initialize store & statistics.
+        self._entries_:     OrderedDict =       OrderedDict()
+        self._hits_:        int =               0
+        self._misses_:      int =               0
+
+        # Create on-disk store if requested.
+        if self._directory_ is not None: self._directory_.mkdir(parents = True, exist_ok = True)
+
+    # PROPERTIES ===================================================================================
+
+    @property
+    def directory(self) -> Optional[Path]:
+        """# Directory of On-Disk Store"""
+        return self._directory_
+
+    @property
+    def hits(self) -> int:
+        """# Number of Calls Served from Cache"""
+        return self._hits_
+
+    @property
+    def maxsize(self) -> int:
+        """# Maximum Number of Results Held in Memory"""
+        return self._maxsize_
+
+    @property
+    def misses(self) -> int:
+        """# Number of Calls Evaluated"""
+        return self._misses_
+
+    # METHODS ======================================================================================
+
+    def clear(self,
+        disk:   bool =  False
+    ) -> None:
+        """# Clear Cache.
+
+        ## Args:
+            * disk  (bool): Also delete results from the on-disk store. Defaults to False.
+        """
+        # Clear memory.
+        self._entries_.clear()
+
+        # Clear disk if requested.
+        if disk and self._directory_ is not None:
+            for path in self._directory_.glob("*.npz"): path.unlink(missing_ok = True)
+
+    def divergences(self,
+        P:          Distribution,
+        Q:          Distribution,
+        measures:   Sequence[str] = ("kl",),
+        **kwargs
+    ) -> Dict[str, Union[float, NDArray]]:
+        """# Compute (or Recall) Divergences.
+
+        ## Args:
+            * P         (NDArray):          True probability distribution(s).
+            * Q         (NDArray):          Approximate probability distribution(s).
+            * measures  (Sequence[str]):    Measures to compute (see `divergences`). Defaults to
+                                            ("kl",).
+            * kwargs:                       Additional options forwarded to `divergences`.
+
+        ## Returns:
+            * Dict[str, float | NDArray]:   Mapping of measure names to their values.
+        """
+        # Streamed & sparse operands are evaluated directly.
+        if any(isinstance(X, Iterator) or _is_sparse_(X) for X in (P, Q)):
+            return divergences(P, Q, measures = measures, **kwargs)
+
+        # Compute key.
+        key:        str =   self.key(P, Q, measures = measures, **kwargs)
+
+        # Recall results from memory or disk if available.
+        results:    Optional[Dict[str, Any]] =  self._entries_.get(key)
+        if results is None: results = self._load_(key)
+
+        # If results were recalled, count hit.
+        if results is not None: self._hits_ += 1
+
+        # Otherwise, evaluate & persist them.
+        else:
+            self._misses_ +=    1
+            results =           {
+                                    measure: self._read_only_(result)
+                                    for measure, result in divergences(
+                                        P, Q, measures = measures, **kwargs
+                                    ).items()
+                                }
+            self._save_(key, results)
+
+        # Store results in memory, evicting least recently used results beyond capacity.
+        self._entries_[key] = results
+        self._entries_.move_to_end(key)
+        while len(self._entries_) > self._maxsize_: self._entries_.popitem(last = False)
+
+        # Provide (shallow copy of) results.
+        return dict(results)
+
+    def key(self,
+        P:          Distribution,
+        Q:          Distribution,
+        measures:   Sequence[str] = ("kl",),
+        **kwargs
+    ) -> str:
+        """# Compute Cache Key.
+
+        ## Args:
+            * P         (NDArray):          True probability distribution(s).
+            * Q         (NDArray):          Approximate probability distribution(s).
+            * measures  (Sequence[str]):    Measures to compute. Defaults to ("kl",).
+            * kwargs:                       Additional options forwarded to `divergences`.
+
+        ## Returns:
+            * str:  Hexadecimal digest of operands' contents & parameters.
+        """
+        # Initialize hasher.
+        hasher: Any =   _hasher_()
+
+        # Hash each operand's type, shape, & raw bytes (without copying contiguous arrays).
+        for X in (P, Q):
+            array:  ndarray =   ascontiguousarray(asarray(X))
+            hasher.update(f"{array.dtype.str}{array.shape}".encode())
+            hasher.update(array.data)
+
+        # Hash parameters.
+        hasher.update(repr((tuple(measures), sorted(kwargs.items()))).encode())
+
+        # Provide digest.
+        return hasher.hexdigest()
+
+    # HELPERS ======================================================================================
+
+    def _load_(self,
+        key:    str
+    ) -> Optional[Dict[str, Any]]:
+        """# Load Results from Disk.
+
+        ## Args:
+            * key   (str):  Cache key.
+
+        ## Returns:
+            * Dict[str, Any] | None:    Results, if stored.
+        """
+        # If there is no on-disk store or results are not in it, they cannot be loaded.
+        if self._directory_ is None or not (self._directory_ / f"{key}.npz").exists(): return None
+
+        # Load results (unwrapping scalars).
+        with load(self._directory_ / f"{key}.npz") as stored:
+            return {
+                measure: self._read_only_(result[()] if result.ndim == 0 else result)
+                for measure, result in ((measure, stored[measure]) for measure in stored.files)
+            }
+
+    def _save_(self,
+        key:        str,
+        results:    Dict[str, Any]
+    ) -> None:
+        """# Save Results to Disk.
+
+        ## Args:
+            * key       (str):              Cache key.
+            * results   (Dict[str, Any]):   Results being stored.
+        """
+        # If there is no on-disk store, results cannot be saved.
+        if self._directory_ is None: return
+
+        # Write to temporary file (unique to this process & thread), then move it into place (so
+        # that readers never see partial files, even while several writers save the same key).
+        temporary:  Path =  self._directory_ / f"{key}.{getpid()}.{get_ident()}.tmp"
+        with open(temporary, "wb") as file: savez(file, **results)
+        replace(temporary, self._directory_ / f"{key}.npz")
+
+    @staticmethod
+    def _read_only_(
+        result: Any
+    ) -> Any:
+        """# Lock Result.
+
+        ## Args:
+            * result    (Any):  Scalar or array result.
+
+        ## Returns:
+            * Any:  Scalar, or read-only array.
+        """
+        # Scalars are immutable.
+        if not isinstance(result, ndarray): return result
+
+        # Lock array.
+        result.flags.writeable = False
+
+        # Provide array.
+        return result
+
+    # DUNDERS ======================================================================================
+
+    def __call__(self,
+        P:          Distribution,
+        Q:          Distribution,
+        measures:   Sequence[str] = ("kl",),
+        **kwargs
+    ) -> Dict[str, Union[float, NDArray]]:
+        """# Compute (or Recall) Divergences.
+
+        ## Args:
+            * P         (NDArray):          True probability distribution(s).
+            * Q         (NDArray):          Approximate probability distribution(s).
+            * measures  (Sequence[str]):    Measures to compute (see `divergences`). Defaults to
+                                            ("kl",).
+            * kwargs:                       Additional options forwarded to `divergences`.
+
+        ## Returns:
+            * Dict[str, float | NDArray]:   Mapping of measure names to their values.
+        """
+        return self.divergences(P, Q, measures = measures, **kwargs)
+
+    def __len__(self) -> int:
+        """# Number of Results Held in Memory"""
+        return len(self._entries_)
+
+    def __repr__(self) -> str:
+        """# Cache Object Representation"""
+        return (
+            f"""<DivergenceCache(size = {len(self._entries_)}/{self._maxsize_}, """
+            f"""hits = {self._hits_}, misses = {self._misses_})>"""
+        )
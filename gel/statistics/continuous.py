@@ -0,0 +1,312 @@
+"""# gel.statistics.continuous
+
+Empirical divergence estimators for samples of continuous, multivariate distributions.
+"""
+
+__all__ =   [
+                "ContinuousDivergence",
+                "KDEDivergence",
+                "KNNDivergence",
+            ]
+
+from abc                import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from os                 import cpu_count
+from typing             import List, Optional
+
+from numpy              import asarray, bincount, concatenate, errstate, exp, float64, log, maximum
+from numpy.typing       import NDArray
+from scipy.spatial      import cKDTree
+
+class ContinuousDivergence(ABC):
+    """# Abstract Continuous Divergence Estimator.
+
+    Estimates D_KL(P || Q) between a sample of P & a fixed reference sample of Q. The reference's
+    KD-tree is built once, at instantiation, & reused by every subsequent estimate, so that many
+    samples may be compared against one baseline.
+    """
+
+    def __init__(self,
+        reference:  NDArray,
+        workers:    int =   1
+    ):
+        """# Instantiate Continuous Divergence Estimator.
+
+        ## Args:
+            * reference (NDArray):  (m, d) reference sample of Q (1-D samples are treated as d = 1).
+            * workers   (int):      Number of threads used by tree queries (-1 for all cores).
+                                    Defaults to 1.
+        """
+        # Define properties.
+        self._reference_:   NDArray =   self._as_samples_(reference)
+        self._workers_:     int =       workers
+
+        # Build reference tree.
+        self._tree_:        cKDTree =   cKDTree(self._reference_)
+
+    # PROPERTIES ===================================================================================
+
+    @property
+    def dimensions(self) -> int:
+        """# Sample Dimensionality"""
+        return self._reference_.shape[1]
+
+    @property
+    def reference(self) -> NDArray:
+        """# Reference Sample of Q"""
+        return self._reference_
+
+    @property
+    def tree(self) -> cKDTree:
+        """# Reference KD-Tree"""
+        return self._tree_
+
+    # METHODS ======================================================================================
+
+    @abstractmethod
+    def divergence(self,
+        samples:    NDArray
+    ) -> float:
+        """# Estimate Divergence.
+
+        ## Args:
+            * samples   (NDArray):  (n, d) sample of P.
+
+        ## Returns:
+            * float:    Estimate of D_KL(P || Q).
+        """
+        pass
+
+    # HELPERS ======================================================================================
+
+    def _as_samples_(self,
+        samples:    NDArray
+    ) -> NDArray:
+        """# View Samples as (n, d) Array.
+
+        ## Args:
+            * samples   (NDArray):  Sample of a distribution.
+
+        ## Raises:
+            * ValueError:   If sample dimensionality does not match the reference's.
+
+        ## Returns:
+            * NDArray:  (n, d) array of samples.
+        """
+        # View 1-D samples as single-dimension points.
+        samples:    NDArray =   asarray(samples, dtype = float64)
+        samples:    NDArray =   samples[:, None] if samples.ndim == 1 else samples
+
+        # If reference is defined & dimensionality does not match, report error.
+        if hasattr(self, "_reference_") and samples.shape[1] != self.dimensions:
+            raise ValueError(
+                f"Expected samples of dimension {self.dimensions}, got {samples.shape[1]}"
+            )
+
+        # Provide samples.
+        return samples
+
+    # DUNDERS ======================================================================================
+
+    def __call__(self,
+        samples:    NDArray
+    ) -> float:
+        """# Estimate Divergence.
+
+        ## Args:
+            * samples   (NDArray):  (n, d) sample of P.
+
+        ## Returns:
+            * float:    Estimate of D_KL(P || Q).
+        """
+        return self.divergence(samples = samples)
+
+
+class KDEDivergence(ContinuousDivergence):
+    """# Kernel Density Estimate (KDE) Divergence Estimator.
+
+    Estimates D_KL(P || Q) = E_P[log p(x) - log q(x)] by evaluating Gaussian kernel density
+    estimates of both distributions at each sample of P (leave-one-out for P's own estimate).
+    Kernels are truncated at `cutoff` bandwidths, so that densities are accumulated from sparse
+    KD-tree neighbourhood queries rather than all (n, m) pairs.
+    """
+
+    def __init__(self,
+        reference:  NDArray,
+        bandwidth:  Optional[float] =   None,
+        cutoff:     float =             3.0,
+        workers:    int =               1
+    ):
+        """# Instantiate KDE Divergence Estimator.
+
+        ## Args:
+            * reference (NDArray):      (m, d) reference sample of Q.
+            * bandwidth (float | None): Kernel bandwidth. Defaults to Scott's rule on the reference.
+            * cutoff    (float):        Kernel truncation radius, in bandwidths. Also floors each
+                                        density at that of a single neighbour at the cutoff, which
+                                        keeps estimates finite in sparse tails. Defaults to 3.
+            * workers   (int):          Number of threads used by tree queries (-1 for all cores).
+                                        Defaults to 1.
+        """
+        # Initialize estimator.
+        super(KDEDivergence, self).__init__(reference = reference, workers = workers)
+
+        # Define properties.
+        self._cutoff_:      float = cutoff
+        self._bandwidth_:   float = bandwidth or float(
+                                        self._reference_.std(axis = 0).mean()
+                                        * len(self._reference_) ** (-1 / (self.dimensions + 4))
+                                    )
+
+    # PROPERTIES ===================================================================================
+
+    @property
+    def bandwidth(self) -> float:
+        """# Kernel Bandwidth"""
+        return self._bandwidth_
+
+    # METHODS ======================================================================================
+
+    def divergence(self,
+        samples:    NDArray
+    ) -> float:
+        """# Estimate Divergence.
+
+        ## Args:
+            * samples   (NDArray):  (n, d) sample of P.
+
+        ## Returns:
+            * float:    Estimate of D_KL(P || Q).
+        """
+        # Build sample tree.
+        samples:    NDArray =   self._as_samples_(samples)
+        tree:       cKDTree =   cKDTree(samples)
+
+        # Accumulate kernel sums (excluding each sample's own kernel from P's estimate).
+        p_sums:     NDArray =   self._kernel_sums_(tree, tree, len(samples)) - 1
+        q_sums:     NDArray =   self._kernel_sums_(tree, self._tree_, len(samples))
+
+        # Floor densities at a single neighbour on the cutoff radius.
+        floor:      float =     exp(-self._cutoff_ ** 2 / 2)
+
+        # Kernel normalization constants cancel, leaving sample sizes.
+        return float(
+            log(maximum(p_sums, floor) / (len(samples) - 1)).mean()
+            - log(maximum(q_sums, floor) / len(self._reference_)).mean()
+        )
+
+    # HELPERS ======================================================================================
+
+    def _kernel_sums_(self,
+        queries:    cKDTree,
+        points:     cKDTree,
+        n:          int
+    ) -> NDArray:
+        """# Truncated Gaussian Kernel Sums.
+
+        ## Args:
+            * queries   (cKDTree):  Tree of points at which densities are evaluated.
+            * points    (cKDTree):  Tree of points contributing kernels.
+            * n         (int):      Number of query points.
+
+        ## Returns:
+            * NDArray:  (n,) sums of unnormalized kernels exp(-|x - y|^2 / 2h^2).
+        """
+        def sums(
+            start:  int,
+            stop:   int
+        ) -> NDArray:
+            """# Kernel Sums of a Range of Query Points."""
+            # Collect pairs within cutoff radius (querying a sub-tree unless range is complete).
+            pairs = (
+                        queries if stop - start == n else cKDTree(queries.data[start:stop])
+                    ).sparse_distance_matrix(
+                        other =         points,
+                        max_distance =  self._cutoff_ * self._bandwidth_,
+                        output_type =   "ndarray"
+                    )
+
+            # Accumulate kernels of each query point.
+            return bincount(
+                pairs["i"], weights = exp(-(pairs["v"] / self._bandwidth_) ** 2 / 2),
+                minlength = stop - start
+            )
+
+        # Split query points into one range per worker (tree traversals release the GIL).
+        workers:    int =       min(
+                                    max(n, 1),
+                                    (cpu_count() or 1) if self._workers_ == -1 else self._workers_
+                                )
+        bounds:     List[int] = [n * worker // workers for worker in range(workers + 1)]
+
+        # If tree queries are serial, accumulate all kernels at once.
+        if workers <= 1: return sums(0, n)
+
+        # Otherwise, accumulate ranges in parallel.
+        with ThreadPoolExecutor(max_workers = workers) as pool:
+            return concatenate(list(pool.map(sums, bounds[:-1], bounds[1:])))
+
+
+class KNNDivergence(ContinuousDivergence):
+    """# k-Nearest-Neighbour (k-NN) Divergence Estimator.
+
+    Estimates D_KL(P || Q) with the Wang-Kulkarni-Verdú estimator,
+
+        D = (d / n) sum_i log(nu_k(i) / rho_k(i)) + log(m / (n - 1)),
+
+    where rho_k(i) is the distance from x_i to its k-th nearest neighbour among the other samples
+    of P, & nu_k(i) is the distance from x_i to its k-th nearest neighbour in the reference.
+    """
+
+    def __init__(self,
+        reference:  NDArray,
+        k:          int =   1,
+        workers:    int =   1
+    ):
+        """# Instantiate k-NN Divergence Estimator.
+
+        ## Args:
+            * reference (NDArray):  (m, d) reference sample of Q.
+            * k         (int):      Neighbour rank used by the estimator. Defaults to 1.
+            * workers   (int):      Number of threads used by tree queries (-1 for all cores).
+                                    Defaults to 1.
+        """
+        # Initialize estimator.
+        super(KNNDivergence, self).__init__(reference = reference, workers = workers)
+
+        # Define properties.
+        self._k_:   int =   k
+
+    # PROPERTIES ===================================================================================
+
+    @property
+    def k(self) -> int:
+        """# Neighbour Rank"""
+        return self._k_
+
+    # METHODS ======================================================================================
+
+    def divergence(self,
+        samples:    NDArray
+    ) -> float:
+        """# Estimate Divergence.
+
+        ## Args:
+            * samples   (NDArray):  (n, d) sample of P.
+
+        ## Returns:
+            * float:    Estimate of D_KL(P || Q).
+        """
+        # View samples as (n, d) array.
+        samples:    NDArray =   self._as_samples_(samples)
+        n, d =                  samples.shape
+
+        # Query k-th neighbour distances within P (skipping each sample itself) & within Q.
+        rho, _ =    cKDTree(samples).query(samples, k = [self._k_ + 1], workers = self._workers_)
+        nu, _ =     self._tree_.query(samples, k = [self._k_], workers = self._workers_)
+
+        # Compute estimate (duplicate samples yield zero distances, hence infinite log-ratios).
+        with errstate(divide = "ignore"):
+            return float(
+                d * log(nu[:, 0] / rho[:, 0]).mean() + log(len(self._reference_) / (n - 1))
+            )
@@ -1,46 +1,860 @@
 """# gel.statistics.divergence
 
 Divergence calculation methods.
+
+All measures are evaluated by a shared, vectorized engine (`divergences`) which normalizes its
+inputs at most once and computes each intermediate quantity (logarithms, mixtures, Bhattacharyya
+terms) at most once per call, regardless of how many measures are requested.
 """
 
 __all__ =   [
+                # Engine
+                "divergences",
+
+                # Measures
+                "cross_entropy",
+                "D_B",
+                "D_H",
+                "D_JS",
                 "D_KL",
+                "D_PSI",
+                "D_R",
+                "D_TV",
             ]
 
-from typing         import Sequence, Union
+from collections.abc            import Iterator
+from functools                  import cached_property
+from itertools                  import repeat
+from typing                     import (
+                                    Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+                                )
+
+from numpy                      import (
+                                    absolute, add, asanyarray, asarray, atleast_1d,
+                                    broadcast_shapes, concatenate, errstate, exp, float64, full,
+                                    inf, isfinite, log, maximum, memmap, multiply, sqrt, where,
+                                    zeros
+                                )
+from numpy.typing               import DTypeLike, NDArray
+
+from gel.statistics.validation  import validate_distributions
+
+# Type of distribution arguments accepted by divergence functions.
+Distribution =  Union[NDArray, Sequence[Union[int, float]], Iterator[NDArray]]
+
+# Approximate size (in bytes) of the chunks read from memory-mapped operands.
+_CHUNK_BYTES_:  int =   1 << 26
+
+
+class _Operands_:
+    """# Divergence Operands.
+
+    Holds a pair of (broadcast-compatible) distributions & lazily caches the intermediate arrays
+    shared between measures, so that each is computed at most once per engine call.
+    """
+
+    def __init__(self,
+        p:          NDArray,
+        q:          NDArray,
+        axis:       int,
+        alpha:      float,
+        reducer:            Optional[Callable[[NDArray], NDArray]] =    None,
+        log_space:          bool =                                      False,
+        accumulate_dtype:   DTypeLike =                                 float64
+    ):
+        """# Instantiate Divergence Operands.
+
+        ## Args:
+            * p                 (NDArray):          True probability distribution(s).
+            * q                 (NDArray):          Approximate probability distribution(s).
+            * axis              (int):              Axis along which distributions are laid out.
+            * alpha             (float):            Order of Rényi divergence.
+            * reducer           (Callable | None):  Reduction of element-wise terms into
+                                                    divergences. Defaults to summation along `axis`.
+            * log_space         (bool):             `p` & `q` are log-probabilities. Defaults to
+                                                    False.
+            * accumulate_dtype  (DTypeLike):        Precision of the default reduction. Defaults to
+                                                    float64.
+        """
+        # Seed cache with operands in the space in which they were provided.
+        self.__dict__.update({"log_p": p, "log_q": q} if log_space else {"p": p, "q": q})
+
+        # Define properties.
+        self.log_space: bool =      log_space
+        self.axis:      int =       axis
+        self.alpha:     float =     alpha
+        self.reducer:   Callable =  reducer or (
+                                        lambda terms: terms.sum(
+                                            axis = self.axis, dtype = accumulate_dtype
+                                        )
+                                    )
+
+        # Initialize cache of reduced terms.
+        self.sums:  Dict[str, NDArray] =    {}
+
+    # PROPERTIES ===================================================================================
+
+    @cached_property
+    def p(self) -> NDArray:
+        """# P (Linear Space)"""
+        return exp(self.log_p)
+
+    @cached_property
+    def q(self) -> NDArray:
+        """# Q (Linear Space)"""
+        return exp(self.log_q)
+
+    @cached_property
+    def log_p(self) -> NDArray:
+        """# Log of P"""
+        return log(self.p)
+
+    @cached_property
+    def log_q(self) -> NDArray:
+        """# Log of Q"""
+        return log(self.q)
+
+    @cached_property
+    def m(self) -> NDArray:
+        """# Mixture of P & Q"""
+        return (self.p + self.q) / 2
+
+    @cached_property
+    def log_m(self) -> NDArray:
+        """# Log of Mixture of P & Q"""
+        return log(self.m)
+
+    @cached_property
+    def dtype(self) -> DTypeLike:
+        """# Element-Wise Precision"""
+        return (self.log_p if self.log_space else self.p).dtype
+
+    @cached_property
+    def shape(self) -> Tuple[int, ...]:
+        """# Broadcast Shape of P & Q"""
+        return broadcast_shapes(*(
+            (self.log_p.shape, self.log_q.shape) if self.log_space else (self.p.shape, self.q.shape)
+        ))
+
+    # METHODS ======================================================================================
+
+    def reduce(self,
+        key:    str,
+        terms:  Callable[["_Operands_"], NDArray]
+    ) -> NDArray:
+        """# Reduce Terms.
+
+        Sum element-wise terms along the distribution axis, caching the result under `key` so that
+        measures sharing a reduction (e.g., Hellinger & Bhattacharyya) only pay for it once.
+
+        ## Args:
+            * key   (str):      Identifier of reduction.
+            * terms (Callable): Element-wise term generator, given these operands.
+
+        ## Returns:
+            * NDArray:  Reduced terms.
+        """
+        # If reduction has not been computed yet, compute it.
+        if key not in self.sums: self.sums[key] = self.reducer(terms(self))
+
+        # Provide reduction.
+        return self.sums[key]
+
+    def weighted(self,
+        weight:     NDArray,
+        values:     NDArray
+    ) -> NDArray:
+        """# Weighted Terms.
+
+        Compute `weight * values`, treating terms with zero weight as zero (0 * log 0 = 0).
+
+        ## Args:
+            * weight    (NDArray):  Weights (probabilities).
+            * values    (NDArray):  Values being weighted (log terms).
+
+        ## Returns:
+            * NDArray:  Weighted terms.
+        """
+        return multiply(
+            weight, values, out = zeros(self.shape, dtype = self.dtype), where = weight > 0
+        )
+
+
+# ELEMENT-WISE TERMS ===============================================================================
+
+def _kl_terms_(o: _Operands_) -> NDArray:
+    """# KL Divergence Terms: p (log p - log q)"""
+    return o.weighted(o.p, o.log_p - o.log_q)
+
+
+def _reverse_kl_terms_(o: _Operands_) -> NDArray:
+    """# Reverse KL Divergence Terms: q (log q - log p)"""
+    return o.weighted(o.q, o.log_q - o.log_p)
+
+
+def _cross_entropy_terms_(o: _Operands_) -> NDArray:
+    """# Cross-Entropy Terms: -p log q"""
+    return o.weighted(o.p, -o.log_q)
+
+
+def _js_terms_(o: _Operands_) -> NDArray:
+    """# Jensen-Shannon Divergence Terms: (p (log p - log m) + q (log q - log m)) / 2"""
+    return (o.weighted(o.p, o.log_p - o.log_m) + o.weighted(o.q, o.log_q - o.log_m)) / 2
+
+
+def _bc_terms_(o: _Operands_) -> NDArray:
+    """# Bhattacharyya Coefficient Terms: sqrt(p q)"""
+    return exp((o.log_p + o.log_q) / 2) if o.log_space else sqrt(o.p * o.q)
+
+
+def _tv_terms_(o: _Operands_) -> NDArray:
+    """# Total Variation Distance Terms: |p - q| / 2"""
+    return absolute(o.p - o.q) / 2
+
+
+def _renyi_terms_(o: _Operands_) -> NDArray:
+    """# Rényi Divergence Terms: p^alpha q^(1 - alpha)"""
+    # In log space, exponentiate the combined logs (terms where log p = -inf are zero).
+    if o.log_space: return exp(add(
+                        o.alpha * o.log_p, (1 - o.alpha) * o.log_q,
+                        out =   full(o.shape, -inf, dtype = o.dtype),
+                        where = o.log_p > -inf
+                    ))
+
+    # Otherwise, raise operands to their powers.
+    return o.weighted(o.p ** o.alpha, o.q ** (1 - o.alpha))
+
+
+# MEASURES =========================================================================================
+
+def _kl_(o: _Operands_) -> NDArray:
+    """# Kullback-Leibler Divergence"""
+    return o.reduce("kl", _kl_terms_)
+
+
+def _cross_entropy_(o: _Operands_) -> NDArray:
+    """# Cross-Entropy"""
+    return o.reduce("cross_entropy", _cross_entropy_terms_)
+
+
+def _js_(o: _Operands_) -> NDArray:
+    """# Jensen-Shannon Divergence"""
+    return o.reduce("js", _js_terms_)
+
+
+def _hellinger_(o: _Operands_) -> NDArray:
+    """# Hellinger Distance"""
+    return sqrt(maximum(1 - o.reduce("bc", _bc_terms_), 0))
+
+
+def _bhattacharyya_(o: _Operands_) -> NDArray:
+    """# Bhattacharyya Distance"""
+    return -log(o.reduce("bc", _bc_terms_))
+
+
+def _tv_(o: _Operands_) -> NDArray:
+    """# Total Variation Distance"""
+    return o.reduce("tv", _tv_terms_)
+
+
+def _psi_(o: _Operands_) -> NDArray:
+    """# Population Stability Index"""
+    return _kl_(o) + o.reduce("reverse_kl", _reverse_kl_terms_)
+
+
+def _renyi_(o: _Operands_) -> NDArray:
+    """# Rényi Divergence"""
+    # Rényi divergence of order 1 is the KL divergence.
+    if o.alpha == 1: return _kl_(o)
+
+    # Otherwise, compute log of power sum.
+    return log(o.reduce("renyi", _renyi_terms_)) / (o.alpha - 1)
+
+
+# Mapping of measure names to their implementations.
+_MEASURES_: Dict[str, Callable[[_Operands_], NDArray]] =    {
+                                                                "bhattacharyya":    _bhattacharyya_,
+                                                                "cross_entropy":    _cross_entropy_,
+                                                                "hellinger":        _hellinger_,
+                                                                "js":               _js_,
+                                                                "kl":               _kl_,
+                                                                "psi":              _psi_,
+                                                                "renyi":            _renyi_,
+                                                                "tv":               _tv_,
+                                                            }
+
+
+# ENGINE ===========================================================================================
+
+def divergences(
+    P:                  Distribution,
+    Q:                  Distribution,
+    measures:           Sequence[str] = ("kl",),
+    axis:               int =           -1,
+    normalize:          bool =          False,
+    alpha:              float =         0.5,
+    epsilon:            float =         0.0,
+    log_space:          bool =          False,
+    chunk_size:         Optional[int] = None,
+    dtype:              DTypeLike =     float64,
+    accumulate_dtype:   DTypeLike =     float64,
+    validate:           bool =          True
+) -> Dict[str, Union[float, NDArray]]:
+    """# Compute Divergences.
+
+    Evaluate several divergence measures between `P` & `Q` in one call, sharing normalization and
+    intermediate (log, mixture, Bhattacharyya) passes between them.
+
+    ## Notes:
+        * If either operand is a `scipy.sparse` vector/matrix, or an (indices, values) pair (a
+          tuple of integer indices & their values), evaluation is delegated to
+          `sparse_divergences`, which only visits stored entries (rows are distributions).
+        * With `log_space`, `P` & `Q` are log-probabilities (e.g., log-softmax outputs). Logs are
+          used as given, normalization is performed with log-sum-exp, & linear-space operands are
+          only materialized for the measures which weight by them.
+        * Operands which are `numpy.memmap` arrays or iterators of chunks (e.g., blocks of rows
+          read from disk) are reduced chunk by chunk, so peak memory is bounded by the chunk size.
+          Chunks split the leading (batch) axis, which is never the distribution axis, so results
+          are identical to those of the in-memory path.
+        * Element-wise work is performed in `dtype` & reductions accumulate in `accumulate_dtype`
+          (NumPy's pairwise summation). Passing float32 data with `dtype = float32` avoids an
+          up-cast copy & halves memory traffic, while float64 accumulation preserves accuracy.
+        * Validation shares its reductions with normalization. Trusted hot loops may skip it with
+          `validate = False`, in which case invalid inputs propagate as inf/nan.
+
+    ## Args:
+        * P                 (NDArray):          True probability distribution(s).
+        * Q                 (NDArray):          Approximate probability distribution(s).
+        * measures          (Sequence[str]):    Measures to compute, any of "bhattacharyya",
+                                                "cross_entropy", "hellinger", "js", "kl", "psi",
+                                                "renyi", & "tv". Defaults to ("kl",).
+        * axis              (int):              Axis along which distributions are laid out.
+                                                Defaults to -1.
+        * normalize         (bool):             Scale `P` & `Q` to sum to one along `axis` before
+                                                computing. Defaults to False.
+        * alpha             (float):            Order of Rényi divergence. Defaults to 0.5.
+        * epsilon           (float):            Probability assigned to entries where Q is zero but
+                                                P is not (Q is renormalized afterwards if
+                                                `normalize`). Defaults to 0, leaving such
+                                                divergences infinite.
+        * log_space         (bool):             `P` & `Q` are log-probabilities. Defaults to False.
+        * chunk_size        (int | None):       Distributions (leading rows) per chunk. Defaults to
+                                                None, chunking only memory-mapped operands, by
+                                                ~64 MiB.
+        * dtype             (DTypeLike):        Precision of element-wise work. Defaults to float64.
+        * accumulate_dtype  (DTypeLike):        Precision of reductions. Defaults to float64.
+        * validate          (bool):             Verify that `P` & `Q` broadcast, are non-negative,
+                                                finite, & have non-zero mass. Defaults to True.
+
+    ## Raises:
+        * DistributionError:    If `validate` & either operand is invalid (see
+                                `validate_distributions`).
+        * ValueError:           If an unknown measure is requested, log-space operands are sparse,
+                                or chunking would split the distribution axis.
+
+    ## Returns:
+        * Dict[str, float | NDArray]:   Mapping of measure names to their values.
+    """
+    # If either distribution is sparse, evaluate over stored entries only.
+    if _is_sparse_(P) or _is_sparse_(Q):
+
+        # Sparse operands store probabilities; their implicit zeros have no log-space analog.
+        if log_space: raise ValueError("Log-space operands cannot be sparse")
+
+        # Load sparse engine.
+        from gel.statistics.sparse  import sparse_divergences
+
+        # Evaluate measures.
+        return sparse_divergences(
+            P, Q, measures = measures, normalize = normalize, alpha = alpha, epsilon = epsilon,
+            validate = validate
+        )
+
+    # If operands are streamed, memory-mapped (with a batch axis to chunk), or chunking is
+    # requested, reduce chunk by chunk.
+    if  chunk_size is not None or any(isinstance(X, Iterator) for X in (P, Q)) or \
+        (any(isinstance(X, memmap) for X in (P, Q)) and _is_batched_(P, Q, axis)):
+
+        # Initialize results.
+        results:    Dict[str, List[NDArray]] =  {measure: [] for measure in measures}
+
+        # For each pair of chunks...
+        for p, q in _chunks_(P, Q, axis = axis, chunk_size = chunk_size):
+
+            # Evaluate measures on chunk (as plain in-memory arrays).
+            for measure, result in divergences(
+                asarray(p), asarray(q), measures = measures, axis = axis, normalize = normalize,
+                alpha = alpha, epsilon = epsilon, log_space = log_space, dtype = dtype,
+                accumulate_dtype = accumulate_dtype, validate = validate
+            ).items(): results[measure].append(atleast_1d(result))
+
+        # Provide concatenated results.
+        return {measure: concatenate(result) for measure, result in results.items()}
+
+    # Convert distributions to arrays (without copying existing arrays).
+    p:  NDArray =   asarray(P, dtype = dtype)
+    q:  NDArray =   asarray(Q, dtype = dtype)
+
+    # Express axis relative to the trailing dimension, so that it is valid for broadcast operands.
+    axis:   int =   axis % max(p.ndim, q.ndim, 1) - max(p.ndim, q.ndim, 1)
+
+    # Validate (& normalize) distributions if requested.
+    if validate:    p, q =  validate_distributions(
+                                p, q, axis = axis, normalize = normalize, log_space = log_space,
+                                accumulate_dtype = accumulate_dtype
+                            )
+
+    # Otherwise, normalize distributions if requested.
+    elif normalize: p, q =  (
+                                _normalize_(p, axis, log_space, accumulate_dtype),
+                                _normalize_(q, axis, log_space, accumulate_dtype)
+                            )
+
+    # Smooth Q if requested.
+    if epsilon > 0: q = _smooth_(p, q, epsilon, axis, normalize, log_space, accumulate_dtype)
+
+    # Evaluate measures.
+    return _evaluate_(_Operands_(
+        p = p, q = q, axis = axis, alpha = alpha, log_space = log_space,
+        accumulate_dtype = accumulate_dtype
+    ), measures)
+
+
+def _evaluate_(
+    operands:   _Operands_,
+    measures:   Sequence[str]
+) -> Dict[str, Union[float, NDArray]]:
+    """# Evaluate Measures.
+
+    ## Args:
+        * operands  (_Operands_):       Prepared (normalized) operands.
+        * measures  (Sequence[str]):    Measures to compute.
+
+    ## Raises:
+        * ValueError:   If an unknown measure is requested.
+
+    ## Returns:
+        * Dict[str, float | NDArray]:   Mapping of measure names to their values.
+    """
+    # Verify measures requested.
+    for measure in measures:
+
+        # If measure is not known, report error.
+        if measure not in _MEASURES_:   raise ValueError(
+                                            f"""Unknown divergence measure "{measure}", expected """
+                                            f"""one of {list(_MEASURES_)}"""
+                                        )
+
+    # Compute measures, ignoring warnings for log(0) & inf - inf (handled by weighting).
+    with errstate(divide = "ignore", invalid = "ignore"):
+
+        # Provide requested measures.
+        return {measure: _MEASURES_[measure](operands) for measure in measures}
+
+
+def _chunks_(
+    P:          Distribution,
+    Q:          Distribution,
+    axis:       int,
+    chunk_size: Optional[int]
+) -> Iterable[Tuple[NDArray, NDArray]]:
+    """# Pair Operand Chunks.
+
+    ## Args:
+        * P             (Distribution): True probability distribution(s), or iterator of chunks.
+        * Q             (Distribution): Approximate probability distribution(s), or iterator of
+                                        chunks.
+        * axis          (int):          Axis along which distributions are laid out.
+        * chunk_size    (int | None):   Distributions (leading rows) per chunk.
+
+    ## Raises:
+        * ValueError:   If chunking would split the distribution axis.
+
+    ## Returns:
+        * Iterable[Tuple[NDArray, NDArray]]:    Pairs of aligned chunks. Operands which are not
+                                                streamed are broadcast against every chunk.
+    """
+    # If either operand is streamed, pair its chunks with the other's (or with the other itself).
+    if isinstance(P, Iterator) and isinstance(Q, Iterator): return zip(P, Q, strict = True)
+    if isinstance(P, Iterator):                             return zip(P, repeat(Q))
+    if isinstance(Q, Iterator):                             return zip(repeat(P), Q)
+
+    # Otherwise, view operands as arrays (without reading memory-mapped data).
+    p:      NDArray =   asanyarray(P)
+    q:      NDArray =   asanyarray(Q)
+    ndim:   int =       max(p.ndim, q.ndim)
+
+    # If distributions are laid out along the leading axis, they cannot be chunked.
+    if axis % max(ndim, 1) == 0:
+        raise ValueError(f"Cannot chunk along distribution axis {axis} of {ndim}-D operands")
+
+    # Determine number of leading rows & chunk size.
+    rows:   int =       broadcast_shapes(p.shape, q.shape)[0]
+    size:   int =       chunk_size or max(1, _CHUNK_BYTES_ // max(
+                            X.nbytes // max(X.shape[0], 1) for X in (p, q) if X.ndim == ndim
+                        ))
+
+    # Provide chunks, broadcasting operands without a full leading axis.
+    return  (
+                tuple(
+                    X[start:start + size] if X.ndim == ndim and X.shape[0] == rows else X
+                    for X in (p, q)
+                )
+                for start in range(0, rows, size)
+            )
+
+
+def _is_batched_(
+    P:      Distribution,
+    Q:      Distribution,
+    axis:   int
+) -> bool:
+    """# Operands Hold a Batch of Distributions?
+
+    ## Args:
+        * P     (Distribution): True probability distribution(s).
+        * Q     (Distribution): Approximate probability distribution(s).
+        * axis  (int):          Axis along which distributions are laid out.
+
+    ## Returns:
+        * bool: True if operands have a leading (batch) axis other than the distribution axis,
+                along which they can be chunked.
+    """
+    # Determine dimensionality of broadcast operands (without reading memory-mapped data).
+    ndim:   int =   max(asanyarray(P).ndim, asanyarray(Q).ndim)
+
+    # Operands are batched if their leading axis does not lay out distributions.
+    return ndim > 1 and axis % ndim != 0
+
+
+def _normalize_(
+    x:                  NDArray,
+    axis:               int,
+    log_space:          bool,
+    accumulate_dtype:   DTypeLike
+) -> NDArray:
+    """# Normalize Distribution(s).
+
+    ## Args:
+        * x                 (NDArray):      Distribution(s) (or log-distribution(s)).
+        * axis              (int):          Axis along which distributions are laid out.
+        * log_space         (bool):         `x` holds log-probabilities.
+        * accumulate_dtype  (DTypeLike):    Precision of the normalizing sum.
+
+    ## Returns:
+        * NDArray:  Normalized distribution(s), in the precision of `x`.
+    """
+    # In log space, subtract log-sum-exp.
+    if log_space:   return x - _logsumexp_(x, axis, accumulate_dtype).astype(x.dtype)
+
+    # Otherwise, divide by sum.
+    return x / x.sum(axis = axis, keepdims = True, dtype = accumulate_dtype).astype(x.dtype)
+
+
+def _logsumexp_(
+    x:                  NDArray,
+    axis:               int,
+    accumulate_dtype:   DTypeLike =     float64
+) -> NDArray:
+    """# Log-Sum-Exp.
+
+    Compute log(sum(exp(x))) along `axis`, shifted by the maximum to avoid overflow.
+
+    ## Args:
+        * x                 (NDArray):      Log-values.
+        * axis              (int):          Axis along which values are summed.
+        * accumulate_dtype  (DTypeLike):    Precision of the sum. Defaults to float64.
+
+    ## Returns:
+        * NDArray:  Log-sum-exp of `x`, with `axis` kept as a singleton dimension.
+    """
+    # Compute shift (zero where all values are -inf).
+    shift:  NDArray =   x.max(axis = axis, keepdims = True)
+    shift:  NDArray =   where(isfinite(shift), shift, 0)
+
+    # Compute log-sum-exp.
+    with errstate(divide = "ignore"):
+        return shift + log(
+            exp(x - shift).sum(axis = axis, keepdims = True, dtype = accumulate_dtype)
+        )
+
+
+def _is_sparse_(
+    X:  Distribution
+) -> bool:
+    """# Distribution is Sparse?
+
+    ## Args:
+        * X (Distribution): Distribution being queried.
+
+    ## Returns:
+        * bool: True if distribution is a `scipy.sparse` vector/matrix, or an (indices, values)
+                pair (a tuple of integer indices & as many values).
+    """
+    # Sparse vectors/matrices are sparse.
+    if type(X).__module__.startswith("scipy.sparse"): return True
+
+    # Otherwise, only pairs of integer indices & as many values are sparse.
+    if not isinstance(X, tuple) or len(X) != 2: return False
+    indices, values =   asanyarray(X[0]), asanyarray(X[1])
+    return indices.ndim == 1 and indices.dtype.kind in "iu" and values.shape == indices.shape
+
+
+def _smooth_(
+    p:                  NDArray,
+    q:                  NDArray,
+    epsilon:            float,
+    axis:               int,
+    normalize:          bool,
+    log_space:          bool,
+    accumulate_dtype:   DTypeLike
+) -> NDArray:
+    """# Smooth Approximate Distribution(s).
+
+    ## Args:
+        * p                 (NDArray):      True distribution(s) (or log-distribution(s)).
+        * q                 (NDArray):      Approximate distribution(s) (or log-distribution(s)).
+        * epsilon           (float):        Probability assigned to entries where Q is zero but P
+                                            is not.
+        * axis              (int):          Axis along which distributions are laid out.
+        * normalize         (bool):         Renormalize Q after smoothing.
+        * log_space         (bool):         `p` & `q` hold log-probabilities.
+        * accumulate_dtype  (DTypeLike):    Precision of the normalizing sum.
+
+    ## Returns:
+        * NDArray:  Smoothed distribution(s), in the precision of `q`.
+    """
+    # Assign epsilon (or its log) to entries where Q is zero but P is not.
+    q:  NDArray =   (
+                        where((q == -inf) & (p > -inf), q.dtype.type(log(epsilon)), q)
+                        if log_space else
+                        where((q == 0) & (p > 0), q.dtype.type(epsilon), q)
+                    )
+
+    # Renormalize Q if requested.
+    return _normalize_(q, axis, log_space, accumulate_dtype) if normalize else q
+
+
+# MEASURES =========================================================================================
+
+def cross_entropy(
+    P:          Distribution,
+    Q:          Distribution,
+    axis:       int =   -1,
+    **kwargs
+) -> Union[float, NDArray]:
+    """# Cross-Entropy.
+
+    Compute the cross-entropy H(p, q) = -sum(p log q) = H(p) + D_KL(p || q).
+
+    ## Args:
+        * P         (NDArray):  True probability distribution(s).
+        * Q         (NDArray):  Approximate probability distribution(s).
+        * axis      (int):      Axis along which distributions are laid out. Defaults to -1.
+        * kwargs:               Additional options forwarded to `divergences`.
+
+    ## Returns:
+        * float | NDArray:  Cross-entropy.
+    """
+    return divergences(P, Q, measures = ("cross_entropy",), axis = axis, **kwargs)["cross_entropy"]
+
+
+def D_B(
+    P:          Distribution,
+    Q:          Distribution,
+    axis:       int =   -1,
+    **kwargs
+) -> Union[float, NDArray]:
+    """# Bhattacharyya Distance.
+
+    Compute the Bhattacharyya distance D_B(p, q) = -log(sum(sqrt(p q))).
+
+    ## Notes:
+        * Bhattacharyya distance is symmetric, but does not satisfy triangle inequality.
+
+    ## Args:
+        * P         (NDArray):  First probability distribution(s).
+        * Q         (NDArray):  Second probability distribution(s).
+        * axis      (int):      Axis along which distributions are laid out. Defaults to -1.
+        * kwargs:               Additional options forwarded to `divergences`.
+
+    ## Returns:
+        * float | NDArray:  Bhattacharyya distance.
+    """
+    return divergences(P, Q, measures = ("bhattacharyya",), axis = axis, **kwargs)["bhattacharyya"]
+
+
+def D_H(
+    P:          Distribution,
+    Q:          Distribution,
+    axis:       int =   -1,
+    **kwargs
+) -> Union[float, NDArray]:
+    """# Hellinger Distance.
+
+    Compute the Hellinger distance H(p, q) = sqrt(1 - sum(sqrt(p q))), bounded by [0, 1].
+
+    ## Notes:
+        * Hellinger distance is a true metric.
+
+    ## Args:
+        * P         (NDArray):  First probability distribution(s).
+        * Q         (NDArray):  Second probability distribution(s).
+        * axis      (int):      Axis along which distributions are laid out. Defaults to -1.
+        * kwargs:               Additional options forwarded to `divergences`.
+
+    ## Returns:
+        * float | NDArray:  Hellinger distance.
+    """
+    return divergences(P, Q, measures = ("hellinger",), axis = axis, **kwargs)["hellinger"]
+
+
+def D_JS(
+    P:          Distribution,
+    Q:          Distribution,
+    axis:       int =   -1,
+    **kwargs
+) -> Union[float, NDArray]:
+    """# Jensen-Shannon (JS) Divergence.
+
+    Compute the Jensen-Shannon divergence D_JS(p || q) = (D_KL(p || m) + D_KL(q || m)) / 2, where
+    m = (p + q) / 2.
+
+    ## Notes:
+        * JS divergence is symmetric & bounded by [0, log 2].
+        * The square root of JS divergence is a true metric.
+
+    ## Args:
+        * P         (NDArray):  First probability distribution(s).
+        * Q         (NDArray):  Second probability distribution(s).
+        * axis      (int):      Axis along which distributions are laid out. Defaults to -1.
+        * kwargs:               Additional options forwarded to `divergences`.
+
+    ## Returns:
+        * float | NDArray:  Jensen-Shannon (JS) divergence.
+    """
+    return divergences(P, Q, measures = ("js",), axis = axis, **kwargs)["js"]
 
-from numpy.typing   import NDArray
-from scipy.special  import rel_entr
 
 def D_KL(
-    P:          Union[NDArray, Sequence[Union[int, float]]],
-    Q:          Union[NDArray, Sequence[Union[int, float]]]
-) -> float:
+    P:          Distribution,
+    Q:          Distribution,
+    axis:       int =   -1,
+    **kwargs
+) -> Union[float, NDArray]:
     """# Kullback-Leibler (KL) Divergence.
 
-    Compute the Kullback-Leibler (KL) divergence D_KL(p || q) between two discrete probability 
-    distributions.
+    Compute the Kullback-Leibler (KL) divergence D_KL(p || q) between two discrete probability
+    distributions, or between batches of distributions laid out along `axis`.
 
     ## Notes:
         * KL divergence is not symmetric.
         * KL divergence is not a true metric (does not satisfy triangle inequality).
+        * `P` & `Q` follow NumPy broadcasting rules, so a single reference `Q` of shape (K,) can be
+          compared against every row of a (N, K) batch `P` without being copied.
+        * Reduction is performed in a single NumPy pass over `axis`.
 
     ## Args:
-        * P         (NDArray):  True probability distribution.
-        * Q         (NDArray):  Approximate probability distribution.
+        * P         (NDArray):  True probability distribution(s).
+        * Q         (NDArray):  Approximate probability distribution(s).
+        * axis      (int):      Axis along which distributions are laid out. Defaults to -1.
+        * kwargs:               Additional options forwarded to `divergences`.
 
-    ## Raises AssertionError if:
-        * Shapes of `P` & `Q` do not match.
-        * Either distribution contains negative values.
-        * Either distribution sums to zero.
+    ## Raises:
+        * ShapeMismatchError:           If shapes of `P` & `Q` cannot be broadcast together, or
+                                        differ along `axis`.
+        * NegativeProbabilityError:     If either distribution contains negative values.
+        * NonFiniteProbabilityError:    If either distribution contains NaN or infinite values.
+        * ZeroMassError:                If either distribution sums to zero.
 
     ## Returns:
-        * float:    Kull-Leibler (KL) divergence.
+        * float | NDArray:  Kullback-Leibler (KL) divergence, or array of divergences whose shape
+                            is the broadcast shape of `P` & `Q` with `axis` removed.
 
     ## Example:
     >>> p = np.array([0.5, 0.5])
     >>> q = np.array([0.9, 0.1])
-    >>> kl_divergence(p, q)
+    >>> D_KL(p, q)
     >>> 0.5108256237
+    >>> D_KL(np.stack([p, q]), q)
+    >>> array([0.5108256237, 0.])
+    """
+    return divergences(P, Q, measures = ("kl",), axis = axis, **kwargs)["kl"]
+
+
+def D_PSI(
+    P:          Distribution,
+    Q:          Distribution,
+    axis:       int =   -1,
+    **kwargs
+) -> Union[float, NDArray]:
+    """# Population Stability Index (PSI).
+
+    Compute the population stability index PSI(p, q) = sum((p - q) (log p - log q)), which equals
+    D_KL(p || q) + D_KL(q || p).
+
+    ## Notes:
+        * PSI is symmetric, but does not satisfy triangle inequality.
+        * PSI is infinite wherever either distribution is zero & the other is not, so it is usually
+          computed over smoothed histograms.
+
+    ## Args:
+        * P         (NDArray):  First probability distribution(s).
+        * Q         (NDArray):  Second probability distribution(s).
+        * axis      (int):      Axis along which distributions are laid out. Defaults to -1.
+        * kwargs:               Additional options forwarded to `divergences`.
+
+    ## Returns:
+        * float | NDArray:  Population stability index.
+    """
+    return divergences(P, Q, measures = ("psi",), axis = axis, **kwargs)["psi"]
+
+
+def D_R(
+    P:          Distribution,
+    Q:          Distribution,
+    alpha:      float = 0.5,
+    axis:       int =   -1,
+    **kwargs
+) -> Union[float, NDArray]:
+    """# Rényi Divergence.
+
+    Compute the Rényi divergence of order alpha, D_alpha(p || q) = log(sum(p^alpha q^(1 - alpha)))
+    / (alpha - 1).
+
+    ## Notes:
+        * Order 1 reduces to KL divergence; order 0.5 equals twice the Bhattacharyya distance.
+
+    ## Args:
+        * P         (NDArray):  True probability distribution(s).
+        * Q         (NDArray):  Approximate probability distribution(s).
+        * alpha     (float):    Order of divergence (> 0). Defaults to 0.5.
+        * axis      (int):      Axis along which distributions are laid out. Defaults to -1.
+        * kwargs:               Additional options forwarded to `divergences`.
+
+    ## Returns:
+        * float | NDArray:  Rényi divergence.
+    """
+    return divergences(P, Q, measures = ("renyi",), axis = axis, alpha = alpha, **kwargs)["renyi"]
+
+
+def D_TV(
+    P:          Distribution,
+    Q:          Distribution,
+    axis:       int =   -1,
+    **kwargs
+) -> Union[float, NDArray]:
+    """# Total Variation Distance.
+
+    Compute the total variation distance TV(p, q) = sum(|p - q|) / 2, bounded by [0, 1].
+
+    ## Args:
+        * P         (NDArray):  First probability distribution(s).
+        * Q         (NDArray):  Second probability distribution(s).
+        * axis      (int):      Axis along which distributions are laid out. Defaults to -1.
+        * kwargs:               Additional options forwarded to `divergences`.
+
+    ## Returns:
+        * float | NDArray:  Total variation distance.
     """
-    return sum(rel_entr(P, Q))
\ No newline at end of file
+    return divergences(P, Q, measures = ("tv",), axis = axis, **kwargs)["tv"]
@@ -0,0 +1,262 @@
+"""# gel.statistics.drift
+
+Divergence-based drift monitoring of multi-feature event streams.
+"""
+
+__all__ =   [
+                "DriftMonitor",
+            ]
+
+from concurrent.futures         import ThreadPoolExecutor
+from typing                     import Dict, List, Optional, Sequence, Union
+
+from numpy                      import (
+                                    add, arange, array_split, asarray, concatenate, float64, int64,
+                                    intp, subtract, zeros
+                                )
+from numpy.typing               import NDArray
+
+from gel.statistics.divergence  import divergences
+from gel.statistics.validation  import validate_distributions
+
+class DriftMonitor:
+    """# Drift Monitor.
+
+    Maintains a sliding window of the last `window` events of F features, each event holding one
+    histogram bin index per feature, & compares the window's per-feature histograms against
+    reference histograms.
+
+    ## Notes:
+        * Events are held in a (window, F) ring buffer alongside (F, B) running bin counts. Each
+          event increments one count & evicts (decrements) another per feature, so updates cost
+          O(F) per event regardless of window length.
+        * Every measure for every feature is computed by a single batched engine call per tick,
+          optionally split into feature blocks spread across a thread pool (NumPy releases the GIL
+          for the heavy lifting).
+        * Features with fewer bins than others may be padded with bins which are never observed
+          (& have zero reference mass).
+
+    ## Example:
+    >>> monitor = DriftMonitor(reference = [[5, 5], [9, 1]], window = 4, smoothing = 0.5)
+    >>> monitor.update([[0, 0], [1, 0], [1, 1]])
+    >>> monitor.divergences()["psi"]
+    >>> array([0.0638532002, 0.3185798049])
+    """
+
+    def __init__(self,
+        reference:  Union[NDArray, Sequence[Sequence[float]]],
+        window:     int,
+        measures:   Sequence[str] = ("kl", "js", "psi"),
+        smoothing:  float =         0.0,
+        n_jobs:     int =           1
+    ):
+        """# Instantiate Drift Monitor.
+
+        ## Args:
+            * reference (NDArray):          (F, B) reference bin counts (or probabilities) of each
+                                            feature.
+            * window    (int):              Number of most recent events held in the window.
+            * measures  (Sequence[str]):    Measures computed per tick (see `divergences`).
+                                            Defaults to ("kl", "js", "psi").
+            * smoothing (float):            Pseudo-count added to every bin of both the window & the
+                                            reference, which keeps divergences finite when a bin is
+                                            empty. Defaults to 0.
+            * n_jobs    (int):              Number of workers computing feature blocks. Defaults to
+                                            1.
+
+        ## Raises:
+            * DistributionError:    If reference histograms are invalid.
+            * ValueError:           If reference is not (F, B) or window is not positive.
+        """
+        # Convert reference to array.
+        reference:  NDArray =   asarray(reference, dtype = float64)
+
+        # Verify reference & window.
+        if reference.ndim != 2: raise ValueError(
+                                    f"Expected (F, B) reference histograms, got {reference.shape}"
+                                )
+        if window < 1:          raise ValueError(f"Expected positive window, got {window}")
+
+        # Validate (smoothed) reference histograms.
+        validate_distributions(reference + smoothing, reference + smoothing)
+
+        # Define properties.
+        self._reference_:   NDArray =       reference
+        self._window_:      int =           window
+        self._measures_:    Sequence[str] = tuple(measures)
+        self._smoothing_:   float =         smoothing
+        self._n_jobs_:      int =           n_jobs
+
+        # Initialize ring buffer & running counts.
+        self._events_:      NDArray =       zeros((window, reference.shape[0]), dtype = intp)
+        self._counts_:      NDArray =       zeros(reference.shape, dtype = int64)
+        self._head_:        int =           0
+        self._size_:        int =           0
+
+        # Precompute flat offset of each feature's row of counts.
+        self._offsets_:     NDArray =       arange(reference.shape[0]) * reference.shape[1]
+
+        # Initialize worker pool if requested.
+        self._pool_:        Optional[ThreadPoolExecutor] =  (
+                                ThreadPoolExecutor(max_workers = n_jobs) if n_jobs > 1 else None
+                            )
+
+    # PROPERTIES ===================================================================================
+
+    @property
+    def bins(self) -> int:
+        """# Number of Bins per Feature"""
+        return self._reference_.shape[1]
+
+    @property
+    def counts(self) -> NDArray:
+        """# Window Bin Counts (Read-Only View)"""
+        # Create view.
+        view:   NDArray =   self._counts_.view()
+
+        # Lock view.
+        view.flags.writeable = False
+
+        # Provide view.
+        return view
+
+    @property
+    def features(self) -> int:
+        """# Number of Features"""
+        return self._reference_.shape[0]
+
+    @property
+    def measures(self) -> Sequence[str]:
+        """# Measures Computed per Tick"""
+        return self._measures_
+
+    @property
+    def size(self) -> int:
+        """# Number of Events Currently Held in Window"""
+        return self._size_
+
+    @property
+    def window(self) -> int:
+        """# Window Length"""
+        return self._window_
+
+    # METHODS ======================================================================================
+
+    def close(self) -> None:
+        """# Shut Down Worker Pool."""
+        if self._pool_ is not None: self._pool_.shutdown()
+
+    def divergences(self) -> Dict[str, NDArray]:
+        """# Current Divergences.
+
+        ## Returns:
+            * Dict[str, NDArray]:   Mapping of measure names to (F,) arrays of divergences between
+                                    each feature's (smoothed) window & reference histograms. Values
+                                    are NaN while the window is empty (unless smoothing).
+        """
+        # If a single worker is requested, compute all features in one call.
+        if self._pool_ is None: return self._evaluate_(slice(None))
+
+        # Otherwise, compute contiguous feature blocks across the pool.
+        blocks: List[Dict[str, NDArray]] =  list(self._pool_.map(self._evaluate_, [
+                                                slice(features[0], features[-1] + 1)
+                                                for features in array_split(
+                                                    arange(self.features), self._n_jobs_
+                                                )
+                                                if len(features)
+                                            ]))
+
+        # Provide concatenated blocks.
+        return {
+            measure: concatenate([block[measure] for block in blocks])
+            for measure in self._measures_
+        }
+
+    def reset(self) -> None:
+        """# Empty Window."""
+        self._counts_[:] =  0
+        self._head_ =       0
+        self._size_ =       0
+
+    def update(self,
+        events: Union[NDArray, Sequence[int], Sequence[Sequence[int]]]
+    ) -> None:
+        """# Push Events into Window.
+
+        ## Args:
+            * events    (NDArray):  (F,) bin indices of one event, or (n, F) bin indices of n events
+                                    (oldest first). Events pushed beyond the window's length evict
+                                    the oldest ones.
+
+        ## Raises:
+            * ValueError:   If events do not hold one valid bin index per feature.
+        """
+        # View events as (n, F) bin indices.
+        events: NDArray =   asarray(events, dtype = intp)
+        events: NDArray =   events[None] if events.ndim == 1 else events
+
+        # If events do not match monitored features or bins, report error.
+        if events.ndim != 2 or events.shape[1] != self.features:
+            raise ValueError(f"Expected events of {self.features} features, got {events.shape}")
+        if len(events) and (events.min() < 0 or events.max() >= self.bins):
+            raise ValueError(f"Expected bin indices within [0, {self.bins})")
+
+        # Only the most recent window of events can remain in the window.
+        events: NDArray =   events[-self._window_:]
+
+        # Determine ring buffer slots overwritten by events.
+        slots:  NDArray =   (self._head_ + arange(len(events))) % self._window_
+
+        # Evict events held in slots which are occupied.
+        evicted:    int =   max(0, self._size_ + len(events) - self._window_)
+        subtract.at(
+            self._counts_.ravel(),
+            (self._events_[slots[len(events) - evicted:]] + self._offsets_).ravel(),
+            1
+        )
+
+        # Count & store events.
+        add.at(self._counts_.ravel(), (events + self._offsets_).ravel(), 1)
+        self._events_[slots] =  events
+
+        # Advance ring buffer.
+        self._head_ =   (self._head_ + len(events)) % self._window_
+        self._size_ =   min(self._size_ + len(events), self._window_)
+
+    # HELPERS ======================================================================================
+
+    def _evaluate_(self,
+        features:   slice
+    ) -> Dict[str, NDArray]:
+        """# Evaluate Measures over Block of Features.
+
+        ## Args:
+            * features  (slice):    Block of features.
+
+        ## Returns:
+            * Dict[str, NDArray]:   Mapping of measure names to divergences of block's features.
+        """
+        return divergences(
+            P =         self._counts_[features] + self._smoothing_,
+            Q =         self._reference_[features] + self._smoothing_,
+            measures =  self._measures_,
+            normalize = True,
+            validate =  False
+        )
+
+    # DUNDERS ======================================================================================
+
+    def __enter__(self) -> "DriftMonitor":
+        """# Enter Monitor Context."""
+        return self
+
+    def __exit__(self, *args) -> None:
+        """# Exit Monitor Context (Shutting Down Worker Pool)."""
+        self.close()
+
+    def __repr__(self) -> str:
+        """# Monitor Object Representation"""
+        return (
+            f"""<DriftMonitor(features = {self.features}, bins = {self.bins}, """
+            f"""window = {self._size_}/{self._window_})>"""
+        )
@@ -0,0 +1,100 @@
+"""# gel.statistics.exceptions
+
+Defines various exceptions pertaining to invalid distributions.
+"""
+
+__all__ =   [
+                "DistributionError",
+                "NegativeProbabilityError",
+                "NonFiniteProbabilityError",
+                "ShapeMismatchError",
+                "ZeroMassError"
+            ]
+
+from typing import Tuple
+
+class DistributionError(ValueError):
+    """# Generic Distribution Error.
+
+    Base exception class for all invalid distribution errors.
+    """
+    pass
+
+
+class NegativeProbabilityError(DistributionError):
+    """# Negative Probability Error.
+
+    Raised when a distribution contains negative values.
+    """
+
+    def __init__(self,
+        operand:    str
+    ):
+        """# Raise Negative Probability Error.
+
+        ## Args:
+            * operand   (str):  Name of offending distribution.
+        """
+        super(NegativeProbabilityError, self).__init__(
+            f"""Distribution {operand} contains negative values"""
+        )
+
+
+class NonFiniteProbabilityError(DistributionError):
+    """# Non-Finite Probability Error.
+
+    Raised when a distribution contains NaN or infinite values (or, in log space, NaN or +inf).
+    """
+
+    def __init__(self,
+        operand:    str
+    ):
+        """# Raise Non-Finite Probability Error.
+
+        ## Args:
+            * operand   (str):  Name of offending distribution.
+        """
+        super(NonFiniteProbabilityError, self).__init__(
+            f"""Distribution {operand} contains non-finite values"""
+        )
+
+
+class ShapeMismatchError(DistributionError):
+    """# Shape Mismatch Error.
+
+    Raised when distributions' shapes cannot be broadcast against each other, or when they differ
+    along the distribution axis.
+    """
+
+    def __init__(self,
+        p_shape:    Tuple[int, ...],
+        q_shape:    Tuple[int, ...]
+    ):
+        """# Raise Shape Mismatch Error.
+
+        ## Args:
+            * p_shape   (Tuple[int, ...]):  Shape of P.
+            * q_shape   (Tuple[int, ...]):  Shape of Q.
+        """
+        super(ShapeMismatchError, self).__init__(
+            f"""Distributions of shapes {p_shape} & {q_shape} are incompatible"""
+        )
+
+
+class ZeroMassError(DistributionError):
+    """# Zero Mass Error.
+
+    Raised when a distribution sums to zero (or, in log space, is -inf everywhere).
+    """
+
+    def __init__(self,
+        operand:    str
+    ):
+        """# Raise Zero Mass Error.
+
+        ## Args:
+            * operand   (str):  Name of offending distribution.
+        """
+        super(ZeroMassError, self).__init__(
+            f"""Distribution {operand} sums to zero"""
+        )
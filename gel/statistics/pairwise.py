@@ -0,0 +1,309 @@
+"""# gel.statistics.pairwise
+
+Pairwise divergence matrix computation.
+"""
+
+__all__ =   [
+                "pairwise_divergence",
+            ]
+
+from concurrent.futures         import (
+                                    as_completed, Future, ProcessPoolExecutor, ThreadPoolExecutor
+                                )
+from math                       import isqrt
+from typing                     import Dict, List, Literal, Optional, Tuple
+
+from numpy                      import (
+                                    asarray, errstate, empty, float64, inf, log, maximum, sqrt,
+                                    where
+                                )
+from numpy.typing               import NDArray
+
+from gel.statistics.divergence  import divergences, Distribution
+from gel.statistics.validation  import _validate_
+
+# Measures for which D(p, q) = D(q, p), allowing only the upper triangle of blocks to be computed.
+_SYMMETRIC_:    Tuple[str, ...] =   ("bhattacharyya", "hellinger", "js", "psi", "tv")
+
+# Measures whose reduction can be expressed as a matrix product of transformed operands.
+_GEMM_:         Tuple[str, ...] =   ("bhattacharyya", "cross_entropy", "hellinger", "kl", "renyi")
+
+# Approximate memory budget (in bytes) of one broadcast block, chosen to stay cache-resident.
+_BLOCK_BYTES_:  int =               1 << 21
+
+# Block size (in rows) used by matrix product measures, which are tiled by BLAS itself.
+_GEMM_BLOCK_:   int =               1024
+
+
+def pairwise_divergence(
+    P_set:      Distribution,
+    Q_set:      Optional[Distribution] =            None,
+    metric:     str =                               "kl",
+    normalize:  bool =                              False,
+    alpha:      float =                             0.5,
+    block_size: Optional[int] =                     None,
+    n_jobs:     int =                               1,
+    backend:    Literal["thread", "process"] =      "thread",
+    out:        Optional[NDArray] =                 None,
+    validate:   bool =                              True
+) -> NDArray:
+    """# Pairwise Divergence Matrix.
+
+    Compute the (N, M) matrix D[i, j] = D(P_set[i] || Q_set[j]) between two sets of distributions
+    laid out along their last axis.
+
+    ## Notes:
+        * The matrix is computed in square blocks, which may be spread across a thread or process
+          pool. NumPy releases the GIL for the heavy lifting, so threads are usually sufficient.
+        * KL, cross-entropy, Hellinger, Bhattacharyya & Rényi reductions are evaluated as matrix
+          products (e.g., sum_k p_ik log q_jk = P @ log(Q).T), other measures by broadcasting.
+        * When `Q_set` is omitted & the measure is symmetric, only the upper triangle of blocks is
+          computed & mirrored.
+        * `out` may be a `numpy.memmap`, in which case only one block per worker is held in memory.
+
+    ## Args:
+        * P_set         (NDArray):          (N, K) set of true probability distributions.
+        * Q_set         (NDArray | None):   (M, K) set of approximate probability distributions.
+                                            Defaults to `P_set`.
+        * metric        (str):              Divergence measure (see `divergences`). Defaults to
+                                            "kl".
+        * normalize     (bool):             Scale distributions to sum to one. Defaults to False.
+        * alpha         (float):            Order of Rényi divergence. Defaults to 0.5.
+        * block_size    (int | None):       Rows per block. Defaults to a cache-sized block.
+        * n_jobs        (int):              Number of workers computing blocks. Defaults to 1.
+        * backend       (str):              Worker pool type, "thread" or "process". Defaults to
+                                            "thread".
+        * out           (NDArray | None):   Preallocated (N, M) output buffer or memory map.
+        * validate      (bool):             Verify, once up front, that sets are non-negative,
+                                            finite, & have non-zero mass. Blocks are never
+                                            re-validated. Defaults to True.
+
+    ## Raises:
+        * DistributionError:    If `validate` & either set is invalid.
+        * ValueError:           If shapes of sets or output buffer are incompatible, or backend is
+                                unknown.
+
+    ## Returns:
+        * NDArray:  (N, M) divergence matrix.
+    """
+    # Convert sets to arrays (without copying existing arrays or memory maps).
+    P:          NDArray =   asarray(P_set)
+    Q:          NDArray =   P if Q_set is None else asarray(Q_set)
+
+    # Determine if only upper triangle of blocks must be computed.
+    symmetric:  bool =      Q_set is None and metric in _SYMMETRIC_
+
+    # Verify set shapes.
+    if P.ndim != 2 or Q.ndim != 2 or P.shape[1] != Q.shape[1]:
+        raise ValueError(f"Expected (N, K) & (M, K) sets, got {P.shape} & {Q.shape}")
+
+    # Validate each set on its own if requested (sets of different sizes do not broadcast).
+    if validate:
+        for X, operand in ((P, "P"), (Q, "Q")) if Q is not P else ((P, "P"),):
+            _validate_(
+                X, operand, axis = 1, normalize = False, log_space = False,
+                accumulate_dtype = float64
+            )
+
+    # Verify backend.
+    if backend not in ("thread", "process"):
+        raise ValueError(f"""Unknown backend "{backend}", expected "thread" or "process\"""")
+
+    # Initialize output buffer if one was not provided.
+    if out is None: out = empty((P.shape[0], Q.shape[0]), dtype = float64)
+
+    # Verify output buffer shape.
+    if out.shape != (P.shape[0], Q.shape[0]):
+        raise ValueError(f"Expected output of shape {(P.shape[0], Q.shape[0])}, got {out.shape}")
+
+    # Determine block size if one was not provided.
+    if block_size is None:  block_size =    _GEMM_BLOCK_ if metric in _GEMM_ else max(
+                                                1, isqrt(_BLOCK_BYTES_ // (8 * max(P.shape[1], 1)))
+                                            )
+
+    # Enumerate blocks.
+    blocks: List[Tuple[int, int]] = [
+                                        (i, j)
+                                        for i in range(0, P.shape[0], block_size)
+                                        for j in range(0, Q.shape[0], block_size)
+                                        if not symmetric or j >= i
+                                    ]
+
+    # If a single worker is requested, compute blocks in place.
+    if n_jobs <= 1 or len(blocks) <= 1:
+
+        # For each block, compute & store block.
+        for i, j in blocks:
+            _fill_(
+                out, P[i:i + block_size], Q[j:j + block_size],
+                i, j, metric, normalize, alpha, symmetric
+            )
+
+        # Provide matrix.
+        return out
+
+    # Threads share the output buffer, so each worker stores its own block.
+    if backend == "thread":
+
+        with ThreadPoolExecutor(max_workers = n_jobs) as pool:
+
+            # Submit blocks.
+            futures:    List[Future] =  [
+                                            pool.submit(
+                                                _fill_, out,
+                                                P[i:i + block_size],
+                                                Q[j:j + block_size],
+                                                i, j, metric, normalize, alpha, symmetric
+                                            )
+                                            for i, j in blocks
+                                        ]
+
+            # Propagate worker errors.
+            for future in futures: future.result()
+
+        # Provide matrix.
+        return out
+
+    # Otherwise, blocks are computed in worker processes & stored as they complete.
+    with ProcessPoolExecutor(max_workers = n_jobs) as pool:
+
+        # Submit blocks.
+        futures:    Dict[Future, Tuple[int, int]] = {
+                                                        pool.submit(
+                                                            _block_,
+                                                            P[i:i + block_size],
+                                                            Q[j:j + block_size],
+                                                            metric, normalize, alpha
+                                                        ): (i, j)
+                                                        for i, j in blocks
+                                                    }
+
+        # Store blocks as they complete.
+        for future in as_completed(futures):
+            _store_(out, future.result(), *futures[future], symmetric)
+
+    # Provide matrix.
+    return out
+
+
+# HELPERS ==========================================================================================
+
+def _block_(
+    p:          NDArray,
+    q:          NDArray,
+    metric:     str,
+    normalize:  bool,
+    alpha:      float
+) -> NDArray:
+    """# Compute Block.
+
+    ## Args:
+        * p         (NDArray):  (n, K) block of true probability distributions.
+        * q         (NDArray):  (m, K) block of approximate probability distributions.
+        * metric    (str):      Divergence measure.
+        * normalize (bool):     Scale distributions to sum to one.
+        * alpha     (float):    Order of Rényi divergence.
+
+    ## Returns:
+        * NDArray:  (n, m) block of divergences.
+    """
+    # If measure cannot be expressed as a matrix product, broadcast blocks against each other.
+    if metric not in _GEMM_:
+        return divergences(
+            p[:, None, :], q[None, :, :], measures = (metric,), normalize = normalize,
+            alpha = alpha, validate = False
+        )[metric]
+
+    # Convert blocks to floating point arrays.
+    p:  NDArray =   asarray(p, dtype = float64)
+    q:  NDArray =   asarray(q, dtype = float64)
+
+    # Normalize distributions if requested.
+    if normalize:
+        p, q =  p / p.sum(axis = 1, keepdims = True), q / q.sum(axis = 1, keepdims = True)
+
+    # Compute measures, ignoring warnings for log(0) (handled by masking).
+    with errstate(divide = "ignore", invalid = "ignore"):
+
+        # Bhattacharyya coefficient based measures.
+        if metric in ("bhattacharyya", "hellinger"):
+
+            # Compute coefficient matrix.
+            bc: NDArray =   sqrt(p) @ sqrt(q).T
+
+            # Provide measure.
+            return -log(bc) if metric == "bhattacharyya" else sqrt(maximum(1 - bc, 0))
+
+        # Entries for which p > 0 where q = 0 are infinite.
+        infinite:   NDArray =   ((p > 0) * 1.0) @ ((q == 0) * 1.0).T > 0
+
+        # Rényi divergence of order other than one.
+        if metric == "renyi" and alpha != 1:
+
+            # Compute power sums (q^(1 - alpha) is infinite where q = 0 if alpha > 1).
+            power:  NDArray =   (p ** alpha) @ where(q > 0, q ** (1 - alpha), 0).T
+
+            # Provide measure.
+            return where(infinite & (alpha > 1), inf, log(power) / (alpha - 1))
+
+        # Compute cross-entropy, -sum(p log q), with log(0) masked.
+        ce:         NDArray =   -(p @ where(q > 0, log(q), 0).T)
+
+        # Cross-entropy.
+        if metric == "cross_entropy":   return where(infinite, inf, ce)
+
+        # Compute negative entropy, sum(p log p), of each row.
+        neg_entropy:    NDArray =   where(p > 0, p * log(p), 0).sum(axis = 1, keepdims = True)
+
+        # KL divergence is cross-entropy less entropy (clipped to absorb rounding).
+        return where(infinite, inf, maximum(ce + neg_entropy, 0))
+
+
+def _fill_(
+    out:        NDArray,
+    p:          NDArray,
+    q:          NDArray,
+    i:          int,
+    j:          int,
+    metric:     str,
+    normalize:  bool,
+    alpha:      float,
+    symmetric:  bool
+) -> None:
+    """# Compute & Store Block.
+
+    ## Args:
+        * out       (NDArray):  Output matrix.
+        * p         (NDArray):  (n, K) block of true probability distributions.
+        * q         (NDArray):  (m, K) block of approximate probability distributions.
+        * i         (int):      Row offset of block.
+        * j         (int):      Column offset of block.
+        * metric    (str):      Divergence measure.
+        * normalize (bool):     Scale distributions to sum to one.
+        * alpha     (float):    Order of Rényi divergence.
+        * symmetric (bool):     Mirror block into lower triangle.
+    """
+    _store_(out, _block_(p, q, metric, normalize, alpha), i, j, symmetric)
+
+
+def _store_(
+    out:        NDArray,
+    block:      NDArray,
+    i:          int,
+    j:          int,
+    symmetric:  bool
+) -> None:
+    """# Store Block.
+
+    ## Args:
+        * out       (NDArray):  Output matrix.
+        * block     (NDArray):  Computed block.
+        * i         (int):      Row offset of block.
+        * j         (int):      Column offset of block.
+        * symmetric (bool):     Mirror block into lower triangle.
+    """
+    # Store block.
+    out[i:i + block.shape[0], j:j + block.shape[1]] = block
+
+    # Mirror block if measure is symmetric.
+    if symmetric and j != i:    out[j:j + block.shape[1], i:i + block.shape[0]] = block.T
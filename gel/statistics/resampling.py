@@ -0,0 +1,362 @@
+"""# gel.statistics.resampling
+
+Bootstrap confidence intervals & permutation tests of divergences between observed histograms.
+
+Rather than looping over replicates, every resample is drawn at once as a row of a count matrix
+(multinomial for bootstrap replicates, multivariate hypergeometric for permutations), & all rows
+are evaluated by a single batched engine call. Replicates are drawn in chunks of rows, bounding
+memory independently of the number of replicates.
+"""
+
+__all__ =   [
+                "bootstrap_divergence",
+                "ConfidenceInterval",
+                "permutation_test",
+                "PermutationTest",
+            ]
+
+from typing                     import Callable, List, Optional, Sequence, Tuple, Union
+
+from numpy                      import asarray, empty, float64, int64, isfinite, quantile, rint
+from numpy.random               import default_rng, Generator, SeedSequence
+from numpy.typing               import NDArray
+
+from gel.statistics.divergence  import divergences
+from gel.statistics.exceptions  import NegativeProbabilityError, NonFiniteProbabilityError
+from gel.statistics.validation  import validate_distributions
+
+# Approximate size (in bytes) of the count matrices drawn per chunk.
+_CHUNK_BYTES_:  int =   1 << 24
+
+# Seed (or generator) used to draw resamples.
+Seed =  Optional[Union[int, Generator]]
+
+
+class ConfidenceInterval:
+    """# Bootstrap Confidence Interval."""
+
+    def __init__(self,
+        estimate:   float,
+        low:        float,
+        high:       float,
+        confidence: float,
+        replicates: NDArray
+    ):
+        """# Instantiate Confidence Interval.
+
+        ## Args:
+            * estimate      (float):    Divergence of the observed histograms.
+            * low           (float):    Lower bound of interval.
+            * high          (float):    Upper bound of interval.
+            * confidence    (float):    Confidence level of interval.
+            * replicates    (NDArray):  Divergence of each bootstrap replicate.
+        """
+        # Define properties.
+        self.estimate:      float =     estimate
+        self.low:           float =     low
+        self.high:          float =     high
+        self.confidence:    float =     confidence
+        self.replicates:    NDArray =   replicates
+
+    def __repr__(self) -> str:
+        """# Confidence Interval Object Representation"""
+        return (
+            f"""<ConfidenceInterval(estimate = {self.estimate:.6g}, """
+            f"""{self.confidence:.0%} CI = [{self.low:.6g}, {self.high:.6g}])>"""
+        )
+
+
+class PermutationTest:
+    """# Permutation Test Result."""
+
+    def __init__(self,
+        statistic:  float,
+        p_value:    float,
+        null:       NDArray
+    ):
+        """# Instantiate Permutation Test Result.
+
+        ## Args:
+            * statistic (float):    Divergence of the observed histograms.
+            * p_value   (float):    Probability, under the null hypothesis that P & Q share one
+                                    distribution, of a divergence at least as large.
+            * null      (NDArray):  Divergence of each permutation.
+        """
+        # Define properties.
+        self.statistic: float =     statistic
+        self.p_value:   float =     p_value
+        self.null:      NDArray =   null
+
+    def __repr__(self) -> str:
+        """# Permutation Test Object Representation"""
+        return f"""<PermutationTest(statistic = {self.statistic:.6g}, p = {self.p_value:.4g})>"""
+
+
+def bootstrap_divergence(
+    P:          Union[NDArray, Sequence[int]],
+    Q:          Union[NDArray, Sequence[int]],
+    measure:    str =           "kl",
+    replicates: int =           1000,
+    confidence: float =         0.95,
+    smoothing:  float =         0.0,
+    chunk_size: Optional[int] = None,
+    seed:       Seed =          None,
+    **kwargs
+) -> ConfidenceInterval:
+    """# Bootstrap Divergence.
+
+    Estimate a percentile confidence interval of D(P || Q) by resampling each histogram's
+    observations with replacement.
+
+    ## Args:
+        * P             (NDArray):              (K,) observed category counts of P.
+        * Q             (NDArray):              (K,) observed category counts of Q.
+        * measure       (str):                  Divergence measure (see `divergences`). Defaults to
+                                                "kl".
+        * replicates    (int):                  Number of bootstrap replicates. Defaults to 1000.
+        * confidence    (float):                Confidence level of interval. Defaults to 0.95.
+        * smoothing     (float):                Pseudo-count added to every category of every
+                                                histogram. Defaults to 0.
+        * chunk_size    (int | None):           Replicates drawn per chunk. Defaults to ~16 MiB of
+                                                counts per chunk.
+        * seed          (int | Generator):      Seed or generator making resamples reproducible
+                                                (independently of `chunk_size`).
+        * kwargs:                               Additional options forwarded to `divergences`.
+
+    ## Raises:
+        * DistributionError:    If histograms are invalid.
+
+    ## Returns:
+        * ConfidenceInterval:   Observed divergence & its interval.
+    """
+    # Convert & validate histograms.
+    p, q =  _histograms_(P, Q)
+
+    # Draw P's & Q's replicates from independent streams, so that chunking does not alter them.
+    p_rng, q_rng =  _spawn_(seed, streams = 2)
+
+    # Evaluate replicates.
+    values: NDArray =   _replicates_(
+                            lambda n: (
+                                p_rng.multinomial(p.sum(), p / p.sum(), size = n),
+                                q_rng.multinomial(q.sum(), q / q.sum(), size = n)
+                            ),
+                            replicates, len(p), measure, smoothing, chunk_size, kwargs
+                        )
+
+    # Compute percentile interval (from replicates themselves, as interpolating between infinite
+    # replicates, e.g., KL divergences of empty bins, is undefined).
+    low, high = quantile(
+                    values, [(1 - confidence) / 2, (1 + confidence) / 2], method = "inverted_cdf"
+                )
+
+    # Provide interval.
+    return ConfidenceInterval(
+        estimate =      _divergence_(p, q, measure, smoothing, kwargs),
+        low =           float(low),
+        high =          float(high),
+        confidence =    confidence,
+        replicates =    values
+    )
+
+
+def permutation_test(
+    P:              Union[NDArray, Sequence[int]],
+    Q:              Union[NDArray, Sequence[int]],
+    measure:        str =           "kl",
+    permutations:   int =           1000,
+    smoothing:      float =         0.0,
+    chunk_size:     Optional[int] = None,
+    seed:           Seed =          None,
+    **kwargs
+) -> PermutationTest:
+    """# Permutation Test of Divergence.
+
+    Test the null hypothesis that P & Q share one distribution by reassigning pooled observations
+    to histograms of the observed sizes, which (for histograms) amounts to drawing P's counts from
+    a multivariate hypergeometric distribution over the pooled counts.
+
+    ## Args:
+        * P             (NDArray):              (K,) observed category counts of P.
+        * Q             (NDArray):              (K,) observed category counts of Q.
+        * measure       (str):                  Divergence measure (see `divergences`). Defaults to
+                                                "kl".
+        * permutations  (int):                  Number of permutations. Defaults to 1000.
+        * smoothing     (float):                Pseudo-count added to every category of every
+                                                histogram. Defaults to 0.
+        * chunk_size    (int | None):           Permutations drawn per chunk. Defaults to ~16 MiB of
+                                                counts per chunk.
+        * seed          (int | Generator):      Seed or generator making permutations reproducible.
+        * kwargs:                               Additional options forwarded to `divergences`.
+
+    ## Raises:
+        * DistributionError:    If histograms are invalid.
+
+    ## Returns:
+        * PermutationTest:  Observed divergence & its p-value.
+    """
+    # Convert & validate histograms.
+    p, q =  _histograms_(P, Q)
+
+    # Pool observations.
+    pooled: NDArray =   p + q
+    rng:    Generator = default_rng(seed)
+
+    def draw(n: int) -> Tuple[NDArray, NDArray]:
+        """# Draw Permutations (Q receives the pooled observations P does not)."""
+        # Reassign P's share of pooled observations.
+        draws:  NDArray =   rng.multivariate_hypergeometric(pooled, int(p.sum()), size = n)
+
+        # Provide permuted histograms.
+        return draws, pooled - draws
+
+    # Evaluate permutations.
+    null:       NDArray =   _replicates_(
+                                draw, permutations, len(p), measure, smoothing, chunk_size, kwargs
+                            )
+
+    # Compute observed statistic.
+    statistic:  float =     _divergence_(p, q, measure, smoothing, kwargs)
+
+    # Provide test result (counting the observed assignment as one permutation).
+    return PermutationTest(
+        statistic = statistic,
+        p_value =   float((1 + (null >= statistic).sum()) / (1 + permutations)),
+        null =      null
+    )
+
+
+# HELPERS ==========================================================================================
+
+def _divergence_(
+    p:          NDArray,
+    q:          NDArray,
+    measure:    str,
+    smoothing:  float,
+    kwargs:     dict
+) -> NDArray:
+    """# Divergence between (Batches of) Histograms.
+
+    ## Args:
+        * p         (NDArray):  Category counts of P.
+        * q         (NDArray):  Category counts of Q.
+        * measure   (str):      Divergence measure.
+        * smoothing (float):    Pseudo-count added to every category.
+        * kwargs    (dict):     Additional options forwarded to `divergences`.
+
+    ## Returns:
+        * NDArray:  Divergence of each histogram pair.
+    """
+    return divergences(
+        p + smoothing, q + smoothing, measures = (measure,), normalize = True, validate = False,
+        **kwargs
+    )[measure]
+
+
+def _histograms_(
+    P:  Union[NDArray, Sequence[int]],
+    Q:  Union[NDArray, Sequence[int]]
+) -> Tuple[NDArray, NDArray]:
+    """# Convert & Validate Histograms.
+
+    ## Args:
+        * P (NDArray):  Observed category counts of P.
+        * Q (NDArray):  Observed category counts of Q.
+
+    ## Raises:
+        * DistributionError:    If histograms are invalid (e.g., contain negative or non-finite
+                                counts).
+        * ValueError:           If histograms are not vectors, or contain non-integral counts.
+
+    ## Returns:
+        * NDArray:  (K,) integer counts of P.
+        * NDArray:  (K,) integer counts of Q.
+    """
+    # Verify counts before casting them (which would silently truncate them).
+    for X, operand in ((P, "P"), (Q, "Q")):
+
+        # Only finite, integral, numeric, & non-negative counts can be resampled.
+        X:      NDArray =   asarray(X)
+        floats: bool =      X.dtype.kind == "f"
+        if not floats and X.dtype.kind not in "biu":
+            raise ValueError(f"Histogram {operand} contains non-numeric counts")
+        if floats and not isfinite(X).all():
+            raise NonFiniteProbabilityError(operand)
+        if floats and (X != rint(X)).any():
+            raise ValueError(f"Histogram {operand} contains non-integral counts")
+        if (X < 0).any():
+            raise NegativeProbabilityError(operand)
+
+    # Convert histograms to integer counts.
+    p:  NDArray =   asarray(P, dtype = int64)
+    q:  NDArray =   asarray(Q, dtype = int64)
+
+    # If histograms are not vectors, report error.
+    if p.ndim != 1 or q.ndim != 1:
+        raise ValueError(f"Expected (K,) histograms, got {p.shape} & {q.shape}")
+
+    # Validate histograms.
+    validate_distributions(p, q)
+
+    # Provide histograms.
+    return p, q
+
+
+def _spawn_(
+    seed:       Seed,
+    streams:    int
+) -> List[Generator]:
+    """# Spawn Independent Generators.
+
+    Streams are spawned from the seed's sequence (or, given a generator, from entropy drawn from
+    it), as `Generator.spawn` requires NumPy 1.25.
+
+    ## Args:
+        * seed      (int | Generator):  Seed or generator from which streams are spawned.
+        * streams   (int):              Number of generators spawned.
+
+    ## Returns:
+        * List[Generator]:  Independent generators.
+    """
+    # Draw entropy from generator if one was provided.
+    if isinstance(seed, Generator): seed = seed.integers(1 << 63, size = 4)
+
+    # Spawn generators.
+    return [default_rng(sequence) for sequence in SeedSequence(seed).spawn(streams)]
+
+
+def _replicates_(
+    draw:       Callable[[int], Tuple[NDArray, NDArray]],
+    replicates: int,
+    categories: int,
+    measure:    str,
+    smoothing:  float,
+    chunk_size: Optional[int],
+    kwargs:     dict
+) -> NDArray:
+    """# Evaluate Replicates Chunk by Chunk.
+
+    ## Args:
+        * draw          (Callable):     Draws (n, K) count matrices of P & Q, given n.
+        * replicates    (int):          Total number of replicates.
+        * categories    (int):          Number of categories (K).
+        * measure       (str):          Divergence measure.
+        * smoothing     (float):        Pseudo-count added to every category.
+        * chunk_size    (int | None):   Replicates drawn per chunk.
+        * kwargs        (dict):         Additional options forwarded to `divergences`.
+
+    ## Returns:
+        * NDArray:  (replicates,) divergence of each replicate.
+    """
+    # Initialize results & determine chunk size.
+    values: NDArray =   empty(replicates, dtype = float64)
+    size:   int =       chunk_size or max(1, _CHUNK_BYTES_ // (8 * max(categories, 1)))
+
+    # Draw & evaluate each chunk of replicates in one batched call.
+    for start in range(0, replicates, size):
+        values[start:start + size] = _divergence_(
+            *draw(min(size, replicates - start)), measure, smoothing, kwargs
+        )
+
+    # Provide results.
+    return values
@@ -0,0 +1,201 @@
+"""# gel.statistics.sparse
+
+Divergences between sparse distributions over high-cardinality supports.
+
+Every supported measure has zero terms where both P & Q are zero, and terms which are linear in Q
+where only P is zero. Divergences are therefore evaluated over the support of P alone, with the
+mass of Q lying outside of it folded into a single extra term per distribution. Neither operand
+is ever densified to the width of the vocabulary.
+"""
+
+__all__ =   [
+                "sparse_divergences",
+            ]
+
+from typing                     import Any, Dict, Sequence, Tuple, Union
+
+from numpy                      import (
+                                    arange, asarray, bincount, concatenate, float64, int64,
+                                    maximum, minimum, ones, repeat, searchsorted, tile, unique,
+                                    where, zeros
+                                )
+from numpy.typing               import NDArray
+
+from gel.statistics.divergence  import _evaluate_, _Operands_
+from gel.statistics.validation  import _verify_
+
+# Sparse distribution, given as a `scipy.sparse` vector/matrix or an (indices, values) pair.
+SparseDistribution =    Union[Any, Tuple[Sequence[int], Sequence[float]]]
+
+
+def sparse_divergences(
+    P:          SparseDistribution,
+    Q:          SparseDistribution,
+    measures:   Sequence[str] = ("kl",),
+    normalize:  bool =          False,
+    alpha:      float =         0.5,
+    epsilon:    float =         0.0,
+    validate:   bool =          True
+) -> Dict[str, Union[float, NDArray]]:
+    """# Compute Sparse Divergences.
+
+    ## Notes:
+        * Rows of (N, V) sparse matrices are distributions. A single row of either operand is
+          broadcast against every row of the other.
+        * Cost is proportional to the number of stored entries, not to the vocabulary width V.
+
+    ## Args:
+        * P         (SparseDistribution):   True probability distribution(s).
+        * Q         (SparseDistribution):   Approximate probability distribution(s).
+        * measures  (Sequence[str]):        Measures to compute (see `divergences`). Defaults to
+                                            ("kl",).
+        * normalize (bool):                 Scale rows of `P` & `Q` to sum to one. Defaults to
+                                            False.
+        * alpha     (float):                Order of Rényi divergence. Defaults to 0.5.
+        * epsilon   (float):                Probability assigned to entries where Q is zero but P
+                                            is not (Q is renormalized afterwards if `normalize`).
+                                            Defaults to 0, leaving such divergences infinite.
+        * validate  (bool):                 Verify that stored values are non-negative, finite, &
+                                            that every row has non-zero mass. Defaults to True.
+
+    ## Raises:
+        * DistributionError:    If `validate` & either operand is invalid.
+        * ValueError:           If operands have incompatible numbers of rows.
+
+    ## Returns:
+        * Dict[str, float | NDArray]:   Mapping of measure names to their values, one per row.
+    """
+    # Extract stored entries of each operand.
+    p_rows, p_cols, p_vals, p_n, p_vector = _entries_(P)
+    q_rows, q_cols, q_vals, q_n, q_vector = _entries_(Q)
+
+    # Verify that operands broadcast.
+    if p_n != q_n and 1 not in (p_n, q_n):
+        raise ValueError(f"Cannot broadcast {p_n} rows of P against {q_n} rows of Q")
+
+    # Determine number of output rows.
+    n:  int =   max(p_n, q_n)
+
+    # If a single row of P is broadcast against many rows of Q, replicate its (sparse) support.
+    if p_n == 1 and n > 1:
+        p_rows, p_cols, p_vals = repeat(arange(n), len(p_cols)), tile(p_cols, n), tile(p_vals, n)
+
+    # Compute row totals of each operand.
+    p_total:    NDArray =   bincount(p_rows, weights = p_vals, minlength = n)
+    q_total:    NDArray =   bincount(q_rows, weights = q_vals, minlength = q_n) * ones(n)
+
+    # Validate stored values if requested (row totals double as the mass & finiteness checks).
+    if validate:
+        _verify_(p_vals.min(initial = 0), p_total, "P")
+        _verify_(q_vals.min(initial = 0), q_total, "Q")
+
+    # Locate Q's value at each entry of P's support (keys are row-major, so Q's are sorted).
+    width:      int =       int(max(p_cols.max(initial = 0), q_cols.max(initial = 0))) + 1
+    q_keys:     NDArray =   (q_rows if q_n > 1 else 0) * width + q_cols
+    p_keys:     NDArray =   (p_rows if q_n > 1 else 0) * width + p_cols
+    position:   NDArray =   minimum(searchsorted(q_keys, p_keys), max(len(q_keys) - 1, 0))
+    q_at_p:     NDArray =   where(
+                                (q_keys[position] == p_keys) if len(q_keys) else False,
+                                q_vals[position] if len(q_keys) else 0.0,
+                                0.0
+                            )
+
+    # Normalize operands if requested.
+    if normalize:
+        p_vals, q_at_p, q_total =   p_vals / p_total[p_rows], q_at_p / q_total[p_rows], ones(n)
+
+    # Compute mass of Q outside of P's support (clipped to absorb rounding).
+    rest:       NDArray =   maximum(q_total - bincount(p_rows, weights = q_at_p, minlength = n), 0)
+
+    # If smoothing is requested, assign epsilon to entries where Q is zero but P is not.
+    if epsilon > 0:
+
+        # Smooth Q.
+        q_at_p: NDArray =   where((q_at_p == 0) & (p_vals > 0), epsilon, q_at_p)
+
+        # Renormalize Q if requested.
+        if normalize:
+
+            # Compute smoothed row totals.
+            total:  NDArray =   bincount(p_rows, weights = q_at_p, minlength = n) + rest
+
+            # Scale smoothed Q.
+            q_at_p, rest =  q_at_p / total[p_rows], rest / total
+
+    # Append one entry per row holding Q's outside mass (where P is zero).
+    rows:       NDArray =   concatenate([p_rows, arange(n)])
+    operands:   _Operands_ =    _Operands_(
+                                    p =         concatenate([p_vals, zeros(n)]),
+                                    q =         concatenate([q_at_p, rest]),
+                                    axis =      -1,
+                                    alpha =     alpha,
+                                    reducer =   lambda terms: bincount(
+                                                    rows, weights = terms, minlength = n
+                                                )
+                                )
+
+    # Evaluate measures.
+    results:    Dict[str, NDArray] =    _evaluate_(operands, measures)
+
+    # Provide scalars if both operands were vectors.
+    return {m: r[0] for m, r in results.items()} if p_vector and q_vector else results
+
+
+# HELPERS ==========================================================================================
+
+def _entries_(
+    X:  SparseDistribution
+) -> Tuple[NDArray, NDArray, NDArray, int, bool]:
+    """# Extract Stored Entries.
+
+    ## Args:
+        * X (SparseDistribution):   Sparse vector/matrix, (indices, values) pair, or dense array.
+
+    ## Returns:
+        * NDArray:  Row of each entry.
+        * NDArray:  Column of each entry (sorted within each row, without duplicates).
+        * NDArray:  Value of each entry.
+        * int:      Number of rows.
+        * bool:     True if X is a vector.
+    """
+    # If X is an (indices, values) pair...
+    if isinstance(X, tuple):
+
+        # Sum values of duplicate indices (sorting them in the process).
+        cols, inverse = unique(asarray(X[0], dtype = int64), return_inverse = True)
+        vals:   NDArray =   bincount(inverse, weights = asarray(X[1], dtype = float64))
+
+        # Provide entries of single row.
+        return zeros(len(cols), dtype = int64), cols, vals, 1, True
+
+    # If X is a dense array...
+    if not hasattr(X, "tocsr"):
+
+        # View vectors as single-row matrices.
+        dense:  NDArray =   asarray(X, dtype = float64)
+        vector: bool =      dense.ndim == 1
+        dense:  NDArray =   dense.reshape((1, -1)) if vector else dense
+
+        # Locate non-zero entries (in row-major order).
+        rows, cols =    dense.nonzero()
+
+        # Provide entries.
+        return rows, cols, dense[rows, cols], dense.shape[0], vector
+
+    # Otherwise, view sparse vectors as single-row matrices.
+    vector: bool =  X.ndim == 1
+    X:      Any =   X.reshape((1, -1)) if vector else X
+
+    # Convert to canonical CSR format (sorted indices, no duplicates) without mutating input.
+    csr:    Any =   X.tocsr()
+    csr:    Any =   csr if csr.has_canonical_format else csr.copy()
+    csr.sum_duplicates()
+
+    # Provide entries.
+    return (
+        repeat(arange(csr.shape[0]), csr.indptr[1:] - csr.indptr[:-1]),
+        csr.indices.astype(int64),
+        csr.data.astype(float64),
+        csr.shape[0],
+        vector
+    )
@@ -0,0 +1,271 @@
+"""# gel.statistics.streaming
+
+Incremental divergence estimation over unbounded streams.
+"""
+
+__all__ =   [
+                "StreamingDivergence",
+            ]
+
+from typing                     import Optional, Sequence, Union
+
+from numpy                      import add, asarray, bincount, int64, isfinite, rint, zeros
+from numpy.typing               import NDArray
+
+from gel.statistics.divergence  import divergences
+from gel.statistics.exceptions  import NegativeProbabilityError, NonFiniteProbabilityError
+
+class StreamingDivergence:
+    """# Streaming Divergence Estimator.
+
+    Maintains running category counts of two streams, P & Q, in fixed-size integer arrays. Each
+    update costs O(chunk + K) & each estimate costs O(K), independent of how much data has been
+    observed. Estimators built over shards of a stream may be merged, map-reduce style.
+
+    ## Example:
+    >>> estimator = StreamingDivergence(categories = 3, smoothing = 1)
+    >>> estimator.update(P = [0, 1, 1, 2], Q = [0, 0, 1])
+    >>> estimator.update(P = [5, 0, 2], Q = [1, 1, 0], counts = True)
+    >>> estimator.kl()
+    >>> 0.1162762092
+    """
+
+    def __init__(self,
+        categories: int,
+        smoothing:  float = 0.0
+    ):
+        """# Instantiate Streaming Divergence Estimator.
+
+        ## Args:
+            * categories    (int):      Number of categories (K) observed by streams.
+            * smoothing     (float):    Pseudo-count added to every category when estimating, which
+                                        keeps divergences finite when Q has not yet observed a
+                                        category P has. Defaults to 0.
+        """
+        # Define properties.
+        self._categories_:  int =       categories
+        self._smoothing_:   float =     smoothing
+
+        # Initialize running counts.
+        self._p_counts_:    NDArray =   zeros(categories, dtype = int64)
+        self._q_counts_:    NDArray =   zeros(categories, dtype = int64)
+
+    # PROPERTIES ===================================================================================
+
+    @property
+    def categories(self) -> int:
+        """# Number of Categories"""
+        return self._categories_
+
+    @property
+    def P_counts(self) -> NDArray:
+        """# Running Counts of P (Read-Only View)"""
+        return self._read_only_(self._p_counts_)
+
+    @property
+    def Q_counts(self) -> NDArray:
+        """# Running Counts of Q (Read-Only View)"""
+        return self._read_only_(self._q_counts_)
+
+    @property
+    def smoothing(self) -> float:
+        """# Pseudo-Count Added to Every Category"""
+        return self._smoothing_
+
+    # METHODS ======================================================================================
+
+    def divergence(self,
+        measure:    str =   "kl",
+        **kwargs
+    ) -> float:
+        """# Current Divergence.
+
+        ## Args:
+            * measure   (str):  Divergence measure (see `divergences`). Defaults to "kl".
+            * kwargs:           Additional options forwarded to `divergences`.
+
+        ## Returns:
+            * float:    Divergence between the (smoothed) distributions observed so far.
+        """
+        return divergences(
+            P =         self._p_counts_ + self._smoothing_,
+            Q =         self._q_counts_ + self._smoothing_,
+            measures =  (measure,),
+            normalize = True,
+            **kwargs
+        )[measure]
+
+    def js(self) -> float:
+        """# Current Jensen-Shannon (JS) Divergence.
+
+        ## Returns:
+            * float:    D_JS(P || Q) of distributions observed so far.
+        """
+        return self.divergence(measure = "js")
+
+    def kl(self) -> float:
+        """# Current Kullback-Leibler (KL) Divergence.
+
+        ## Returns:
+            * float:    D_KL(P || Q) of distributions observed so far.
+        """
+        return self.divergence(measure = "kl")
+
+    def merge(self,
+        other:  "StreamingDivergence"
+    ) -> "StreamingDivergence":
+        """# Merge Estimator.
+
+        Accumulate another estimator's counts into this one (in place).
+
+        ## Args:
+            * other (StreamingDivergence):  Estimator built over another shard of the streams.
+
+        ## Raises:
+            * ValueError:   If estimators do not observe the same number of categories.
+
+        ## Returns:
+            * StreamingDivergence:  This estimator.
+        """
+        # If category counts are incompatible, report error.
+        if other._categories_ != self._categories_:
+            raise ValueError(
+                f"Cannot merge estimators over {self._categories_} & {other._categories_} "
+                "categories"
+            )
+
+        # Accumulate counts.
+        add(self._p_counts_, other._p_counts_, out = self._p_counts_)
+        add(self._q_counts_, other._q_counts_, out = self._q_counts_)
+
+        # Expose estimator for chaining.
+        return self
+
+    def reset(self) -> None:
+        """# Reset Running Counts."""
+        self._p_counts_[:] = 0
+        self._q_counts_[:] = 0
+
+    def update(self,
+        P:      Optional[Union[NDArray, Sequence[int]]] =   None,
+        Q:      Optional[Union[NDArray, Sequence[int]]] =   None,
+        counts: bool =                                      False
+    ) -> None:
+        """# Update Running Counts.
+
+        ## Args:
+            * P         (NDArray | None):   Chunk of P observations. Defaults to None.
+            * Q         (NDArray | None):   Chunk of Q observations. Defaults to None.
+            * counts    (bool):             If True, chunks are (K,) arrays of category counts,
+                                            otherwise they are arrays of category indices. Defaults
+                                            to False.
+
+        ## Raises:
+            * NegativeProbabilityError:     If chunk of counts contains negative counts.
+            * NonFiniteProbabilityError:    If chunk contains NaN or infinite values.
+            * ValueError:                   If chunk contains non-integral values, or does not fit
+                                            within the estimator's categories.
+        """
+        # Count both chunks first (so that an invalid chunk leaves running counts untouched).
+        p_counts:   Optional[NDArray] = None if P is None else self._counts_(P, counts, "P")
+        q_counts:   Optional[NDArray] = None if Q is None else self._counts_(Q, counts, "Q")
+
+        # Accumulate chunks into their respective running counts.
+        if p_counts is not None: add(self._p_counts_, p_counts, out = self._p_counts_)
+        if q_counts is not None: add(self._q_counts_, q_counts, out = self._q_counts_)
+
+    # HELPERS ======================================================================================
+
+    def _counts_(self,
+        chunk:      Union[NDArray, Sequence[int]],
+        counts:     bool,
+        operand:    str
+    ) -> NDArray:
+        """# Chunk Category Counts.
+
+        ## Args:
+            * chunk     (NDArray):  Chunk of observations.
+            * counts    (bool):     Chunk is already an array of category counts.
+            * operand   (str):      Name of stream, used in error reports.
+
+        ## Raises:
+            * NegativeProbabilityError:     If chunk of counts contains negative counts.
+            * NonFiniteProbabilityError:    If chunk contains NaN or infinite values.
+            * ValueError:                   If chunk contains non-integral values, or does not fit
+                                            within the estimator's categories.
+
+        ## Returns:
+            * NDArray:  (K,) array of category counts.
+        """
+        # Verify values before casting (which would silently truncate them).
+        chunk:  NDArray =   asarray(chunk)
+        floats: bool =      chunk.dtype.kind == "f"
+
+        # Only finite, integral, numeric observations (& non-negative counts) can be counted.
+        if not floats and chunk.dtype.kind not in "biu":
+            raise ValueError(f"Stream {operand} contains non-numeric observations")
+        if floats and not isfinite(chunk).all():
+            raise NonFiniteProbabilityError(operand)
+        if floats and (chunk != rint(chunk)).any():
+            raise ValueError(f"Stream {operand} contains non-integral observations")
+        if counts and (chunk < 0).any():
+            raise NegativeProbabilityError(operand)
+
+        # Count category indices if necessary.
+        chunk:  NDArray =   chunk.astype(int64, copy = False)
+        if not counts:  chunk = bincount(chunk.ravel(), minlength = self._categories_)
+
+        # If chunk addresses categories outside of estimator's range, report error.
+        if chunk.shape != (self._categories_,):
+            raise ValueError(
+                f"Expected observations of {self._categories_} categories, got {chunk.shape[0]}"
+            )
+
+        # Provide counts.
+        return chunk
+
+    @staticmethod
+    def _read_only_(
+        array:  NDArray
+    ) -> NDArray:
+        """# Read-Only View.
+
+        ## Args:
+            * array (NDArray):  Array being exposed.
+
+        ## Returns:
+            * NDArray:  Non-writeable view of array.
+        """
+        # Create view.
+        view:   NDArray =   array.view()
+
+        # Lock view.
+        view.flags.writeable = False
+
+        # Provide view.
+        return view
+
+    # DUNDERS ======================================================================================
+
+    def __add__(self,
+        other:  "StreamingDivergence"
+    ) -> "StreamingDivergence":
+        """# Combine Estimators.
+
+        ## Args:
+            * other (StreamingDivergence):  Estimator built over another shard of the streams.
+
+        ## Returns:
+            * StreamingDivergence:  New estimator holding the counts of both.
+        """
+        return StreamingDivergence(
+            categories =    self._categories_,
+            smoothing =     self._smoothing_
+        ).merge(self).merge(other)
+
+    def __repr__(self) -> str:
+        """# Estimator Object Representation"""
+        return (
+            f"""<StreamingDivergence(categories = {self._categories_}, """
+            f"""P = {self._p_counts_.sum()}, Q = {self._q_counts_.sum()})>"""
+        )
@@ -0,0 +1,143 @@
+"""# gel.statistics.validation
+
+Validation (& optional normalization) of distribution operands.
+
+Each check is a single vectorized reduction over an operand, and the reductions which detect
+invalid inputs (row sums, or row maxima in log space) are the same ones normalization requires, so
+validating & normalizing together costs no more passes than normalizing alone plus one minimum.
+"""
+
+__all__ =   [
+                "validate_distributions",
+            ]
+
+from typing                     import Tuple
+
+from numpy                      import broadcast_shapes, exp, float64, inf, isfinite, log
+from numpy.typing               import DTypeLike, NDArray
+
+from gel.statistics.exceptions  import (
+                                    NegativeProbabilityError, NonFiniteProbabilityError,
+                                    ShapeMismatchError, ZeroMassError
+                                )
+
+
+def validate_distributions(
+    p:                  NDArray,
+    q:                  NDArray,
+    axis:               int =       -1,
+    normalize:          bool =      False,
+    log_space:          bool =      False,
+    accumulate_dtype:   DTypeLike = float64
+) -> Tuple[NDArray, NDArray]:
+    """# Validate Distributions.
+
+    ## Args:
+        * p                 (NDArray):      True probability distribution(s).
+        * q                 (NDArray):      Approximate probability distribution(s).
+        * axis              (int):          Axis along which distributions are laid out. Defaults
+                                            to -1.
+        * normalize         (bool):         Scale distributions to sum to one along `axis`.
+                                            Defaults to False.
+        * log_space         (bool):         Distributions are log-probabilities. Defaults to False.
+        * accumulate_dtype  (DTypeLike):    Precision of sums. Defaults to float64.
+
+    ## Raises:
+        * ShapeMismatchError:           If shapes of `p` & `q` cannot be broadcast together, or
+                                        differ along `axis`.
+        * NegativeProbabilityError:     If either distribution contains negative values.
+        * NonFiniteProbabilityError:    If either distribution contains NaN or infinite values.
+        * ZeroMassError:                If either distribution sums to zero.
+
+    ## Returns:
+        * NDArray:  Validated (& normalized, if requested) `p`.
+        * NDArray:  Validated (& normalized, if requested) `q`.
+    """
+    # Verify that operands broadcast.
+    try:                shape = broadcast_shapes(p.shape, q.shape)
+    except ValueError:  raise ShapeMismatchError(p.shape, q.shape) from None
+
+    # Verify that neither operand is broadcast along the distribution axis.
+    if any(((1,) * (len(shape) - X.ndim) + X.shape)[axis] != shape[axis] for X in (p, q)):
+        raise ShapeMismatchError(p.shape, q.shape)
+
+    # Provide validated operands.
+    return  (
+                _validate_(p, "P", axis, normalize, log_space, accumulate_dtype),
+                _validate_(q, "Q", axis, normalize, log_space, accumulate_dtype)
+            )
+
+
+# HELPERS ==========================================================================================
+
+def _validate_(
+    x:                  NDArray,
+    operand:            str,
+    axis:               int,
+    normalize:          bool,
+    log_space:          bool,
+    accumulate_dtype:   DTypeLike
+) -> NDArray:
+    """# Validate Distribution.
+
+    ## Args:
+        * x                 (NDArray):      Distribution(s) (or log-distribution(s)).
+        * operand           (str):          Name of distribution, used in error reports.
+        * axis              (int):          Axis along which distributions are laid out.
+        * normalize         (bool):         Scale distribution(s) to sum to one along `axis`.
+        * log_space         (bool):         `x` holds log-probabilities.
+        * accumulate_dtype  (DTypeLike):    Precision of sums.
+
+    ## Raises:
+        * NegativeProbabilityError:     If distribution contains negative values.
+        * NonFiniteProbabilityError:    If distribution contains NaN or infinite values.
+        * ZeroMassError:                If distribution sums to zero.
+
+    ## Returns:
+        * NDArray:  Validated (& normalized, if requested) distribution(s).
+    """
+    # In log space, row maxima are NaN if any value is, & -inf where all mass is zero.
+    if log_space:
+
+        # Compute row maxima (the log-sum-exp shift).
+        shift:  NDArray =   x.max(axis = axis, keepdims = True)
+
+        # Verify values.
+        if not (shift < inf).all():     raise NonFiniteProbabilityError(operand)
+        if (shift == -inf).any():       raise ZeroMassError(operand)
+
+        # Provide (normalized) log-distribution.
+        return x - (shift + log(
+            exp(x - shift).sum(axis = axis, keepdims = True, dtype = accumulate_dtype)
+        )).astype(x.dtype) if normalize else x
+
+    # Otherwise, row sums are non-finite if any value is NaN or infinite.
+    total:  NDArray =   x.sum(axis = axis, keepdims = True, dtype = accumulate_dtype)
+
+    # Verify values.
+    _verify_(x.min(initial = 0), total, operand)
+
+    # Provide (normalized) distribution.
+    return x / total.astype(x.dtype) if normalize else x
+
+
+def _verify_(
+    low:        float,
+    total:      NDArray,
+    operand:    str
+) -> None:
+    """# Verify Reductions.
+
+    ## Args:
+        * low       (float):    Minimum value of distribution(s).
+        * total     (NDArray):  Sum of each distribution.
+        * operand   (str):      Name of distribution, used in error reports.
+
+    ## Raises:
+        * NegativeProbabilityError:     If minimum value is negative.
+        * NonFiniteProbabilityError:    If any sum is NaN or infinite.
+        * ZeroMassError:                If any sum is zero.
+    """
+    if low < 0:                     raise NegativeProbabilityError(operand)
+    if not isfinite(total).all():   raise NonFiniteProbabilityError(operand)
+    if not total.all():             raise ZeroMassError(operand)
@@ -51,12 +51,22 @@ setup(
     license_files =                 ("LICENSE"),
     url =                           "https://github.com/theokoles7/gel",
     packages =                      find_packages(),
+    package_data =                  {
+                                        "gel":              [
+                                                                "*/manifest.json",
+                                                            ],
+                                    },
     python_requires =               ">=3.10",
     install_requires =              [
                                         "numpy",
                                         "pytest",
                                         "scipy",
                                     ],
+    extras_require =                {
+                                        "cache":            [
+                                                                "xxhash",
+                                                            ],
+                                    },
     entry_points =                  {
                                         "console_scripts":  [
                                                                 "gel=gel.__main__:gel_entry_point"